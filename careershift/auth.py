@@ -1,4 +1,5 @@
 import os
+import sys
 from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
 
@@ -10,10 +11,52 @@ SESSION_FILE = "./data/careershift_session.json"
 
 SYMPLICITY_URL = "https://northeastern-csm.symplicity.com/students/"
 
+# Login needs a visible browser for MFA and the manual CareerShift click;
+# CAREERSHIFT_HEADLESS=1 is only useful once those steps are scripted.
+HEADLESS = os.getenv("CAREERSHIFT_HEADLESS") == "1"
+# Per-action delay in ms — 0 unless debugging (was a fixed 500ms per action)
+SLOW_MO  = int(os.getenv("SLOW_MO", "0"))
 
-def login():
+EMAIL_SELECTOR    = "input[type='email'], input[name*='email'], input[name*='user'], input[id*='email']"
+PASSWORD_SELECTOR = "input[type='password']"
+
+CAREERSHIFT_DASHBOARD = "https://www.careershift.com/App/Dashboard/Overview"
+
+
+def _session_valid(session_file=SESSION_FILE):
+    """
+    True if session_file exists and CareerShift still accepts it — the
+    dashboard loads instead of redirecting to a login/signin page.
+    """
+    if not os.path.exists(session_file):
+        return False
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            context = browser.new_context(storage_state=session_file)
+            page = context.new_page()
+            page.goto(CAREERSHIFT_DASHBOARD, wait_until="domcontentloaded", timeout=30000)
+            url = page.url.lower()
+            return "login" not in url and "signin" not in url
+        except Exception as e:
+            print(f"[WARNING] Could not check saved session: {e}")
+            return False
+        finally:
+            browser.close()
+
+
+def login(force=False):
+    """Reuse the saved session if CareerShift still accepts it; otherwise run bootstrap()."""
+    if not force and _session_valid():
+        print(f"[OK] Saved session '{SESSION_FILE}' is still valid (pass --force to log in again)")
+        return
+    bootstrap()
+
+
+def bootstrap():
+    """Interactive Symplicity → CareerShift login; saves storage state to SESSION_FILE."""
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, slow_mo=500)
+        browser = p.chromium.launch(headless=HEADLESS, slow_mo=SLOW_MO)
         try:
             context = browser.new_context()
             page = context.new_page()
@@ -21,24 +64,22 @@ def login():
             # --- Step 1: Open Symplicity portal ---
             print("Opening Northeastern Symplicity portal...")
             page.goto(SYMPLICITY_URL)
-            page.wait_for_load_state("networkidle")
+            page.wait_for_load_state("domcontentloaded")
             print(f"Current URL: {page.url}")
 
             # --- Step 2: Auto-fill credentials ---
             try:
                 print("Attempting to fill credentials...")
-                email_input = page.locator(
-                    "input[type='email'], input[name*='email'], input[name*='user'], input[id*='email']"
-                ).first
+                email_input = page.locator(EMAIL_SELECTOR).first
                 email_input.wait_for(timeout=5000)
                 email_input.fill(EMAIL)
 
-                password_input = page.locator("input[type='password']").first
+                password_input = page.locator(PASSWORD_SELECTOR).first
                 password_input.wait_for(timeout=3000)
                 password_input.fill(PASSWORD)
 
                 page.keyboard.press("Enter")
-                page.wait_for_load_state("networkidle")
+                page.wait_for_load_state("domcontentloaded")
                 print("[OK] Credentials filled successfully")
             except:
                 print("[WARNING] Could not auto-fill credentials. Please login manually in the browser.")
@@ -85,7 +126,7 @@ def login():
             print("Waiting for CareerShift to finish loading...")
             try:
                 careershift_page.wait_for_url("https://www.careershift.com/**", timeout=20000)
-                careershift_page.wait_for_load_state("networkidle", timeout=15000)
+                careershift_page.wait_for_load_state("domcontentloaded", timeout=15000)
             except:
                 print(f"[WARNING] Still on: {careershift_page.url}")
                 print("If CareerShift looks loaded in the browser, press Enter to save anyway.")
@@ -111,4 +152,4 @@ def login():
 
 
 if __name__ == "__main__":
-    login()
\ No newline at end of file
+    login(force="--force" in sys.argv[1:])
\ No newline at end of file
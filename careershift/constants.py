@@ -16,15 +16,22 @@ CAREERSHIFT_QUOTA_URL  = "https://www.careershift.com/App/Settings/ResetPassword
 
 MIN_RECRUITERS_PER_COMPANY = 1
 
-HR_SEARCH_TERMS = [
+# Users scraped side by side, each in its own browser/session
+FIND_MAX_WORKERS = int(os.getenv("FIND_MAX_WORKERS", "2"))
+# Browsers per user for Step 1 verification and Step 2 company scraping, all
+# on the user's session. Work is split between them; each extra one is a full
+# Chromium process.
+FIND_SESSIONS_PER_USER = int(os.getenv("FIND_SESSIONS_PER_USER", "1"))
+
+HR_SEARCH_TERMS = (
     "Recruiter",
     "Talent Acquisition",
     "Human Resources",
     "People Operations",
     "HR",
-]
+)
 
-HR_KEYWORDS_STRONG = [
+HR_KEYWORDS_STRONG = (
     "recruiter", "recruiting", "recruitment",
     "talent acquisition", "talent partner",
     "human resources", "hr manager", "hr director",
@@ -33,14 +40,14 @@ HR_KEYWORDS_STRONG = [
     "staffing", "head of people",
     "vp of people", "vp hr", "director of hr",
     "hr specialist", "hr coordinator",
-]
+)
 
-HR_KEYWORDS_LOOSE = [
+HR_KEYWORDS_LOOSE = (
     "people", "hiring", "workforce", "culture",
     "talent", "onboarding", " hr", "human capital",
-]
+)
 
-EXCLUDE_KEYWORDS = [
+EXCLUDE_KEYWORDS = (
     "chief executive", "ceo", "chief technology", "cto",
     "chief operating", "coo", "chief financial", "cfo",
     "chief marketing", "cmo", "chief information", "cio",
@@ -51,7 +58,7 @@ EXCLUDE_KEYWORDS = [
     "executive vice president", "evp",
     "senior vice president", "svp",
     "vice president", " vp ",
-]
+)
 
 # Tiered verification thresholds (days)
 TIER1_DAYS = 30
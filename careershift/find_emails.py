@@ -2,7 +2,7 @@
 careershift/find_emails.py — Orchestrates CareerShift recruiter scraping.
 
 Multi-user two-phase design:
-  Phase 1 (per user, in id ASC order):
+  Phase 1 (per user, FIND_MAX_WORKERS users in parallel):
     1. Verify existing recruiters found by this user's account
     2. Scrape new companies for this user's applications
   Phase 2 (per user, using leftover quota):
@@ -12,30 +12,43 @@ Multi-user two-phase design:
 
 import os
 import random
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
 
 from logger import get_logger
 from db.db import (
+    get_conn,
     init_db,
     get_all_active_users,
     get_all_active_applications,
     get_unique_companies_needing_scraping,
     get_companies_needing_more_recruiters,
+    company_needs_scraping,
+    get_company_recruiter_shortage,
     get_remaining_quota,
     get_today_quota,
-    recruiter_email_exists,
-    add_recruiter,
-    link_recruiter_to_application,
+    add_recruiters,
+    link_recruiters_to_applications,
     mark_application_exhausted,
     mark_applications_exhausted,
     get_pending_prospective,
+    get_prospective_company,
     mark_prospective_scraped,
     mark_prospective_exhausted,
     get_domain_for_prospective,
 )
-from careershift.constants import session_file_for_user, MIN_RECRUITERS_PER_COMPANY
-from careershift.utils import human_delay
+from careershift.constants import (
+    session_file_for_user,
+    MIN_RECRUITERS_PER_COMPANY,
+    FIND_MAX_WORKERS,
+    FIND_SESSIONS_PER_USER,
+)
+from careershift.utils import block_static_assets, human_delay, wait_until_idle
 from careershift.quota_manager import fetch_real_quota, calculate_distribution
 from careershift.verification import run_tiered_verification
 from careershift.scraper import scrape_company
@@ -50,14 +63,68 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:123.0) Gecko/20100101 Firefox/123.0",
 ]
 
+# Companies currently being scraped, company -> user_id. Users run in
+# parallel, so two sessions must not spend credits on the same company.
+_company_claims = {}
+_claims_lock    = threading.Lock()
+
+
+def _claim_company(company, user_id):
+    """Reserve company for user_id. False if another user's session holds it."""
+    with _claims_lock:
+        owner = _company_claims.setdefault(company, user_id)
+        return owner == user_id
+
+
+def _release_company(company=None, user_id=None):
+    """Release one company, or every company held by user_id."""
+    with _claims_lock:
+        if company is not None:
+            _company_claims.pop(company, None)
+        else:
+            for name in [c for c, u in _company_claims.items() if u == user_id]:
+                del _company_claims[name]
+
+
+def _claim_if_needed(company, user_id, recheck):
+    """
+    Claim company, then re-run recheck() against the DB. Work lists are
+    fetched once per user, so another user's session may have covered the
+    company since. Returns recheck()'s result with the claim held, or None.
+    """
+    if not _claim_company(company, user_id):
+        print(f"   [SKIP] {company} — being scraped by another user's session")
+        return None
+    current = recheck()
+    if not current:
+        _release_company(company)
+        logger.info("user_id=%d: %r already covered by another session — skipping",
+                    user_id, company)
+        print(f"   [SKIP] {company} — already covered by another user's session")
+        return None
+    return current
+
+
+def _prospective_pending(company):
+    prospect = get_prospective_company(company)
+    return prospect is not None and prospect["status"] == "pending"
+
+
+def _group_by_company(applications):
+    """Index applications by company name in one pass: {company: [apps]}."""
+    apps_by_company = defaultdict(list)
+    for app in applications:
+        apps_by_company[app["company"]].append(app)
+    return apps_by_company
+
 
-def _get_apps_and_domain(applications, company):
+def _get_apps_and_domain(apps_by_company, company):
     """
     Return (matching_apps, expected_domain) for a company.
     matching_apps: all active applications for this company.
     expected_domain: first non-empty expected_domain found, or "".
     """
-    matching_apps = [a for a in applications if a["company"] == company]
+    matching_apps = apps_by_company.get(company, [])
     expected_domain = next(
         (a.get("expected_domain") for a in matching_apps
          if a.get("expected_domain")),
@@ -66,33 +133,33 @@ def _get_apps_and_domain(applications, company):
     return matching_apps, expected_domain
 
 
-def _save_contacts(contacts, company, applications, user_id: int = 1):
-    """Save scraped contacts to DB and link to matching applications."""
-    matching_apps = [a for a in applications if a["company"] == company]
+def _save_contacts(contacts, company, matching_apps, user_id: int = 1):
+    """Save scraped contacts to DB and link them to the company's applications."""
+    saved         = add_recruiters(company, contacts, found_by_user_id=user_id)
+    recruiter_ids = []
     for contact in contacts:
-        existing_id = recruiter_email_exists(contact["email"])
-        if existing_id:
-            recruiter_id = existing_id
-            logger.debug("Recruiter already in DB: id=%s company=%r", recruiter_id, company)
-            print(f"   [SKIP] Already in DB: {contact['email']} (id={recruiter_id})")
-        else:
-            recruiter_id = add_recruiter(
-                company=company,
-                name=contact["name"],
-                position=contact["position"],
-                email=contact["email"],
-                confidence=contact["confidence"],
-                found_by_user_id=user_id,
-            )
+        recruiter_id, created = saved[contact["email"]]
+        if created:
             logger.info("Saved recruiter: id=%s company=%r found_by_user_id=%d",
                         recruiter_id, company, user_id)
             print(f"   [DB] Saved: {contact['name']} | {contact['email']}")
+        else:
+            logger.debug("Recruiter already in DB: id=%s company=%r", recruiter_id, company)
+            print(f"   [SKIP] Already in DB: {contact['email']} (id={recruiter_id})")
+        if recruiter_id not in recruiter_ids:
+            recruiter_ids.append(recruiter_id)
 
-        for app in matching_apps:
-            link_recruiter_to_application(app["id"], recruiter_id)
-            logger.debug("Linked recruiter id=%s to application id=%s (%s)",
-                         recruiter_id, app["id"], app.get("job_title") or app.get("job_url"))
-            print(f"   [INFO] Linked to application id={app['id']} ({app['job_title'] or app['job_url']})")
+    # Link every (application, recruiter) pair for this company in one insert
+    with get_conn() as conn:
+        linked = link_recruiters_to_applications(
+            [app["id"] for app in matching_apps], recruiter_ids, conn=conn,
+        )
+    apps_by_id = {app["id"]: app for app in matching_apps}
+    for app_id, recruiter_id in linked:
+        app = apps_by_id[app_id]
+        logger.debug("Linked recruiter id=%s to application id=%s (%s)",
+                     recruiter_id, app_id, app.get("job_title") or app.get("job_url"))
+        print(f"   [INFO] Linked to application id={app_id} ({app['job_title'] or app['job_url']})")
 
 
 def _save_prospective_contacts(contacts, company, user_id: int = 1):
@@ -100,28 +167,18 @@ def _save_prospective_contacts(contacts, company, user_id: int = 1):
     Save prospective recruiter contacts to DB at company level only.
     Returns True if at least one contact was saved or already exists.
     """
-    saved = 0
+    saved = add_recruiters(company, contacts, found_by_user_id=user_id)
     for contact in contacts:
-        existing_id = recruiter_email_exists(contact["email"])
-        if existing_id:
+        _, created = saved[contact["email"]]
+        if created:
+            logger.info("Saved prospective recruiter: %s | %s (company=%r found_by=%d)",
+                        contact["name"], contact["email"], company, user_id)
+            print(f"   [DB] Prospective saved: {contact['name']} | {contact['email']}")
+        else:
             logger.debug("Prospective recruiter already in DB: company=%r", company)
             print(f"   [SKIP] Already in DB: {contact['email']}")
-        else:
-            recruiter_id = add_recruiter(
-                company=company,
-                name=contact["name"],
-                position=contact["position"],
-                email=contact["email"],
-                confidence=contact["confidence"],
-                found_by_user_id=user_id,
-            )
-            if recruiter_id:
-                logger.info("Saved prospective recruiter: %s | %s (company=%r found_by=%d)",
-                            contact["name"], contact["email"], company, user_id)
-                print(f"   [DB] Prospective saved: {contact['name']} | {contact['email']}")
-                saved += 1
 
-    if not saved and not any(recruiter_email_exists(c["email"]) for c in contacts):
+    if not saved:
         logger.warning("_save_prospective_contacts: no contacts saved for %r", company)
         return False
 
@@ -215,12 +272,17 @@ def _open_user_session(p, user_id: int, user_name: str):
         user_agent=random.choice(USER_AGENTS),
         viewport={"width": random.randint(1280, 1920), "height": random.randint(768, 1080)},
     )
+    block_static_assets(context)
     page = context.new_page()
 
     print(f"[INFO] Verifying CareerShift session for user_id={user_id} ({user_name})...")
-    page.goto("https://www.careershift.com/App/Dashboard/Overview",
-              wait_until="domcontentloaded", timeout=30000)
-    human_delay(2.0, 4.0)
+    try:
+        page.goto("https://www.careershift.com/App/Dashboard/Overview",
+                  wait_until="domcontentloaded", timeout=30000)
+    except Exception:
+        browser.close()
+        raise
+    wait_until_idle(page)
 
     if "login" in page.url.lower() or "signin" in page.url.lower():
         logger.error("Session expired for user_id=%d (%s) — skipping user", user_id, user_name)
@@ -232,176 +294,243 @@ def _open_user_session(p, user_id: int, user_name: str):
     return browser, page
 
 
-def run():
-    logger.info("════════════════════════════════════════")
-    logger.info("--find-only starting")
+@contextmanager
+def _user_page(user):
+    """
+    Separate browser on user's session, for a worker thread (Playwright's
+    sync API is bound to the thread that started it). Yields its page, or
+    None if the session could not be opened.
+    """
+    with sync_playwright() as p:
+        try:
+            browser, page = _open_user_session(p, user["id"], user["name"])
+        except Exception:
+            logger.error("Could not open session for user_id=%d", user["id"], exc_info=True)
+            browser, page = None, None
+        try:
+            yield page
+        finally:
+            if browser is not None:
+                browser.close()
 
-    init_db()
 
-    users = get_all_active_users()
-    if not users:
-        logger.error("No active users found in DB")
-        print("[ERROR] No active users found. Run: python scripts/add_user.py --name ... --email ...")
-        return
+def _scrape_step2_company(page, company, max_contacts, user_id, apps_by_company,
+                          pipeline_degraded):
+    """Step 2 for one company: scrape, then save or exhaust. Returns its stats entry."""
+    recheck = partial(company_needs_scraping, company, MIN_RECRUITERS_PER_COMPANY, user_id)
+    if not _claim_if_needed(company, user_id, recheck):
+        return {"name": company, "status": "skipped", "count": 0}
 
-    logger.info("Active users: %d", len(users))
+    try:
+        matching_apps, expected_domain = _get_apps_and_domain(apps_by_company, company)
+        contacts = scrape_company(page, company, max_contacts, expected_domain,
+                                  user_id=user_id)
+
+        if contacts is None:
+            logger.info("Step 2 user_id=%d: %r — weak signal, skipping", user_id, company)
+            print(f"   [INFO] Skipping {company} — weak signal, retry tomorrow")
+            stat = {"name": company, "status": "skipped", "count": 0}
+        elif not contacts:
+            if pipeline_degraded:
+                logger.warning(
+                    "Step 2 user_id=%d: %r — no recruiters but pipeline degraded "
+                    "— blocking exhaustion",
+                    user_id, company,
+                )
+                print(f"   [WARNING] {company} — no recruiters found but pipeline "
+                      f"degraded — NOT exhausting (human review needed)")
+                try:
+                    from db.pipeline_alerts import (
+                        create_alert, ALERT_EXHAUSTION_BLOCKED, CRITICAL,
+                    )
+                    create_alert(
+                        alert_type=ALERT_EXHAUSTION_BLOCKED,
+                        severity=CRITICAL,
+                        platform=company,
+                        user_id=user_id,
+                        message=(
+                            f"Exhaustion blocked for '{company}' "
+                            f"(user_id={user_id}): "
+                            f"no recruiters found but pipeline metrics "
+                            f"are below threshold — manual review required"
+                        ),
+                    )
+                except Exception as _ae:
+                    logger.error("Failed to create exhaustion-blocked alert: %s", _ae)
+                stat = {"name": company, "status": "blocked", "count": 0}
+            else:
+                logger.info("Step 2 user_id=%d: %r — no valid recruiters, exhausting",
+                            user_id, company)
+                print(f"   [INFO] Exhausting {company} — no valid recruiters found")
+                mark_applications_exhausted([app["id"] for app in matching_apps])
+                stat = {"name": company, "status": "exhausted", "count": 0}
+        else:
+            logger.info("Step 2 user_id=%d: %r — found %d contact(s)",
+                        user_id, company, len(contacts))
+            _save_contacts(contacts, company, matching_apps, user_id=user_id)
+            stat = {"name": company, "status": "found", "count": len(contacts)}
+    finally:
+        _release_company(company)
+    return stat
 
-    pipeline_degraded = _check_pipeline_degraded()
-    if pipeline_degraded:
-        print("[WARNING] Pipeline degraded over last N days — exhaustions blocked (human review required)")
 
-    all_scrape_stats      = []
-    all_prospective_stats = {"scraped": 0, "exhausted": 0}
+def _scrape_step2_batch(user, batch, total, apps_by_company, pipeline_degraded, page=None):
+    """
+    Run _scrape_step2_company over batch [(index, company, max_contacts)].
+    Without page, opens its own browser on the user's session (for use
+    from a worker thread). Returns [(index, stats entry)].
+    """
+    if page is None:
+        with _user_page(user) as page:
+            if page is None:
+                return []
+            return _scrape_step2_batch(user, batch, total, apps_by_company,
+                                       pipeline_degraded, page=page)
+
+    results = []
+    for i, company, max_contacts in batch:
+        print(f"\n{'='*55}")
+        print(f"[INFO] [{i+1}/{total}] {company} (max {max_contacts})")
+        logger.info("Step 2 user_id=%d [%d/%d]: scraping %r (max_contacts=%d)",
+                    user["id"], i + 1, total, company, max_contacts)
+        results.append((i, _scrape_step2_company(
+            page, company, max_contacts, user["id"], apps_by_company, pipeline_degraded,
+        )))
+        human_delay(3.0, 7.0)
+    return results
+
+
+def _run_user(user, pipeline_degraded):
+    """
+    Phase 1 + Phase 2 for one user in its own Playwright instance (the sync
+    API is bound to the thread that started it).
+    Returns (scrape_stats, prospective_stats) for the run summary.
+    """
+    scrape_stats      = []
+    prospective_stats = {"scraped": 0, "exhausted": 0}
 
-    with sync_playwright() as p:
-        for user in users:
-            user_id   = user["id"]
-            user_name = user["name"]
+    user_id   = user["id"]
+    user_name = user["name"]
 
-            logger.info("════ Phase 1 — user_id=%d (%s) ════", user_id, user_name)
-            print(f"\n{'='*55}")
-            print(f"[INFO] Phase 1 — user_id={user_id} ({user_name})")
+    logger.info("════ Phase 1 — user_id=%d (%s) ════", user_id, user_name)
+    print(f"\n{'='*55}")
+    print(f"[INFO] Phase 1 — user_id={user_id} ({user_name})")
 
+    with sync_playwright() as p:
+        browser = None
+        try:
             browser, page = _open_user_session(p, user_id, user_name)
             if page is None:
-                continue
-            try:
-                # Fetch real quota for this user
-                remaining = fetch_real_quota(page, user_id)
-                logger.info("user_id=%d quota: %d/50 remaining", user_id, remaining)
-                print(f"[INFO] user_id={user_id} quota remaining: {remaining}/50\n")
-
-                user_apps = get_all_active_applications(user_id=user_id)
-                logger.info("user_id=%d active applications: %d", user_id, len(user_apps))
-
-                # ─── STEP 1: Tiered verification for this user's recruiters ───
-                if user_apps:
-                    print("=" * 55)
-                    print(f"[INFO] STEP 1 (user_id={user_id}): Tiered recruiter verification")
-                    logger.info("Step 1 user_id=%d: verifying recruiters — %d applications",
-                                user_id, len(user_apps))
-                    run_tiered_verification(page, user_apps, found_by_user_id=user_id)
-                else:
-                    logger.info("Step 1 user_id=%d: skipped — no active applications", user_id)
-                    print(f"[INFO] STEP 1 (user_id={user_id}): Skipped — no active applications.")
-
-                # ─── STEP 2: Scrape companies for this user's applications ───
-                companies_to_scrape = (
-                    get_unique_companies_needing_scraping(MIN_RECRUITERS_PER_COMPANY, user_id=user_id)
-                    if user_apps else []
-                )
-                logger.info("Step 2 user_id=%d: %d companies need scraping",
-                            user_id, len(companies_to_scrape))
-
-                scrape_stats = []
-                if not companies_to_scrape:
-                    print(f"\n[OK] user_id={user_id}: All applications have enough recruiters.")
-                elif remaining == 0:
-                    logger.warning("Step 2 user_id=%d: %d companies need scraping but quota is 0",
-                                   user_id, len(companies_to_scrape))
-                    print(f"\n[WARNING] user_id={user_id}: {len(companies_to_scrape)} companies need "
-                          f"scraping but quota is 0. Run again tomorrow when quota resets.")
-                else:
+                return scrape_stats, prospective_stats
+
+            # Fetch real quota for this user
+            remaining = fetch_real_quota(page, user_id)
+            logger.info("user_id=%d quota: %d/50 remaining", user_id, remaining)
+            print(f"[INFO] user_id={user_id} quota remaining: {remaining}/50\n")
+
+            user_apps = get_all_active_applications(user_id=user_id)
+            logger.info("user_id=%d active applications: %d", user_id, len(user_apps))
+
+            # ─── STEP 1: Tiered verification for this user's recruiters ───
+            if user_apps:
+                print("=" * 55)
+                print(f"[INFO] STEP 1 (user_id={user_id}): Tiered recruiter verification")
+                logger.info("Step 1 user_id=%d: verifying recruiters — %d applications",
+                            user_id, len(user_apps))
+                run_tiered_verification(page, user_apps, found_by_user_id=user_id,
+                                        open_page=partial(_user_page, user),
+                                        sessions=FIND_SESSIONS_PER_USER)
+            else:
+                logger.info("Step 1 user_id=%d: skipped — no active applications", user_id)
+                print(f"[INFO] STEP 1 (user_id={user_id}): Skipped — no active applications.")
+
+            # ─── STEP 2: Scrape companies for this user's applications ───
+            companies_to_scrape = (
+                get_unique_companies_needing_scraping(MIN_RECRUITERS_PER_COMPANY, user_id=user_id)
+                if user_apps else []
+            )
+            logger.info("Step 2 user_id=%d: %d companies need scraping",
+                        user_id, len(companies_to_scrape))
+
+            if not companies_to_scrape:
+                print(f"\n[OK] user_id={user_id}: All applications have enough recruiters.")
+            elif remaining == 0:
+                logger.warning("Step 2 user_id=%d: %d companies need scraping but quota is 0",
+                               user_id, len(companies_to_scrape))
+                print(f"\n[WARNING] user_id={user_id}: {len(companies_to_scrape)} companies need "
+                      f"scraping but quota is 0. Run again tomorrow when quota resets.")
+            else:
+                print(f"\n{'='*55}")
+                print(f"[INFO] STEP 2 (user_id={user_id}): Scraping {len(companies_to_scrape)} company/companies")
+                print(f"[INFO] Quota: {remaining} credits / {len(companies_to_scrape)} companies")
+
+                counts = calculate_distribution(remaining, len(companies_to_scrape))
+                logger.info("Step 2 user_id=%d distribution=%s", user_id, counts)
+                print(f"[INFO] Distribution: {counts}\n")
+
+                apps_by_company = _group_by_company(user_apps)
+                work = []
+                for i, company in enumerate(companies_to_scrape):
+                    max_contacts = counts[i] if i < len(counts) else 0
+                    if max_contacts == 0:
+                        logger.debug("Skipping %r — no quota for user_id=%d", company, user_id)
+                        print(f"[SKIP] Skipping {company} — no quota remaining")
+                        continue
+                    work.append((i, company, max_contacts))
+
+                # Round-robin the companies over FIND_SESSIONS_PER_USER browsers on
+                # the same session; this thread's page takes the first share
+                sessions = max(1, min(FIND_SESSIONS_PER_USER, len(work)))
+                batches  = [work[k::sessions] for k in range(sessions)]
+                results  = []
+                with ThreadPoolExecutor(max_workers=sessions) as executor:
+                    extra = [
+                        executor.submit(_scrape_step2_batch, user, batch, len(companies_to_scrape),
+                                        apps_by_company, pipeline_degraded)
+                        for batch in batches[1:]
+                    ]
+                    results.extend(_scrape_step2_batch(user, batches[0], len(companies_to_scrape),
+                                                       apps_by_company, pipeline_degraded,
+                                                       page=page))
+                    for future in extra:
+                        results.extend(future.result())
+                scrape_stats.extend(stat for _, stat in sorted(results, key=lambda r: r[0]))
+
+            # ─── STEP 3 (Phase 2): Leftover quota — top-up + prospective ───
+            remaining_after = get_remaining_quota(user_id=user_id)
+            if remaining_after > 0:
+                # All active applications across users — needed for domain lookup + linking
+                all_apps_by_company = _group_by_company(get_all_active_applications())
+
+                under_stocked = get_companies_needing_more_recruiters(user_id=user_id)
+                # Exclude companies already scrapped for this user in Step 2
+                scraped_in_step2 = set(companies_to_scrape)
+                under_stocked = [c for c in under_stocked
+                                 if c["company"] not in scraped_in_step2]
+
+                if under_stocked:
+                    logger.info("Step 3 user_id=%d: %d under-stocked companies, %d credits",
+                                user_id, len(under_stocked), remaining_after)
                     print(f"\n{'='*55}")
-                    print(f"[INFO] STEP 2 (user_id={user_id}): Scraping {len(companies_to_scrape)} company/companies")
-                    print(f"[INFO] Quota: {remaining} credits / {len(companies_to_scrape)} companies")
-
-                    counts = calculate_distribution(remaining, len(companies_to_scrape))
-                    logger.info("Step 2 user_id=%d distribution=%s", user_id, counts)
-                    print(f"[INFO] Distribution: {counts}\n")
-
-                    for i, company in enumerate(companies_to_scrape):
-                        max_contacts = counts[i] if i < len(counts) else 0
-                        if max_contacts == 0:
-                            logger.debug("Skipping %r — no quota for user_id=%d", company, user_id)
-                            print(f"[SKIP] Skipping {company} — no quota remaining")
+                    print(f"[INFO] STEP 3 (user_id={user_id}): Leftover quota — top-up")
+                    print(f"[INFO] {remaining_after} credits remaining — "
+                          f"topping up {len(under_stocked)} company/companies")
+
+                    for company_row in under_stocked:
+                        current_remaining = get_remaining_quota(user_id=user_id)
+                        if current_remaining == 0:
+                            logger.info("Step 3 user_id=%d: quota exhausted — stopping top-up", user_id)
+                            break
+
+                        company = company_row["company"]
+                        # Fresh row: another session may have topped it up meanwhile
+                        company_row = _claim_if_needed(
+                            company, user_id, partial(get_company_recruiter_shortage, company, user_id),
+                        )
+                        if not company_row:
                             continue
 
-                        print(f"\n{'='*55}")
-                        print(f"[INFO] [{i+1}/{len(companies_to_scrape)}] {company} (max {max_contacts})")
-                        logger.info("Step 2 user_id=%d [%d/%d]: scraping %r (max_contacts=%d)",
-                                    user_id, i + 1, len(companies_to_scrape), company, max_contacts)
-
-                        matching_apps, expected_domain = _get_apps_and_domain(user_apps, company)
-                        contacts = scrape_company(page, company, max_contacts, expected_domain,
-                                                  user_id=user_id)
-
-                        if contacts is None:
-                            logger.info("Step 2 user_id=%d: %r — weak signal, skipping", user_id, company)
-                            print(f"   [INFO] Skipping {company} — weak signal, retry tomorrow")
-                            scrape_stats.append({"name": company, "status": "skipped", "count": 0})
-                        elif not contacts:
-                            if pipeline_degraded:
-                                logger.warning(
-                                    "Step 2 user_id=%d: %r — no recruiters but pipeline degraded "
-                                    "— blocking exhaustion",
-                                    user_id, company,
-                                )
-                                print(f"   [WARNING] {company} — no recruiters found but pipeline "
-                                      f"degraded — NOT exhausting (human review needed)")
-                                try:
-                                    from db.pipeline_alerts import (
-                                        create_alert, ALERT_EXHAUSTION_BLOCKED, CRITICAL,
-                                    )
-                                    create_alert(
-                                        alert_type=ALERT_EXHAUSTION_BLOCKED,
-                                        severity=CRITICAL,
-                                        platform=company,
-                                        user_id=user_id,
-                                        message=(
-                                            f"Exhaustion blocked for '{company}' "
-                                            f"(user_id={user_id}): "
-                                            f"no recruiters found but pipeline metrics "
-                                            f"are below threshold — manual review required"
-                                        ),
-                                    )
-                                except Exception as _ae:
-                                    logger.error("Failed to create exhaustion-blocked alert: %s", _ae)
-                                scrape_stats.append({"name": company, "status": "blocked", "count": 0})
-                            else:
-                                logger.info("Step 2 user_id=%d: %r — no valid recruiters, exhausting",
-                                            user_id, company)
-                                print(f"   [INFO] Exhausting {company} — no valid recruiters found")
-                                mark_applications_exhausted([app["id"] for app in matching_apps])
-                                scrape_stats.append({"name": company, "status": "exhausted", "count": 0})
-                        else:
-                            logger.info("Step 2 user_id=%d: %r — found %d contact(s)",
-                                        user_id, company, len(contacts))
-                            _save_contacts(contacts, company, user_apps, user_id=user_id)
-                            scrape_stats.append({
-                                "name": company, "status": "found", "count": len(contacts),
-                            })
-
-                        human_delay(3.0, 7.0)
-
-                all_scrape_stats.extend(scrape_stats)
-
-                # ─── STEP 3 (Phase 2): Leftover quota — top-up + prospective ───
-                remaining_after = get_remaining_quota(user_id=user_id)
-                if remaining_after > 0:
-                    # All active applications across users — needed for domain lookup + linking
-                    all_applications = get_all_active_applications()
-
-                    under_stocked = get_companies_needing_more_recruiters(user_id=user_id)
-                    # Exclude companies already scrapped for this user in Step 2
-                    under_stocked = [c for c in under_stocked
-                                     if c["company"] not in companies_to_scrape]
-
-                    if under_stocked:
-                        logger.info("Step 3 user_id=%d: %d under-stocked companies, %d credits",
-                                    user_id, len(under_stocked), remaining_after)
-                        print(f"\n{'='*55}")
-                        print(f"[INFO] STEP 3 (user_id={user_id}): Leftover quota — top-up")
-                        print(f"[INFO] {remaining_after} credits remaining — "
-                              f"topping up {len(under_stocked)} company/companies")
-
-                        for company_row in under_stocked:
-                            current_remaining = get_remaining_quota(user_id=user_id)
-                            if current_remaining == 0:
-                                logger.info("Step 3 user_id=%d: quota exhausted — stopping top-up", user_id)
-                                break
-
-                            company   = company_row["company"]
+                        try:
                             shortage  = company_row["shortage"]
                             max_extra = min(shortage, current_remaining)
 
@@ -409,7 +538,9 @@ def run():
                                         user_id, company, shortage, max_extra)
                             print(f"\n[INFO] {company} — needs {shortage} more recruiter(s), fetching {max_extra}")
 
-                            matching_apps, expected_domain = _get_apps_and_domain(all_applications, company)
+                            matching_apps, expected_domain = _get_apps_and_domain(
+                                all_apps_by_company, company,
+                            )
                             contacts = scrape_company(page, company, max_extra, expected_domain,
                                                       user_id=user_id)
 
@@ -419,36 +550,42 @@ def run():
                             elif contacts:
                                 logger.info("Step 3 user_id=%d: %r — found %d contact(s)",
                                             user_id, company, len(contacts))
-                                _save_contacts(contacts, company, all_applications, user_id=user_id)
+                                _save_contacts(contacts, company, matching_apps, user_id=user_id)
+                        finally:
+                            _release_company(company)
+                        human_delay(3.0, 7.0)
 
-                            human_delay(3.0, 7.0)
+                # Prospective companies
+                remaining_prospective = get_remaining_quota(user_id=user_id)
+                if remaining_prospective > 0:
+                    pending = get_pending_prospective()
+                    if pending:
+                        logger.info("Step 3 (Priority 2) user_id=%d: %d prospective companies, %d credits",
+                                    user_id, len(pending), remaining_prospective)
+                        print(f"\n{'='*55}")
+                        print(f"[INFO] STEP 3 (Priority 2, user_id={user_id}): Pre-scraping prospective companies")
+                        print(f"[INFO] {remaining_prospective} credits remaining — "
+                              f"{len(pending)} prospective companies pending")
+
+                        for prospect in pending:
+                            current_remaining = get_remaining_quota(user_id=user_id)
+                            if current_remaining == 0:
+                                logger.info("Step 3 (Priority 2) user_id=%d: quota exhausted — stopping",
+                                            user_id)
+                                break
 
-                    # Prospective companies
-                    remaining_prospective = get_remaining_quota(user_id=user_id)
-                    if remaining_prospective > 0:
-                        pending = get_pending_prospective()
-                        if pending:
-                            logger.info("Step 3 (Priority 2) user_id=%d: %d prospective companies, %d credits",
-                                        user_id, len(pending), remaining_prospective)
-                            print(f"\n{'='*55}")
-                            print(f"[INFO] STEP 3 (Priority 2, user_id={user_id}): Pre-scraping prospective companies")
-                            print(f"[INFO] {remaining_prospective} credits remaining — "
-                                  f"{len(pending)} prospective companies pending")
-
-                            for prospect in pending:
-                                current_remaining = get_remaining_quota(user_id=user_id)
-                                if current_remaining == 0:
-                                    logger.info("Step 3 (Priority 2) user_id=%d: quota exhausted — stopping",
-                                                user_id)
-                                    break
-
-                                company   = prospect["company"]
-                                max_extra = min(3, current_remaining)
-
-                                logger.info("Prospective scrape user_id=%d: %r (max_extra=%d)",
-                                            user_id, company, max_extra)
-                                print(f"\n[INFO] Prospective: {company} (max {max_extra})")
+                            company   = prospect["company"]
+                            max_extra = min(3, current_remaining)
 
+                            logger.info("Prospective scrape user_id=%d: %r (max_extra=%d)",
+                                        user_id, company, max_extra)
+                            print(f"\n[INFO] Prospective: {company} (max {max_extra})")
+
+                            if not _claim_if_needed(company, user_id,
+                                                    partial(_prospective_pending, company)):
+                                continue
+
+                            try:
                                 prospective_domain = get_domain_for_prospective(company)
                                 contacts = scrape_company(page, company, max_extra, prospective_domain,
                                                           user_id=user_id)
@@ -460,14 +597,14 @@ def run():
                                     logger.info("Prospective %r — no contacts found, exhausting", company)
                                     print(f"   [INFO] Exhausting prospective {company}")
                                     mark_prospective_exhausted(company)
-                                    all_prospective_stats["exhausted"] += 1
+                                    prospective_stats["exhausted"] += 1
                                 else:
                                     logger.info("Prospective %r — found %d contact(s), saving",
                                                 company, len(contacts))
                                     saved = _save_prospective_contacts(contacts, company, user_id=user_id)
                                     if saved:
                                         mark_prospective_scraped(company)
-                                        all_prospective_stats["scraped"] += 1
+                                        prospective_stats["scraped"] += 1
                                         logger.info("Prospective %r — marked scraped", company)
                                     else:
                                         logger.warning(
@@ -476,14 +613,51 @@ def run():
                                         )
                                         print(f"   [WARNING] Could not persist contacts for {company} "
                                               f"— not marking scraped")
+                            finally:
+                                _release_company(company)
+                            human_delay(3.0, 7.0)
 
-                                human_delay(3.0, 7.0)
-
-            except Exception:
-                logger.error("Error processing user_id=%d (%s)", user_id, user_name, exc_info=True)
-            finally:
+        except Exception:
+            logger.error("Error processing user_id=%d (%s)", user_id, user_name, exc_info=True)
+        finally:
+            _release_company(user_id=user_id)
+            if browser is not None:
                 browser.close()
 
+    return scrape_stats, prospective_stats
+
+
+def run():
+    logger.info("════════════════════════════════════════")
+    logger.info("--find-only starting")
+
+    init_db()
+
+    users = get_all_active_users()
+    if not users:
+        logger.error("No active users found in DB")
+        print("[ERROR] No active users found. Run: python scripts/add_user.py --name ... --email ...")
+        return
+
+    logger.info("Active users: %d", len(users))
+
+    pipeline_degraded = _check_pipeline_degraded()
+    if pipeline_degraded:
+        print("[WARNING] Pipeline degraded over last N days — exhaustions blocked (human review required)")
+
+    all_scrape_stats      = []
+    all_prospective_stats = {"scraped": 0, "exhausted": 0}
+
+    # Users have separate sessions and quotas, so run them side by side
+    _company_claims.clear()
+    with ThreadPoolExecutor(max_workers=FIND_MAX_WORKERS) as executor:
+        futures = [executor.submit(_run_user, user, pipeline_degraded) for user in users]
+        for future in futures:
+            scrape_stats, prospective_stats = future.result()
+            all_scrape_stats.extend(scrape_stats)
+            all_prospective_stats["scraped"]   += prospective_stats["scraped"]
+            all_prospective_stats["exhausted"] += prospective_stats["exhausted"]
+
     # ─── Summary ───
     total_quota_used = sum(
         get_today_quota(u["id"]).get("used", 0) for u in users
@@ -1,17 +1,89 @@
 # careershift/quota_manager.py — CareerShift quota fetching and distribution
 
 from datetime import datetime
+
+import httpx
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _USE_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    _USE_SELECTOLAX  = False
+
 from logger import get_logger
 from db.db import get_conn, get_remaining_quota, increment_quota_used
-from careershift.utils import human_delay
+from careershift.utils import BS_PARSER, wait_until_idle
 from careershift.constants import CAREERSHIFT_QUOTA_URL
 from config import MAX_CONTACTS_HARD_CAP
 
 logger = get_logger(__name__)
 
 
+def _iter_tables(html):
+    """
+    Yield (lowercased header texts, [cell texts per data row]) for each
+    <table> in html. Uses selectolax (lexbor) when installed.
+    """
+    if _USE_SELECTOLAX:
+        for table in LexborHTMLParser(html).css("table"):
+            headers = [th.text(strip=True).lower() for th in table.css("th")]
+            rows    = [[td.text(strip=True) for td in tr.css("td")]
+                       for tr in table.css("tr")[1:]]
+            yield headers, rows
+        return
+
+    soup = BeautifulSoup(html, BS_PARSER)
+    for table in soup.find_all("table"):
+        headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
+        rows    = [[td.get_text(strip=True) for td in tr.find_all("td")]
+                   for tr in table.find_all("tr")[1:]]
+        yield headers, rows
+
+
+def _http_quota_html(page):
+    """
+    GET the quota page over plain HTTP with the browser session's cookies —
+    it is a static table, so a full navigation is wasted work. Returns None
+    when the session is bounced (redirect to login) or the request fails.
+    """
+    try:
+        cookies = httpx.Cookies()
+        for ck in page.context.cookies(CAREERSHIFT_QUOTA_URL):
+            cookies.set(ck["name"], ck["value"], domain=ck["domain"], path=ck["path"])
+        resp = httpx.get(
+            CAREERSHIFT_QUOTA_URL,
+            cookies=cookies,
+            headers={"User-Agent": page.evaluate("() => navigator.userAgent")},
+            follow_redirects=False,
+            timeout=15,
+        )
+        if resp.status_code == 200:
+            return resp.text
+        logger.debug("Quota page HTTP %d — falling back to browser", resp.status_code)
+    except Exception as e:
+        logger.debug("Quota page HTTP fetch failed: %s — falling back to browser", e)
+    return None
+
+
+def _browser_quota_html(page):
+    page.goto(CAREERSHIFT_QUOTA_URL, wait_until="domcontentloaded", timeout=30000)
+    wait_until_idle(page)
+    return page.content()
+
+
+def _parse_remaining(html):
+    """Remaining credits from the account usage table, or None if not found."""
+    for headers, rows in _iter_tables(html):
+        if "remaining" in headers:
+            remaining_idx = headers.index("remaining")
+            for cols in rows:
+                if cols:
+                    return int(cols[remaining_idx])
+    return None
+
+
 def fetch_real_quota(page, user_id: int = 1):
     """
     Fetch actual remaining quota from CareerShift Account Usage page
@@ -19,47 +91,32 @@ def fetch_real_quota(page, user_id: int = 1):
     Returns remaining quota as integer.
     """
     try:
-        page.goto(CAREERSHIFT_QUOTA_URL, wait_until="domcontentloaded", timeout=30000)
-        human_delay(2.0, 3.0)
-
-        html = page.content()
-        soup = BeautifulSoup(html, "html.parser")
-
-        tables = soup.find_all("table")
-        for table in tables:
-            headers = [th.get_text(strip=True).lower() for th in table.find_all("th")]
-            if "remaining" in headers:
-                rows = table.find_all("tr")
-                for row in rows[1:]:
-                    cols = [td.get_text(strip=True) for td in row.find_all("td")]
-                    if cols:
-                        remaining_idx = headers.index("remaining")
-                        remaining = int(cols[remaining_idx])
-
-                        conn = get_conn()
-                        try:
-                            c = conn.cursor()
-                            today = datetime.now().strftime("%Y-%m-%d")
-                            used = 50 - remaining
-                            # Partial unique index: careershift_quota_user_date_key WHERE user_id IS NOT NULL
-                            c.execute("""
-                                INSERT INTO careershift_quota (user_id, date, total_limit, used, remaining)
-                                VALUES (?, ?, 50, ?, ?)
-                                ON CONFLICT(user_id, date) WHERE user_id IS NOT NULL DO UPDATE SET
-                                    used = excluded.used,
-                                    remaining = excluded.remaining
-                            """, (user_id, today, used, remaining))
-                            conn.commit()
-                        finally:
-                            conn.close()
-
-                        logger.info("fetch_real_quota user_id=%d: remaining=%d/50", user_id, remaining)
-                        print(f"[INFO] Real CareerShift quota user_id={user_id} — Remaining: {remaining}/50")
-                        return remaining
-
-        logger.warning("fetch_real_quota user_id=%d: could not parse quota page — using DB value", user_id)
-        print("[WARNING] Could not parse quota from account usage page. Using local DB value.")
-        return get_remaining_quota(user_id=user_id)
+        html = _http_quota_html(page)
+        remaining = _parse_remaining(html) if html else None
+        if remaining is None:
+            # Redirected, failed, or a 200 that isn't the usage page — use the browser
+            remaining = _parse_remaining(_browser_quota_html(page))
+
+        if remaining is None:
+            logger.warning("fetch_real_quota user_id=%d: could not parse quota page — using DB value", user_id)
+            print("[WARNING] Could not parse quota from account usage page. Using local DB value.")
+            return get_remaining_quota(user_id=user_id)
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        used = 50 - remaining
+        with get_conn() as conn:
+            # Partial unique index: careershift_quota_user_date_key WHERE user_id IS NOT NULL
+            conn.execute("""
+                INSERT INTO careershift_quota (user_id, date, total_limit, used, remaining)
+                VALUES (?, ?, 50, ?, ?)
+                ON CONFLICT(user_id, date) WHERE user_id IS NOT NULL DO UPDATE SET
+                    used = excluded.used,
+                    remaining = excluded.remaining
+            """, (user_id, today, used, remaining))
+
+        logger.info("fetch_real_quota user_id=%d: remaining=%d/50", user_id, remaining)
+        print(f"[INFO] Real CareerShift quota user_id={user_id} — Remaining: {remaining}/50")
+        return remaining
 
     except Exception as e:
         logger.warning("fetch_real_quota user_id=%d failed: %s — using DB value", user_id, e)
@@ -75,19 +132,10 @@ def calculate_distribution(remaining_quota, company_count):
     if company_count == 0 or remaining_quota == 0:
         return [0] * company_count
 
-    base = remaining_quota // company_count
-    extra = remaining_quota % company_count
+    base, extra = divmod(remaining_quota, company_count)
 
     if base >= MAX_CONTACTS_HARD_CAP:
         return [MAX_CONTACTS_HARD_CAP] * company_count
 
-    counts = []
-    for i in range(company_count):
-        if base == 0:
-            counts.append(1 if i < extra else 0)
-        else:
-            if i < extra and base + 1 <= MAX_CONTACTS_HARD_CAP:
-                counts.append(base + 1)
-            else:
-                counts.append(base)
-    return counts
+    # base < cap here, so the first `extra` companies can each take one more
+    return [base + 1] * extra + [base] * (company_count - extra)
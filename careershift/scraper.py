@@ -13,15 +13,14 @@ from db.db import (
     get_existing_domain_for_company,
     get_existing_emails_for_company,
 )
-from careershift.utils import human_delay
+from careershift.utils import human_delay, wait_for_results, wait_until_idle
 from careershift.search import (
     submit_search,
-    parse_cards_from_html,
+    read_cards,
     extract_email,
-    classify_title,
-    is_excluded_title,
+    classify_hr_title,
 )
-from careershift.constants import CAREERSHIFT_SEARCH_URL, HR_SEARCH_TERMS
+from careershift.constants import HR_SEARCH_TERMS
 from config import (
     MAX_CONTACTS_HARD_CAP,
     CAREERSHIFT_SAMPLE_SIZE,
@@ -147,20 +146,21 @@ def analyze_buffer(buffer, expected_domain, existing_db_domain=None):
 # ─────────────────────────────────────────
 
 def visit_and_extract(page, detail_url, name, position, confidence):
-    """Visit profile, extract email, update quota. Returns contact dict or None."""
+    """
+    Visit profile, extract email, update quota. Returns contact dict or None.
+    Stays on the profile: the detail URLs are already collected, and the next
+    submit_search navigates back to the search form itself.
+    """
     try:
-        human_delay(4.0, 8.0)
+        human_delay(1.0, 2.5)
         page.goto(detail_url, wait_until="domcontentloaded", timeout=20000)
-        human_delay(3.0, 6.0)
+        wait_until_idle(page)
         # increment_quota_used(1)
 
         email = extract_email(page)
         if email:
             logger.debug("Profile visit: extracted email=%s name=%r", email, name)
             print(f"         [INFO] {email}")
-            page.goto(f"{CAREERSHIFT_SEARCH_URL}#contacts_search_results",
-                      wait_until="domcontentloaded", timeout=20000)
-            human_delay(3.0, 5.0)
             return {
                 "name":       name,
                 "position":   position,
@@ -170,9 +170,6 @@ def visit_and_extract(page, detail_url, name, position, confidence):
         else:
             logger.debug("Profile visit: no email found for %r — skipping", name)
             print(f"         [SKIP] No email — skipping {name}")
-            page.goto(f"{CAREERSHIFT_SEARCH_URL}#contacts_search_results",
-                      wait_until="domcontentloaded", timeout=20000)
-            human_delay(2.0, 3.0)
             return None
     except Exception as e:
         logger.warning("Profile visit failed for %r: %s", name, e)
@@ -219,15 +216,14 @@ def scrape_company(page, company, max_contacts, expected_domain, user_id: int =
         if not submit_search(page, company, hr_term=hr_term, require_email=True):
             continue
 
-        try:
-            page.wait_for_selector("li[data-type='contact']", timeout=6000)
-        except Exception:
+        # submit_search no longer sleeps after clicking — give the results
+        # the time that sleep used to cover
+        if not wait_for_results(page, timeout=10000):
             logger.debug("No results for hr_term=%r company=%r", hr_term, company)
             print(f"   [INFO] No results for '{hr_term}'")
             continue
 
-        html = page.content()
-        cards = parse_cards_from_html(html)
+        cards = read_cards(page)
 
         actual_count = len(cards)
         sample_size  = min(actual_count, CAREERSHIFT_SAMPLE_SIZE)
@@ -245,13 +241,13 @@ def scrape_company(page, company, max_contacts, expected_domain, user_id: int =
             if normalized_card == normalized_expected:
                 cnt += 1
                 hashmap[normalized_expected] += 1
-                if has_email and classify_title(position) and \
-                   not is_excluded_title(position) and \
-                   detail_url not in seen_urls:
+                label = classify_hr_title(position) if has_email else None
+                if label and detail_url not in seen_urls:
                     all_exact_profiles.append({
                         "name":       name,
                         "position":   position,
                         "detail_url": detail_url,
+                        "confidence": label,
                     })
                     seen_urls.add(detail_url)
 
@@ -278,7 +274,7 @@ def scrape_company(page, company, max_contacts, expected_domain, user_id: int =
             print(f"   [OK] High confidence ({confidence:.0f}%) — "
                   f"skipping remaining HR terms")
 
-        human_delay(2.0, 4.0)
+        human_delay(0.5, 1.0)
 
     # ── After all HR terms ──
     if hashmap[normalized_expected] == 0:
@@ -313,7 +309,7 @@ def scrape_company(page, company, max_contacts, expected_domain, user_id: int =
             print(f"   [INFO] Quota exhausted — stopping profile visits early")
             break
 
-        confidence = classify_title(profile["position"]) or "auto"
+        confidence = profile["confidence"]
         detail = visit_and_extract(
             page,
             profile["detail_url"],
@@ -1,9 +1,9 @@
 # careershift/search.py — CareerShift search, card parsing, email extraction
 
 import re
-from bs4 import BeautifulSoup
+from functools import lru_cache
 
-from careershift.utils import human_delay, slow_type
+from careershift.utils import human_delay, slow_type, wait_until_idle
 from careershift.constants import (
     CAREERSHIFT_SEARCH_URL,
     HR_KEYWORDS_STRONG,
@@ -12,54 +12,92 @@ from careershift.constants import (
 )
 
 
+def _keyword_re(keywords):
+    """One alternation regex for a keyword list — a single C-level scan per title."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_STRONG_RE  = _keyword_re(HR_KEYWORDS_STRONG)
+_LOOSE_RE   = _keyword_re(HR_KEYWORDS_LOOSE)
+_EXCLUDE_RE = _keyword_re(EXCLUDE_KEYWORDS)
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}")
+# Same pattern, but the domain must not contain a site/tracker name — used on
+# raw page HTML, where those addresses show up in scripts and footers. The
+# exclusion is a substring match on purpose: tracker hosts such as
+# sentry-next.wixpress.com would slip past an exact domain-set lookup.
+_PAGE_EMAIL_RE = re.compile(
+    r"[a-zA-Z0-9._%+\-]+@"
+    r"(?![a-zA-Z0-9.\-]*(?i:careershift|springshare|linkedin|google|hubspot|sentry))"
+    r"[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}"
+)
+
+
+# Titles repeat heavily across cards ("Recruiter", "Senior Recruiter"), so the
+# public checks below are memoized per raw title string.
+def _classify(t):
+    if _STRONG_RE.search(t):
+        return "auto"
+    if _LOOSE_RE.search(t):
+        return "manual_review"
+    return None
+
+
+def _excluded(t):
+    # Padded so space-delimited keywords like " vp " match at the edges
+    return _EXCLUDE_RE.search(f" {t} ") is not None
+
+
+@lru_cache(maxsize=4096)
 def classify_title(title):
     """Classify HR title as auto, manual_review, or None (not HR)."""
-    t = title.lower().strip()
-    for kw in HR_KEYWORDS_STRONG:
-        if kw in t:
-            return "auto"
-    for kw in HR_KEYWORDS_LOOSE:
-        if kw in t:
-            return "manual_review"
-    return None
+    return _classify(title.lower().strip())
 
 
+@lru_cache(maxsize=4096)
 def is_excluded_title(title):
     """Return True if title matches senior/executive exclusion list."""
-    t = f" {title.lower().strip()} "
-    for kw in EXCLUDE_KEYWORDS:
-        if kw in t:
-            return True
-    return False
+    return _excluded(title.lower().strip())
+
+
+@lru_cache(maxsize=4096)
+def classify_hr_title(title):
+    """
+    classify_title + is_excluded_title on one normalized copy of title.
+    Returns auto / manual_review, or None if not HR or excluded.
+    """
+    t = title.lower().strip()
+    label = _classify(t)
+    if label is None or _excluded(t):
+        return None
+    return label
+
 
+# Card fields read in the page itself: only a small JSON array crosses the
+# driver boundary instead of the whole DOM.
+_READ_CARDS_JS = """
+    () => Array.from(document.querySelectorAll('li[data-type="contact"]:not([data-stale])')).map(li => {
+        const h3   = li.querySelector('h3.title');
+        const h4s  = li.querySelectorAll('h4');
+        const link = li.querySelector('a[href*="/App/Contacts/SearchDetails"]');
+        const href = link ? link.getAttribute('href') || '' : '';
+        return [
+            h3 ? h3.textContent.trim() : '',
+            h4s.length >= 1 ? h4s[0].textContent.trim() : '',
+            h4s.length >= 2 ? h4s[1].textContent.trim() : '',
+            href.startsWith('/') ? 'https://www.careershift.com' + href : href,
+            li.querySelector('span.fa-envelope-o') !== null,
+        ];
+    }).filter(card => card[0] && card[3])
+"""
 
-def parse_cards_from_html(html):
+
+def read_cards(page):
     """
-    Parse result cards from search results HTML.
+    Read result cards straight from the live page.
     Returns list of (name, company, position, detail_url, has_email).
     """
-    soup = BeautifulSoup(html, "html.parser")
-    cards = soup.find_all("li", attrs={"data-type": "contact"})
-    results = []
-    for card in cards:
-        try:
-            name_tag = card.find("h3", class_="title")
-            name = name_tag.get_text(strip=True) if name_tag else ""
-            h4s = card.find_all("h4")
-            # h4[0] = company name, h4[1] = position (title)
-            company = h4s[0].get_text(strip=True) if len(h4s) >= 1 else ""
-            position = h4s[1].get_text(strip=True) if len(h4s) >= 2 else ""
-            detail_link = card.find("a", href=re.compile(r"/App/Contacts/SearchDetails"))
-            detail_url = ""
-            if detail_link:
-                href = detail_link.get("href", "")
-                detail_url = "https://www.careershift.com" + href if href.startswith("/") else href
-            has_email = card.find("span", class_="fa-envelope-o") is not None
-            if name and detail_url:
-                results.append((name, company, position, detail_url, has_email))
-        except:
-            continue
-    return results
+    return [tuple(card) for card in page.evaluate(_READ_CARDS_JS)]
 
 
 def extract_email(page):
@@ -71,38 +109,87 @@ def extract_email(page):
         email = raw.replace("mailto:", "").strip()
         if email:
             return email
-    except:
+    except Exception:
         pass
     try:
         candidate = page.locator("span:has-text('@'), a:has-text('@'), p:has-text('@')").first
         candidate.wait_for(timeout=3000)
         text = candidate.inner_text().strip()
-        match = re.search(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", text)
+        match = _EMAIL_RE.search(text)
         if match and "linkedin" not in match.group(0).lower():
             return match.group(0)
-    except:
+    except Exception:
         pass
     try:
-        content = page.content()
-        matches = re.findall(r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}", content)
-        for m in matches:
-            if all(x not in m for x in ["careershift", "springshare", "linkedin",
-                                          "google", "hubspot", "sentry"]):
-                return m
-    except:
+        match = _PAGE_EMAIL_RE.search(page.content())
+        if match:
+            return match.group(0)
+    except Exception:
         pass
     return None
 
 
-def submit_search(page, company, hr_term=None, require_email=True):
-    """Submit a CareerShift search with optional filters. Returns True if successful."""
+# Clears the filters a previous submit_search left behind, firing input and
+# change events so the page's own state (autocomplete, chosen company) resets
+# too, including any hidden company id the autocomplete filled in. Returns
+# true only if every field reads back empty afterwards; otherwise the caller
+# falls back to a fresh navigation.
+_RESET_FORM_JS = """
+    () => {
+        const company = document.querySelector("input[placeholder='Company Name']");
+        if (!company) return false;
+        const form  = company.form || document;
+        const title = document.querySelector('#Title');
+        const hidden = Array.from(form.querySelectorAll(
+            "input[type='hidden'][name*='company' i], input[type='hidden'][id*='company' i]"));
+        for (const el of [company, title, ...hidden]) {
+            if (!el) continue;
+            el.value = '';
+            el.dispatchEvent(new Event('input',  {bubbles: true}));
+            el.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        const cb = document.querySelector('#RequireEmail');
+        if (cb && cb.checked) cb.click();
+        return [company, title, ...hidden].every(el => !el || el.value === '')
+            && !(cb && cb.checked);
+    }
+"""
+
+
+# Tag the cards already on screen so wait_for_results/read_cards skip them
+_MARK_STALE_JS = """
+    () => document.querySelectorAll('li[data-type="contact"]')
+        .forEach(li => li.setAttribute('data-stale', ''))
+"""
+
+
+def _reset_search_form(page):
+    """
+    Reset the search form in place if the page is already on it.
+    Returns False (caller navigates instead) unless the reset is confirmed.
+    """
+    if not page.url.startswith(CAREERSHIFT_SEARCH_URL):
+        return False
     try:
-        page.goto(CAREERSHIFT_SEARCH_URL, wait_until="domcontentloaded", timeout=30000)
-        human_delay(2.0, 4.0)
-    except Exception as e:
-        print(f"   [ERROR] Could not load search page: {e}")
+        return page.evaluate(_RESET_FORM_JS) is True
+    except Exception:
         return False
 
+
+def submit_search(page, company, hr_term=None, require_email=True):
+    """Submit a CareerShift search with optional filters. Returns True if successful."""
+    # Searches run back to back (HR terms x companies), so reuse the loaded
+    # form instead of a cold navigation each time
+    if _reset_search_form(page):
+        human_delay(0.3, 0.7)
+    else:
+        try:
+            page.goto(CAREERSHIFT_SEARCH_URL, wait_until="domcontentloaded", timeout=30000)
+            wait_until_idle(page)
+        except Exception as e:
+            print(f"   [ERROR] Could not load search page: {e}")
+            return False
+
     try:
         company_input = page.locator("input[placeholder='Company Name']").first
         company_input.wait_for(timeout=5000)
@@ -118,7 +205,7 @@ def submit_search(page, company, hr_term=None, require_email=True):
             human_delay(0.3, 0.6)
             suggestion.click()
             human_delay(0.3, 0.6)
-        except:
+        except Exception:
             pass
     except Exception as e:
         print(f"   [WARNING] Could not fill Company Name: {e}")
@@ -149,8 +236,10 @@ def submit_search(page, company, hr_term=None, require_email=True):
                 title_input.wait_for(state="visible", timeout=5000)
                 title_input.click()
                 human_delay(0.2, 0.5)
-                slow_type(title_input, hr_term)
-                human_delay(0.5, 1.0)
+                # No autocomplete on this field — fill() sets the value and
+                # fires the input event in one go, no per-key typing needed
+                title_input.fill(hr_term)
+                human_delay(0.3, 0.6)
                 filled = title_input.input_value()
                 if not filled.strip():
                     raise Exception("Job Title field empty after fill")
@@ -182,8 +271,9 @@ def submit_search(page, company, hr_term=None, require_email=True):
         search_btn = page.locator("button.search-button").first
         search_btn.wait_for(timeout=3000)
         human_delay(0.4, 0.9)
+        page.evaluate(_MARK_STALE_JS)
         search_btn.click()
-        human_delay(2.5, 4.5)
+        human_delay(0.2, 0.5)
     except Exception as e:
         print(f"   [WARNING] Could not click search: {e}")
         return False
@@ -3,14 +3,56 @@
 import time
 import random
 
+# BeautifulSoup tree builder — C-backed lxml when installed, stdlib otherwise
+try:
+    import lxml  # noqa: F401
+    BS_PARSER = "lxml"
+except ImportError:
+    BS_PARSER = "html.parser"
+
+# Images, fonts and media: never read by the scrapers, but fetched on every
+# navigation because contexts start with an empty cache each run
+STATIC_ASSETS = "**/*.{png,jpg,jpeg,gif,webp,svg,ico,woff,woff2,ttf,otf,mp4,webm}"
+
+# Result cards of the current search. submit_search tags the previous
+# search's cards data-stale before clicking, since the in-place form reset
+# leaves them in the DOM until the new results replace them.
+RESULT_CARD_SELECTOR = "li[data-type='contact']:not([data-stale])"
+
+
+def block_static_assets(context):
+    """Abort static asset requests for every page in context."""
+    context.route(STATIC_ASSETS, lambda route: route.abort())
+
 
 def human_delay(min_sec=1.0, max_sec=3.0):
     """Sleep for a random duration to mimic human behavior."""
     time.sleep(random.uniform(min_sec, max_sec))
 
 
+def wait_until_idle(page, timeout=5000):
+    """
+    Wait for the page's network to go quiet instead of sleeping a fixed time.
+    A timeout is not an error — pages with background polling never go idle.
+    """
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout)
+    except Exception:
+        pass
+
+
+def wait_for_results(page, timeout=5000):
+    """Wait for search result cards. Returns False if none rendered in time."""
+    try:
+        page.wait_for_selector(RESULT_CARD_SELECTOR, timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
 def slow_type(element, text):
-    """Type text character by character with random delays."""
-    for char in text:
-        element.type(char)
-        time.sleep(random.uniform(0.05, 0.18))
\ No newline at end of file
+    """
+    Type text key by key with a human-like delay. The driver schedules the
+    per-key delay itself, so this is one browser round-trip, not one per char.
+    """
+    element.press_sequentially(text, delay=random.randint(50, 180))
\ No newline at end of file
@@ -1,26 +1,50 @@
 # careershift/verification.py — Tiered recruiter verification
 
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
 
 from logger import get_logger
 from db.db import (
+    get_conn,
     get_recruiters_by_tier,
-    get_recruiters_by_company,
+    get_recruiters_for_companies,
     update_recruiter,
+    touch_recruiters,
     mark_recruiter_inactive,
-    link_recruiter_to_application,
+    link_recruiters_to_applications,
 )
-from careershift.utils import human_delay
-from careershift.search import submit_search, parse_cards_from_html, extract_email
-from careershift.constants import CAREERSHIFT_SEARCH_URL, TIER1_DAYS, TIER2_DAYS
+from careershift.utils import human_delay, wait_for_results, wait_until_idle
+from careershift.search import submit_search, read_cards, extract_email
+from careershift.constants import TIER1_DAYS, TIER2_DAYS
 
 logger = get_logger(__name__)
 
 
-def verify_tier2_recruiter(page, recruiter):
+# Profile page text (text nodes joined by spaces, like get_text(separator=" "))
+# and the second <h4> (position), read in the page in one call
+_PROFILE_JS = """
+    () => {
+        const walker = document.createTreeWalker(document.documentElement, NodeFilter.SHOW_TEXT);
+        const parts  = [];
+        while (walker.nextNode()) parts.push(walker.currentNode.nodeValue);
+        const h4s = document.querySelectorAll('h4');
+        return [parts.join(' '), h4s.length >= 2 ? h4s[1].textContent.trim() : null];
+    }
+"""
+
+
+def _mark_verified(recruiter_id, verified):
+    """Stamp verified_at now, or queue the id on verified for one batched UPDATE."""
+    if verified is None:
+        update_recruiter(recruiter_id)
+    else:
+        verified.append(recruiter_id)
+
+
+def verify_tier2_recruiter(page, recruiter, verified=None):
     """
     Tier 2: Lightweight verification — search by company and look for name in cards.
     No profile visit needed. Returns True if found, False to escalate to Tier 3.
+    verified: optional list collecting ids to stamp later (see _mark_verified).
     """
     company = recruiter["company"]
     name    = recruiter["name"].strip().lower()
@@ -34,13 +58,12 @@ def verify_tier2_recruiter(page, recruiter):
                            recruiter["name"], company)
             return True  # search failed — assume still valid
 
-        human_delay(2.0, 3.0)
-        html  = page.content()
-        cards = parse_cards_from_html(html)
+        wait_for_results(page)
+        cards = read_cards(page)
 
         for card_name, _, _, _, _ in cards:
             if name in card_name.strip().lower():
-                update_recruiter(recruiter["id"])
+                _mark_verified(recruiter["id"], verified)
                 logger.info("Tier 2 verified: %r still at %r", recruiter["name"], company)
                 print(f"     [OK] Tier 2 verified: {recruiter['name']} still at {company}")
                 return True
@@ -57,11 +80,12 @@ def verify_tier2_recruiter(page, recruiter):
         return True
 
 
-def verify_tier3_recruiter(page, recruiter):
+def verify_tier3_recruiter(page, recruiter, verified=None):
     """
     Tier 3: Full profile visit — free since profile is cached.
     Checks company, title, email still current. Updates DB or marks inactive.
     Returns True if recruiter was marked inactive, False otherwise.
+    verified: optional list collecting ids to stamp later (see _mark_verified).
     """
     name    = recruiter["name"]
     company = recruiter["company"]
@@ -72,12 +96,11 @@ def verify_tier3_recruiter(page, recruiter):
         ok = submit_search(page, company, hr_term=None, require_email=False)
         if not ok:
             logger.warning("Tier 3: search failed for %r — marking as verified", name)
-            update_recruiter(recruiter["id"])
+            _mark_verified(recruiter["id"], verified)
             return False
 
-        human_delay(2.0, 3.0)
-        html       = page.content()
-        cards      = parse_cards_from_html(html)
+        wait_for_results(page)
+        cards      = read_cards(page)
         detail_url = None
 
         for card_name, _, position, url, _ in cards:
@@ -91,13 +114,12 @@ def verify_tier3_recruiter(page, recruiter):
             mark_recruiter_inactive(recruiter["id"], reason="not found in company search")
             return True
 
-        human_delay(3.0, 6.0)
+        human_delay(1.0, 2.5)
         page.goto(detail_url, wait_until="domcontentloaded", timeout=20000)
-        human_delay(2.0, 4.0)
+        wait_until_idle(page)
 
-        html  = page.content()
-        soup  = BeautifulSoup(html, "html.parser")
-        page_text = soup.get_text(separator=" ").lower()
+        page_text, new_position = page.evaluate(_PROFILE_JS)
+        page_text = page_text.lower()
 
         if company.lower() not in page_text:
             logger.info("Tier 3: %r no longer at %r — marking inactive", name, company)
@@ -108,9 +130,6 @@ def verify_tier3_recruiter(page, recruiter):
         new_email     = extract_email(page)
         current_email = recruiter["email"]
 
-        h4s          = soup.find_all("h4")
-        new_position = h4s[1].get_text(strip=True) if len(h4s) >= 2 else None
-
         updates = {}
         if new_email and new_email != current_email:
             logger.info("Tier 3: email updated for %r: %s → %s",
@@ -123,27 +142,73 @@ def verify_tier3_recruiter(page, recruiter):
             print(f"     [INFO] Title updated: {recruiter['position']} -> {new_position}")
             updates["position"] = new_position
 
-        update_recruiter(recruiter["id"], **updates)
+        if updates:
+            update_recruiter(recruiter["id"], **updates)
+        else:
+            _mark_verified(recruiter["id"], verified)
         logger.info("Tier 3 verified: %r still active at %r", name, company)
         print(f"     [OK] Tier 3 verified: {name} still active at {company}")
-
-        page.goto(f"{CAREERSHIFT_SEARCH_URL}#contacts_search_results",
-                  wait_until="domcontentloaded", timeout=20000)
-        human_delay(2.0, 3.0)
+        # No navigation back to the results — the next submit_search loads the form
         return False
 
     except Exception as e:
         logger.warning("Tier 3 check failed for %r: %s", name, e)
         print(f"     [WARNING] Tier 3 check failed for {name}: {e}")
-        update_recruiter(recruiter["id"])
+        _mark_verified(recruiter["id"], verified)
         return False
 
 
-def run_tiered_verification(page, applications, found_by_user_id=None):
+def _verify_batch(page, batch, verified):
+    """
+    Verify batch [(recruiter, tier)] on page, escalating Tier 2 misses to Tier 3.
+    Returns this batch's share of the run_tiered_verification stats.
+    """
+    stats = {"tier2_verified": 0, "tier3_verified": 0, "tier3_inactive": 0, "changes": []}
+    for recruiter, tier in batch:
+        if tier == 2:
+            print(f"  Checking: {recruiter['name']} @ {recruiter['company']}")
+            if verify_tier2_recruiter(page, recruiter, verified):
+                stats["tier2_verified"] += 1
+                human_delay(1.0, 2.0)
+                continue
+            # Escalate to Tier 3
+            source = "escalated from T2"
+        else:
+            print(f"  Verifying: {recruiter['name']} @ {recruiter['company']}")
+            source = "T3"
+
+        if verify_tier3_recruiter(page, recruiter, verified):
+            stats["tier3_inactive"] += 1
+            logger.info("Recruiter marked inactive (%s): %r @ %r",
+                        source, recruiter["name"], recruiter["company"])
+            stats["changes"].append({
+                "name":    recruiter["name"],
+                "company": recruiter["company"],
+                "action":  "marked inactive",
+            })
+        else:
+            stats["tier3_verified"] += 1
+        human_delay(1.0, 2.0)
+    return stats
+
+
+def _verify_batch_in_session(open_page, batch, verified):
+    """_verify_batch on a page from open_page(); None if that page could not be opened."""
+    with open_page() as page:
+        if page is None:
+            return None
+        return _verify_batch(page, batch, verified)
+
+
+def run_tiered_verification(page, applications, found_by_user_id=None,
+                            open_page=None, sessions=1):
     """
     Run tiered verification for recruiters found by found_by_user_id's account.
     After verification, link active recruiters to their applications.
     found_by_user_id=None verifies ALL recruiters (single-user backward compat).
+    open_page: optional callable returning a context manager that yields a
+    fresh page on the same account (or None). With it, Tier 2/3 recruiters
+    are split over `sessions` pages, one worker thread per extra page.
     Returns stats dict with tier counts and changes.
     """
     tiers = get_recruiters_by_tier(TIER1_DAYS, TIER2_DAYS, found_by_user_id=found_by_user_id)
@@ -160,63 +225,53 @@ def run_tiered_verification(page, applications, found_by_user_id=None):
     print(f"  Tier 2 ({TIER1_DAYS}-{TIER2_DAYS} days, search check): {len(tier2)} recruiter(s)")
     print(f"  Tier 3 (> {TIER2_DAYS} days, full visit):   {len(tier3)} recruiter(s)")
 
-    tier2_verified = 0
-    tier3_verified = 0
-    tier3_inactive = 0
-    changes        = []
-
-    if tier2:
-        print(f"\n[INFO] Running Tier 2 verification ({len(tier2)} recruiter(s))...")
-        for recruiter in tier2:
-            print(f"  Checking: {recruiter['name']} @ {recruiter['company']}")
-            found = verify_tier2_recruiter(page, recruiter)
-            if found:
-                tier2_verified += 1
-            else:
-                # Escalate to Tier 3
-                marked_inactive = verify_tier3_recruiter(page, recruiter)
-                if marked_inactive:
-                    tier3_inactive += 1
-                    logger.info("Recruiter marked inactive (escalated from T2): %r @ %r",
-                                recruiter["name"], recruiter["company"])
-                    changes.append({
-                        "name":    recruiter["name"],
-                        "company": recruiter["company"],
-                        "action":  "marked inactive",
-                    })
-                else:
-                    tier3_verified += 1
-            human_delay(1.0, 2.0)
-
-    if tier3:
-        print(f"\n[INFO] Running Tier 3 verification ({len(tier3)} recruiter(s))...")
-        for recruiter in tier3:
-            print(f"  Verifying: {recruiter['name']} @ {recruiter['company']}")
-            marked_inactive = verify_tier3_recruiter(page, recruiter)
-            if marked_inactive:
-                tier3_inactive += 1
-                logger.info("Recruiter marked inactive (T3): %r @ %r",
-                            recruiter["name"], recruiter["company"])
-                changes.append({
-                    "name":    recruiter["name"],
-                    "company": recruiter["company"],
-                    "action":  "marked inactive",
-                })
-            else:
-                tier3_verified += 1
-            human_delay(1.0, 2.0)
+    # Plain "still valid" stamps are queued and written in one UPDATE
+    verified = []
+    # Round-robin over the pages; this thread's page takes the first share
+    work     = [(recruiter, 2) for recruiter in tier2] + [(recruiter, 3) for recruiter in tier3]
+    sessions = max(1, min(sessions, len(work))) if open_page else 1
+    batches  = [work[k::sessions] for k in range(sessions)]
+    results  = []
+    try:
+        if sessions == 1:
+            for tier, recruiters in ((2, tier2), (3, tier3)):
+                if recruiters:
+                    print(f"\n[INFO] Running Tier {tier} verification ({len(recruiters)} recruiter(s))...")
+                    results.append(_verify_batch(page, [(r, tier) for r in recruiters], verified))
+        else:
+            print(f"\n[INFO] Running Tier 2/3 verification ({len(work)} recruiter(s)) "
+                  f"on {sessions} browsers...")
+            with ThreadPoolExecutor(max_workers=sessions - 1) as executor:
+                extra = [executor.submit(_verify_batch_in_session, open_page, batch, verified)
+                         for batch in batches[1:]]
+                results.append(_verify_batch(page, batches[0], verified))
+                for batch, future in zip(batches[1:], extra):
+                    stats = future.result()
+                    if stats is None:
+                        # That browser never opened — check its share on this page
+                        stats = _verify_batch(page, batch, verified)
+                    results.append(stats)
+    finally:
+        touch_recruiters(verified)
+
+    tier2_verified = sum(r["tier2_verified"] for r in results)
+    tier3_verified = sum(r["tier3_verified"] for r in results)
+    tier3_inactive = sum(r["tier3_inactive"] for r in results)
+    changes        = [change for r in results for change in r["changes"]]
 
     print(f"\n[INFO] Linking verified recruiters to applications...")
-    for app in applications:
-        existing = get_recruiters_by_company(app["company"])
-        linked   = 0
-        for recruiter in existing:
-            link_recruiter_to_application(app["id"], recruiter["id"])
-            linked += 1
-        if linked:
-            logger.debug("Linked %d recruiter(s) to application id=%s (%s)",
-                         linked, app["id"], app["company"])
-            print(f"  [OK] {app['company']}: linked {linked} recruiter(s) to application id={app['id']}")
+    # One transaction for every link — a single commit instead of one per row
+    by_company = get_recruiters_for_companies({app["company"] for app in applications})
+    with get_conn() as conn:
+        for app in applications:
+            existing = by_company[app["company"]]
+            linked   = len(link_recruiters_to_applications(
+                [app["id"]], [r["id"] for r in existing], conn=conn,
+            ))
+            if linked:
+                logger.debug("Linked %d recruiter(s) to application id=%s (%s)",
+                             linked, app["id"], app["company"])
+                print(f"  [OK] {app['company']}: linked {linked} recruiter(s) to application id={app['id']}")
 
     logger.info("Verification complete: t2_verified=%d t3_verified=%d t3_inactive=%d changes=%d",
                 tier2_verified, tier3_verified, tier3_inactive, len(changes))
@@ -50,6 +50,8 @@ RETENTION_OUTREACH_PENDING     = 30
 RETENTION_OUTREACH_FAILED      = 30
 RETENTION_AI_CACHE             = 21
 RETENTION_JOB_CACHE            = 21
+JOB_SCRAPE_FAILURE_TTL_HOURS   = 24   # too-short JDs (page parsed fine) are not retried sooner
+JOB_SCRAPE_ERROR_TTL_HOURS     = 1    # failed fetches may be transient — retry soon
 RETENTION_MODEL_USAGE          = 21
 RETENTION_CAREERSHIFT_QUOTA    = 30
 RETENTION_QUOTA_ALERTS         = 30
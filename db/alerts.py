@@ -70,7 +70,7 @@ def get_quota_history(quota_type, days=None, user_id=None):
                 LIMIT ?
             """, (total_gemini, total_gemini, days))
 
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
@@ -280,6 +280,6 @@ def get_coverage_stats(days: int = 3, user_id=None) -> list:
             ORDER BY date DESC
             LIMIT ?
         """, (days,))
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
@@ -7,13 +7,19 @@ from logger import get_logger
 logger = get_logger(__name__)
 
 
-def link_recruiter_to_application(application_id, recruiter_id):
+def link_recruiter_to_application(application_id, recruiter_id, conn=None):
     """
     Link a recruiter to an application.
     Enforces MAX_RECRUITERS_PER_APPLICATION cap at DB level.
     Returns True if linked, False if cap already reached.
+
+    conn: optional open connection — when given, the link joins the
+    caller's transaction and the caller commits/closes (lets bulk
+    linking loops pay for one commit instead of one per row).
     """
-    conn = get_conn()
+    own_conn = conn is None
+    if own_conn:
+        conn = get_conn()
     c = conn.cursor()
     try:
         c.execute("""
@@ -28,10 +34,66 @@ def link_recruiter_to_application(application_id, recruiter_id):
             VALUES (?, ?)
             ON CONFLICT DO NOTHING
         """, (application_id, recruiter_id))
-        conn.commit()
+        if own_conn:
+            conn.commit()
         return True
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
+
+
+def link_recruiters_to_applications(application_ids, recruiter_ids, conn=None):
+    """
+    Link every recruiter to every application in one read and one insert.
+    Same cap rule as link_recruiter_to_application, applied in order per
+    application. Returns the (application_id, recruiter_id) pairs allowed
+    under the cap (already-linked pairs included).
+
+    conn: optional open connection — see link_recruiter_to_application.
+    """
+    application_ids = list(dict.fromkeys(application_ids))
+    recruiter_ids   = list(dict.fromkeys(recruiter_ids))
+    if not application_ids or not recruiter_ids:
+        return []
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_conn()
+    c = conn.cursor()
+    try:
+        c.execute("""
+            SELECT application_id, recruiter_id FROM application_recruiters
+            WHERE application_id = ANY(?)
+        """, (application_ids,))
+        linked = {app_id: set() for app_id in application_ids}
+        for r in c.fetchall():
+            linked[r["application_id"]].add(r["recruiter_id"])
+
+        allowed, new_rows = [], []
+        for app_id in application_ids:
+            existing = linked[app_id]
+            count    = len(existing)
+            for recruiter_id in recruiter_ids:
+                if count >= MAX_RECRUITERS_PER_APPLICATION:
+                    break  # cap reached — silent skip
+                allowed.append((app_id, recruiter_id))
+                if recruiter_id not in existing:
+                    new_rows.append((app_id, recruiter_id))
+                    count += 1
+
+        if new_rows:
+            c.execute(
+                "INSERT INTO application_recruiters (application_id, recruiter_id) VALUES "
+                + ", ".join(["(?, ?)"] * len(new_rows))
+                + " ON CONFLICT DO NOTHING",
+                [v for row in new_rows for v in row],
+            )
+        if own_conn:
+            conn.commit()
+        return allowed
+    finally:
+        if own_conn:
+            conn.close()
 
 
 def get_recruiters_for_application(application_id):
@@ -42,46 +104,50 @@ def get_recruiters_for_application(application_id):
         INNER JOIN application_recruiters ar ON ar.recruiter_id = r.id
         WHERE ar.application_id = ? AND r.recruiter_status = 'active'
     """, (application_id,))
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
 
 def get_unique_companies_needing_scraping(min_recruiters=2, user_id: int | None = None):
-    """Return unique company names with fewer than min_recruiters active recruiters."""
+    """
+    Return unique company names with an active application that has fewer
+    than min_recruiters active recruiters, oldest application first.
+    """
     conn = get_conn()
     c = conn.cursor()
+    # Per-application counts, then one row per company in SQL
     if user_id is not None:
         c.execute("""
-            SELECT a.id, a.company, COUNT(r.id) as recruiter_count
-            FROM applications a
-            LEFT JOIN application_recruiters ar ON ar.application_id = a.id
-            LEFT JOIN recruiters r ON r.id = ar.recruiter_id AND r.recruiter_status = 'active'
-            WHERE a.status = 'active' AND a.user_id = ?
-            GROUP BY a.id, a.company
-            HAVING COUNT(r.id) < ?
-            ORDER BY a.applied_date ASC
+            SELECT company FROM (
+                SELECT a.company, a.applied_date
+                FROM applications a
+                LEFT JOIN application_recruiters ar ON ar.application_id = a.id
+                LEFT JOIN recruiters r ON r.id = ar.recruiter_id AND r.recruiter_status = 'active'
+                WHERE a.status = 'active' AND a.user_id = ?
+                GROUP BY a.id, a.company, a.applied_date
+                HAVING COUNT(r.id) < ?
+            ) under_stocked
+            GROUP BY company
+            ORDER BY MIN(applied_date) ASC
         """, (user_id, min_recruiters))
     else:
         c.execute("""
-            SELECT a.id, a.company, COUNT(r.id) as recruiter_count
-            FROM applications a
-            LEFT JOIN application_recruiters ar ON ar.application_id = a.id
-            LEFT JOIN recruiters r ON r.id = ar.recruiter_id AND r.recruiter_status = 'active'
-            WHERE a.status = 'active'
-            GROUP BY a.id, a.company
-            HAVING COUNT(r.id) < ?
-            ORDER BY a.applied_date ASC
+            SELECT company FROM (
+                SELECT a.company, a.applied_date
+                FROM applications a
+                LEFT JOIN application_recruiters ar ON ar.application_id = a.id
+                LEFT JOIN recruiters r ON r.id = ar.recruiter_id AND r.recruiter_status = 'active'
+                WHERE a.status = 'active'
+                GROUP BY a.id, a.company, a.applied_date
+                HAVING COUNT(r.id) < ?
+            ) under_stocked
+            GROUP BY company
+            ORDER BY MIN(applied_date) ASC
         """, (min_recruiters,))
-    rows = c.fetchall()
+    unique = [row["company"] for row in c.fetchall()]
     conn.close()
 
-    seen = set()
-    unique = []
-    for row in rows:
-        if row["company"] not in seen:
-            seen.add(row["company"])
-            unique.append(row["company"])
     logger.debug("get_unique_companies_needing_scraping user_id=%s → %d companies",
                  user_id, len(unique))
     return unique
@@ -126,11 +192,65 @@ def get_companies_needing_more_recruiters(user_id: int | None = None):
             HAVING COUNT(DISTINCT r.id) < ?
             ORDER BY shortage DESC, latest_applied DESC
         """, (MAX_CONTACTS_HARD_CAP, MAX_CONTACTS_HARD_CAP))
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
 
+def company_needs_scraping(company, min_recruiters=2, user_id: int | None = None):
+    """
+    Single-company form of get_unique_companies_needing_scraping: True if
+    one of company's active applications (user_id's, if given) still has
+    fewer than min_recruiters active recruiters.
+    """
+    params = (company,) if user_id is None else (company, user_id)
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("""
+        SELECT 1
+        FROM applications a
+        LEFT JOIN application_recruiters ar ON ar.application_id = a.id
+        LEFT JOIN recruiters r ON r.id = ar.recruiter_id AND r.recruiter_status = 'active'
+        WHERE a.status = 'active' AND a.company = ?""" +
+        ("" if user_id is None else " AND a.user_id = ?") + """
+        GROUP BY a.id
+        HAVING COUNT(r.id) < ?
+        LIMIT 1
+    """, params + (min_recruiters,))
+    row = c.fetchone()
+    conn.close()
+    return row is not None
+
+
+def get_company_recruiter_shortage(company, user_id: int | None = None):
+    """
+    Single-company form of get_companies_needing_more_recruiters: its row
+    (company, latest_applied, recruiter_count, shortage), or None if the
+    company already has MAX_CONTACTS_HARD_CAP active recruiters.
+    """
+    params = (company,) if user_id is None else (company, user_id)
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("""
+        SELECT
+            a.company,
+            MAX(a.applied_date) as latest_applied,
+            COUNT(DISTINCT r.id) as recruiter_count,
+            (? - COUNT(DISTINCT r.id)) as shortage
+        FROM applications a
+        LEFT JOIN application_recruiters ar ON ar.application_id = a.id
+        LEFT JOIN recruiters r ON r.id = ar.recruiter_id
+            AND r.recruiter_status = 'active'
+        WHERE a.status = 'active' AND a.company = ?""" +
+        ("" if user_id is None else " AND a.user_id = ?") + """
+        GROUP BY a.company
+        HAVING COUNT(DISTINCT r.id) < ?
+    """, (MAX_CONTACTS_HARD_CAP,) + params + (MAX_CONTACTS_HARD_CAP,))
+    row = c.fetchone()
+    conn.close()
+    return row
+
+
 def link_top_recruiters_for_company(application_id, company):
     """
     Link best recruiters for a company to an application.
@@ -21,37 +21,101 @@ def add_application(company, job_url, job_title=None, applied_date=None,
     c = conn.cursor()
     status = status_override or "active"
     try:
-        # RETURNING id replaces c.lastrowid (not available with psycopg2).
+        # DO UPDATE backfills a missing expected_domain and makes RETURNING
+        # yield the existing row too; xmax = 0 only for a freshly inserted row.
         c.execute("""
             INSERT INTO applications (company, job_url, job_title, applied_date,
                                       expected_domain, status, user_id)
             VALUES (?, ?, ?, ?, ?, ?, ?)
-            RETURNING id
+            ON CONFLICT (user_id, job_url) DO UPDATE SET
+                expected_domain = COALESCE(NULLIF(applications.expected_domain, ''),
+                                           EXCLUDED.expected_domain,
+                                           applications.expected_domain)
+            RETURNING id, (xmax = 0) AS created
         """, (company, job_url, job_title,
               applied_date or datetime.now().strftime("%Y-%m-%d"),
               expected_domain, status, user_id))
         row = c.fetchone()
         conn.commit()
-        return row["id"], True
-    except psycopg2.errors.UniqueViolation:
+        return row["id"], row["created"]
+    except Exception:
         conn.rollback()
-        c.execute("SELECT id, expected_domain FROM applications WHERE job_url = ? AND user_id = ?",
-                  (job_url, user_id))
-        row = c.fetchone()
-        if not row:
-            return (None, False)
-        # Backfill expected_domain if existing row has NULL and we have a value
-        if expected_domain and not row["expected_domain"]:
-            c.execute(
-                "UPDATE applications SET expected_domain = ? WHERE id = ?",
-                (expected_domain, row["id"])
-            )
-            conn.commit()
-        return (row["id"], False)
+        raise
     finally:
         conn.close()
 
 
+def add_applications(rows):
+    """
+    Insert many applications in one statement.
+    rows: dicts with company, job_url and optional job_title, applied_date,
+    expected_domain, user_id (default 1) — the add_application arguments.
+    Returns [(application_id, created)] in the order of rows, with the same
+    meaning as add_application (a URL repeated within rows is created once).
+    """
+    if not rows:
+        return []
+    today  = datetime.now().strftime("%Y-%m-%d")
+    keys   = [(row.get("user_id", 1), row["job_url"]) for row in rows]
+    values = {}
+    for key, row in zip(keys, rows):
+        values.setdefault(key, (
+            row["company"], row["job_url"], row.get("job_title"),
+            row.get("applied_date") or today, row.get("expected_domain"),
+            "active", key[0],
+        ))
+
+    conn = get_conn()
+    c = conn.cursor()
+    try:
+        c.execute(
+            """
+            INSERT INTO applications (company, job_url, job_title, applied_date,
+                                      expected_domain, status, user_id)
+            VALUES """ + ", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * len(values)) + """
+            ON CONFLICT (user_id, job_url) DO NOTHING
+            RETURNING id, user_id, job_url
+            """,
+            [v for row in values.values() for v in row],
+        )
+        created = {(r["user_id"], r["job_url"]): r["id"] for r in c.fetchall()}
+
+        existing = {}
+        missing  = [key for key in values if key not in created]
+        if missing:
+            c.execute("""
+                SELECT id, user_id, job_url, expected_domain FROM applications
+                WHERE job_url = ANY(?)
+            """, ([job_url for _, job_url in missing],))
+            wanted = set(missing)
+            for r in c.fetchall():
+                key = (r["user_id"], r["job_url"])
+                if key in wanted:
+                    existing[key] = r["id"]
+                    # Backfill expected_domain, as add_application does
+                    expected_domain = values[key][4]
+                    if expected_domain and not r["expected_domain"]:
+                        c.execute(
+                            "UPDATE applications SET expected_domain = ? WHERE id = ?",
+                            (expected_domain, r["id"]),
+                        )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    result, seen = [], set()
+    for key in keys:
+        if key in created and key not in seen:
+            result.append((created[key], True))
+        else:
+            result.append((created.get(key) or existing.get(key), False))
+        seen.add(key)
+    return result
+
+
 def get_all_active_applications(user_id: int | None = None):
     conn = get_conn()
     c = conn.cursor()
@@ -67,7 +131,7 @@ def get_all_active_applications(user_id: int | None = None):
             WHERE status = 'active'
             ORDER BY applied_date ASC
         """)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     logger.debug("get_all_active_applications user_id=%s → %d rows", user_id, len(rows))
     return rows
@@ -1,10 +1,18 @@
 # db/cache.py — AI cache and job description cache helpers
 
 import time
+import zlib
 import hashlib
 from datetime import datetime, timedelta
 
-from db.connection import get_conn
+try:
+    import zstandard as _zstd
+    _USE_ZSTD = True
+except ImportError:
+    _zstd     = None
+    _USE_ZSTD = False
+
+from db.connection import async_commit, get_conn
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -18,8 +26,12 @@ def get_ai_cache(cache_key):
     """Return cached AI content if exists and not expired. Returns dict or None."""
     conn = get_conn()
     c = conn.cursor()
+    # Expiry is checked in the same indexed probe that loads the content,
+    # and only the six content columns are fetched.
     c.execute("""
-        SELECT * FROM ai_cache
+        SELECT subject_initial, subject_followup1, subject_followup2,
+               intro, followup1, followup2
+        FROM ai_cache
         WHERE cache_key = %s
         AND expires_at > CURRENT_TIMESTAMP
     """, (cache_key,))
@@ -27,14 +39,7 @@ def get_ai_cache(cache_key):
     conn.close()
     if not row:
         return None
-    return {
-        "subject_initial":   row["subject_initial"],
-        "subject_followup1": row["subject_followup1"],
-        "subject_followup2": row["subject_followup2"],
-        "intro":     row["intro"],
-        "followup1": row["followup1"],
-        "followup2": row["followup2"],
-    }
+    return dict(row)
 
 
 def save_ai_cache(cache_key, company, job_title, data, ttl_days=21):
@@ -86,7 +91,7 @@ def get_applications_missing_ai_cache(user_id: int | None = None):
             AND NOT EXISTS (
                 SELECT 1 FROM ai_cache ac
                 WHERE ac.company = a.company
-                AND COALESCE(ac.job_title, '') = COALESCE(a.job_title, '')
+                AND ac.job_title = COALESCE(a.job_title, '')
                 AND ac.expires_at > CURRENT_TIMESTAMP
             )
             ORDER BY a.applied_date DESC
@@ -99,12 +104,12 @@ def get_applications_missing_ai_cache(user_id: int | None = None):
             AND NOT EXISTS (
                 SELECT 1 FROM ai_cache ac
                 WHERE ac.company = a.company
-                AND COALESCE(ac.job_title, '') = COALESCE(a.job_title, '')
+                AND ac.job_title = COALESCE(a.job_title, '')
                 AND ac.expires_at > CURRENT_TIMESTAMP
             )
             ORDER BY a.applied_date DESC
         """)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     logger.debug("get_applications_missing_ai_cache user_id=%s → %d apps", user_id, len(rows))
     return rows
@@ -114,39 +119,109 @@ def get_applications_missing_ai_cache(user_id: int | None = None):
 # JOB CACHE
 # ─────────────────────────────────────────
 
+# Frame magic of a zstd blob; anything else is a zlib blob (older rows, or
+# rows written without zstandard installed)
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# UnicodeDecodeError is a ValueError
+_JOB_DECODE_ERRORS = (zlib.error, ValueError)
+
+if _USE_ZSTD:
+    _ZSTD_COMPRESSOR   = _zstd.ZstdCompressor(level=6)
+    _ZSTD_DECOMPRESSOR = _zstd.ZstdDecompressor()
+    _JOB_DECODE_ERRORS += (_zstd.ZstdError,)
+
+
 def _hash_url(url):
     return hashlib.sha256(url.encode()).hexdigest()
 
 
+def _compress_job(text):
+    data = text.encode()
+    if _USE_ZSTD:
+        return _ZSTD_COMPRESSOR.compress(data)
+    return zlib.compress(data)
+
+
+def _decompress_job(raw):
+    """Decode a jobs.content blob, zstd or legacy zlib. Raises one of _JOB_DECODE_ERRORS."""
+    if raw[:4] == _ZSTD_MAGIC:
+        if not _USE_ZSTD:
+            raise ValueError("zstd-compressed job but zstandard is not installed")
+        return _ZSTD_DECOMPRESSOR.decompress(raw).decode("utf-8")
+    return zlib.decompress(raw).decode("utf-8")
+
+
 def save_job(url, content):
     """Compress and save job description. Replaces existing entry."""
-    import zlib
     conn = get_conn()
     c = conn.cursor()
-    compressed = zlib.compress(content.encode())
+    async_commit(conn)  # a lost row is just re-scraped
+    compressed = _compress_job(content)
     # ON CONFLICT(url_hash) DO UPDATE replaces INSERT OR REPLACE (SQLite).
     # content is stored as BYTEA in PostgreSQL — psycopg2 handles bytes→bytea
     # automatically when the column type is bytea.
     c.execute("""
-        INSERT INTO jobs (url_hash, job_url, content, created_at)
-        VALUES (%s, %s, %s, %s)
+        INSERT INTO jobs (url_hash, job_url, content, created_at, status)
+        VALUES (%s, %s, %s, %s, 'ok')
         ON CONFLICT(url_hash) DO UPDATE SET
             job_url    = EXCLUDED.job_url,
             content    = EXCLUDED.content,
-            created_at = EXCLUDED.created_at
+            created_at = EXCLUDED.created_at,
+            status     = EXCLUDED.status
     """, (_hash_url(url), url, compressed, int(time.time())))
     conn.commit()
     conn.close()
 
 
+def save_job_failure(url, status):
+    """Record an unsuccessful scrape of url ('failed' or 'too_short')."""
+    conn = get_conn()
+    c = conn.cursor()
+    async_commit(conn)
+    c.execute("""
+        INSERT INTO jobs (url_hash, job_url, content, created_at, status)
+        VALUES (%s, %s, NULL, %s, %s)
+        ON CONFLICT(url_hash) DO UPDATE SET
+            job_url    = EXCLUDED.job_url,
+            content    = NULL,
+            created_at = EXCLUDED.created_at,
+            status     = EXCLUDED.status
+    """, (_hash_url(url), url, int(time.time()), status))
+    conn.commit()
+    conn.close()
+
+
+def get_job_failure(url):
+    """
+    Return the status of a scrape failure still within its TTL, else None.
+    'too_short' is deterministic and held for JOB_SCRAPE_FAILURE_TTL_HOURS;
+    'failed' may be a transient network error, so it lapses after
+    JOB_SCRAPE_ERROR_TTL_HOURS.
+    """
+    from config import JOB_SCRAPE_FAILURE_TTL_HOURS, JOB_SCRAPE_ERROR_TTL_HOURS
+    now = int(time.time())
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("""
+        SELECT status FROM jobs
+        WHERE url_hash = %s AND status <> 'ok'
+          AND created_at > CASE status WHEN 'too_short' THEN %s ELSE %s END
+    """, (_hash_url(url),
+          now - JOB_SCRAPE_FAILURE_TTL_HOURS * 3600,
+          now - JOB_SCRAPE_ERROR_TTL_HOURS * 3600))
+    row = c.fetchone()
+    conn.close()
+    return row["status"] if row else None
+
+
 def get_job(url):
     """Return decompressed job description or None if missing/expired."""
-    import zlib
     from config import RETENTION_JOB_CACHE
     conn = get_conn()
     c = conn.cursor()
     c.execute("""
-        SELECT content, created_at FROM jobs WHERE url_hash = %s
+        SELECT content, created_at FROM jobs WHERE url_hash = %s AND status = 'ok'
     """, (_hash_url(url),))
     row = c.fetchone()
     conn.close()
@@ -163,8 +238,8 @@ def get_job(url):
     try:
         # psycopg2 returns bytea columns as memoryview — convert to bytes first.
         raw = bytes(content) if isinstance(content, memoryview) else content
-        return zlib.decompress(raw).decode("utf-8")
-    except (zlib.error, UnicodeDecodeError):
+        return _decompress_job(raw)
+    except _JOB_DECODE_ERRORS:
         delete_job(url)
         return None
 
@@ -178,6 +253,6 @@ def delete_job(url):
 
 
 def init_job_cache():
-    """Alias for init_db — ensures jobs table exists."""
-    from db.schema import init_db
-    init_db()
+    """Ensures jobs table exists — init_db() at most once per process."""
+    from db.schema import ensure_db
+    ensure_db()
@@ -20,6 +20,9 @@
 import os
 import re
 import threading
+import time
+import weakref
+from functools import lru_cache
 
 import psycopg2
 import psycopg2.extras
@@ -75,6 +78,14 @@ TPM_LIMITS: dict = {
 _pool: "psycopg2.pool.ThreadedConnectionPool | None" = None
 _pool_lock: threading.Lock = threading.Lock()
 
+# A connection handed back to the pool less than this many seconds ago is
+# reused without the ROLLBACK liveness probe: server/TCP idle drops take far
+# longer, and putconn() already rolled back any open transaction.
+_PROBE_AFTER_IDLE_SECS: float = 30.0
+# raw connection → time.monotonic() at putconn. Weakly keyed, so an entry goes
+# away with the connection once the pool discards it (e.g. above minconn).
+_last_returned: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 
 def _get_pool() -> "psycopg2.pool.ThreadedConnectionPool":
     """
@@ -100,6 +111,9 @@ def _get_pool() -> "psycopg2.pool.ThreadedConnectionPool":
 _PLACEHOLDER_RE = re.compile(r'\?')
 
 
+# Helpers run the same SQL text over and over; memoizing keeps the rewrite
+# off the per-call path. Bounded, since bulk inserts build per-size VALUES lists.
+@lru_cache(maxsize=1024)
 def _adapt_sql(sql: str) -> str:
     """
     Convert SQLite ? placeholders to psycopg2 %s placeholders.
@@ -125,7 +139,8 @@ class _Cursor:
     - ? placeholders auto-converted to %s
     - .lastrowid is NOT supported — use RETURNING id + .fetchone()["id"]
     - .rowcount works identically
-    - .fetchone() / .fetchall() return RealDictRow objects (dict-like)
+    - .fetchone() / .fetchall() return RealDictRow objects — dict subclasses,
+      so read helpers can return them as-is without a dict(r) copy per row
     """
     __slots__ = ("_cur",)
 
@@ -219,6 +234,10 @@ class _Connection:
         if not self._returned:
             self._returned = True
             broken = getattr(self._conn, "closed", 0) != 0
+            if broken:
+                _last_returned.pop(self._conn, None)
+            else:
+                _last_returned[self._conn] = time.monotonic()
             self._pool.putconn(self._conn, close=broken)
 
     def __del__(self):
@@ -263,7 +282,9 @@ def get_conn() -> _Connection:
 
     Probes each borrowed connection with ROLLBACK before returning it so that
     connections dropped by the server while idle (TCP timeout / server restart)
-    are detected and replaced rather than handed to callers as stale.
+    are detected and replaced rather than handed to callers as stale. The
+    probe is skipped for connections returned within _PROBE_AFTER_IDLE_SECS,
+    which saves a server round-trip on back-to-back helper calls.
     """
     pool = _get_pool()
     for _attempt in range(2):
@@ -271,14 +292,17 @@ def get_conn() -> _Connection:
         if raw.closed:
             pool.putconn(raw, close=True)
             continue
-        try:
-            raw.reset()  # sends ROLLBACK; raises OperationalError if connection is dead
-        except psycopg2.Error:
+        returned_at = _last_returned.get(raw)
+        if returned_at is None or time.monotonic() - returned_at > _PROBE_AFTER_IDLE_SECS:
             try:
-                pool.putconn(raw, close=True)
+                raw.reset()  # sends ROLLBACK; raises OperationalError if connection is dead
             except psycopg2.Error:
-                pass
-            continue
+                _last_returned.pop(raw, None)
+                try:
+                    pool.putconn(raw, close=True)
+                except psycopg2.Error:
+                    pass
+                continue
         try:
             raw.autocommit = False
             return _Connection(raw, pool)
@@ -299,3 +323,16 @@ def get_conn() -> _Connection:
         except Exception:
             pass
         raise
+
+
+def async_commit(conn) -> None:
+    """
+    Let the current transaction commit without waiting for its WAL flush
+    (SET LOCAL synchronous_commit = off — Postgres' analogue of SQLite's
+    synchronous=NORMAL). A server crash can lose the last few hundred ms of
+    such commits but never corrupts or half-applies them, so use it only
+    for caches and stats that are cheap to regenerate (e.g. the scraped JD
+    cache). Never for recruiters, links or CareerShift credit counters —
+    losing those means spending credits again. Resets automatically at commit.
+    """
+    conn.execute("SET LOCAL synchronous_commit TO OFF")
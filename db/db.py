@@ -6,7 +6,7 @@ External code continues to import from db.db unchanged.
 
 Submodules:
     db.connection             → get_conn, DB_FILE, DAILY_LIMITS
-    db.schema                 → init_db
+    db.schema                 → init_db, ensure_db
     db.users                  → user record accessors
     db.applications           → application helpers
     db.recruiters             → recruiter helpers
@@ -27,7 +27,7 @@ from db.connection import get_conn, DB_FILE, DAILY_LIMITS
 # ─────────────────────────────────────────
 # SCHEMA
 # ─────────────────────────────────────────
-from db.schema import init_db
+from db.schema import init_db, ensure_db
 
 # ─────────────────────────────────────────
 # USERS
@@ -45,6 +45,7 @@ from db.users import (
 # ─────────────────────────────────────────
 from db.applications import (
     add_application,
+    add_applications,
     get_all_active_applications,
     get_application_by_id,
     mark_application_exhausted,
@@ -61,8 +62,11 @@ from db.applications import (
 # ─────────────────────────────────────────
 from db.recruiters import (
     get_recruiters_by_company,
+    get_recruiters_for_companies,
     add_recruiter,
+    add_recruiters,
     update_recruiter,
+    touch_recruiters,
     get_recruiters_by_tier,
     mark_recruiter_inactive,
     recruiter_email_exists,
@@ -77,9 +81,12 @@ from db.recruiters import (
 # ─────────────────────────────────────────
 from db.application_recruiters import (
     link_recruiter_to_application,
+    link_recruiters_to_applications,
     get_recruiters_for_application,
     get_unique_companies_needing_scraping,
     get_companies_needing_more_recruiters,
+    company_needs_scraping,
+    get_company_recruiter_shortage,
     link_top_recruiters_for_company,
     get_sendable_count_for_date,
 )
@@ -105,7 +112,9 @@ from db.cache import (
     save_ai_cache,
     get_applications_missing_ai_cache,
     save_job,
+    save_job_failure,
     get_job,
+    get_job_failure,
     delete_job,
     init_job_cache,
 )
@@ -118,6 +127,7 @@ from db.quota import (
     increment_quota_used,
     get_remaining_quota,
     can_call,
+    daily_limit_reached,
     increment_usage,
     all_models_exhausted,
 )
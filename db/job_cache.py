@@ -5,6 +5,10 @@ All data stored in recruiter_pipeline.db (jobs table).
 This file is a thin wrapper so job_fetcher.py imports stay clean.
 """
 
-from db.db import save_job, get_job, delete_job, init_job_cache as init_cache
+from db.db import (
+    save_job, save_job_failure, get_job, get_job_failure, delete_job,
+    init_job_cache as init_cache,
+)
 
-__all__ = ["init_cache", "save_job", "get_job", "delete_job"]
\ No newline at end of file
+__all__ = ["init_cache", "save_job", "save_job_failure", "get_job",
+           "get_job_failure", "delete_job"]
\ No newline at end of file
@@ -123,7 +123,7 @@ def get_pending_outreach(user_id: int | None = None):
             AND r.recruiter_status = 'active'
             ORDER BY o.scheduled_for ASC
         """)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     logger.debug("get_pending_outreach user_id=%s → %d rows", user_id, len(rows))
     return rows
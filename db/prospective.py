@@ -144,7 +144,7 @@ def get_pending_prospective(limit=None):
     if limit:
         query += f" LIMIT {int(limit)}"
     c.execute(query)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
@@ -167,7 +167,7 @@ def get_prospective_companies(status=None):
             SELECT * FROM prospective_companies
             ORDER BY priority DESC, created_at ASC
         """)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
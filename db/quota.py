@@ -143,8 +143,8 @@ def _get_today():
     return datetime.now().strftime("%Y-%m-%d")
 
 
-def can_call(model, user_id: int = 1, use_case: str = "email_content"):
-    """Return True if model is within both daily and RPM limits for user_id/use_case."""
+def daily_limit_reached(model, user_id: int = 1, use_case: str = "email_content"):
+    """Return True if today's count for model/user_id/use_case is at DAILY_LIMITS[model]."""
     conn = get_conn()
     c = conn.cursor()
     today = _get_today()
@@ -155,10 +155,13 @@ def can_call(model, user_id: int = 1, use_case: str = "email_content"):
     )
     row = c.fetchone()
     current = row["count"] if row else 0
-    limit = DAILY_LIMITS.get(model, 0)
     conn.close()
+    return current >= DAILY_LIMITS.get(model, 0)
+
 
-    if current >= limit:
+def can_call(model, user_id: int = 1, use_case: str = "email_content"):
+    """Return True if model is within both daily and RPM limits for user_id/use_case."""
+    if daily_limit_reached(model, user_id=user_id, use_case=use_case):
         return False
 
     if not within_rpm(model):
@@ -5,12 +5,13 @@ All data stored in recruiter_pipeline.db (model_usage table).
 This file is a thin wrapper so ai_full_personalizer.py imports stay clean.
 """
 
-from db.db import can_call, increment_usage, all_models_exhausted
+from db.db import can_call, daily_limit_reached, increment_usage, all_models_exhausted
 from db.quota import within_rpm, within_tpm, tpm_wait_seconds, record_tpm
 
 __all__ = [
     "all_models_exhausted",
     "can_call",
+    "daily_limit_reached",
     "increment_usage",
     "record_tpm",
     "tpm_wait_seconds",
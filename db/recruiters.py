@@ -17,31 +17,97 @@ def get_recruiters_by_company(company):
         SELECT * FROM recruiters
         WHERE company = ? AND recruiter_status = 'active'
     """, (company,))
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
     return rows
 
 
+def get_recruiters_for_companies(companies):
+    """
+    Active recruiters for many companies in one query.
+    Returns {company: [recruiter, ...]} with an entry for every company asked for.
+    """
+    by_company = {company: [] for company in companies}
+    if not by_company:
+        return by_company
+    conn = get_conn()
+    c = conn.cursor()
+    c.execute("""
+        SELECT * FROM recruiters
+        WHERE company = ANY(?) AND recruiter_status = 'active'
+    """, (list(by_company),))
+    for r in c.fetchall():
+        by_company[r["company"]].append(r)
+    conn.close()
+    return by_company
+
+
 def add_recruiter(company, name, position, email, confidence, found_by_user_id: int = 1):
     """Insert recruiter at company level. Returns new id or existing id."""
     conn = get_conn()
     c = conn.cursor()
     try:
-        # RETURNING id replaces c.lastrowid (not available with psycopg2).
         c.execute("""
             INSERT INTO recruiters (company, name, position, email, confidence,
                                     verified_at, found_by_user_id)
             VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+            ON CONFLICT (email) DO NOTHING
             RETURNING id
         """, (company, name, position, email, confidence, found_by_user_id))
         row = c.fetchone()
+        if row is None:
+            # Separate statement: it sees a row committed by a concurrent
+            # insert of the same email, which the INSERT's snapshot cannot
+            c.execute("SELECT id FROM recruiters WHERE email = ?", (email,))
+            row = c.fetchone()
         conn.commit()
-        return row["id"]
-    except psycopg2.errors.UniqueViolation:
-        conn.rollback()
-        c.execute("SELECT id FROM recruiters WHERE email = ?", (email,))
-        row = c.fetchone()
         return row["id"] if row else None
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def add_recruiters(company, contacts, found_by_user_id: int = 1):
+    """
+    Insert scraped contacts for company in one statement.
+    Returns {email: (recruiter_id, created)} — created is False for emails
+    already in the table, whose rows are left untouched (as add_recruiter).
+    """
+    rows = {}
+    for contact in contacts:
+        rows.setdefault(contact["email"], (
+            company, contact["name"], contact["position"], contact["email"],
+            contact["confidence"], found_by_user_id,
+        ))
+    if not rows:
+        return {}
+
+    conn = get_conn()
+    c = conn.cursor()
+    try:
+        c.execute(
+            """
+            INSERT INTO recruiters (company, name, position, email, confidence,
+                                    verified_at, found_by_user_id)
+            VALUES """ + ", ".join(["(?, ?, ?, ?, ?, CURRENT_TIMESTAMP, ?)"] * len(rows)) + """
+            ON CONFLICT (email) DO NOTHING
+            RETURNING id, email
+            """,
+            [v for row in rows.values() for v in row],
+        )
+        result = {r["email"]: (r["id"], True) for r in c.fetchall()}
+
+        existing = [email for email in rows if email not in result]
+        if existing:
+            c.execute("SELECT id, email FROM recruiters WHERE email = ANY(?)", (existing,))
+            result.update({r["email"]: (r["id"], False) for r in c.fetchall()})
+        conn.commit()
+        return result
+    except Exception:
+        conn.rollback()
+        raise
     finally:
         conn.close()
 
@@ -91,6 +157,23 @@ def update_recruiter(recruiter_id, name=None, position=None,
         conn.close()
 
 
+def touch_recruiters(recruiter_ids):
+    """Stamp verified_at = now on every recruiter in recruiter_ids in one statement."""
+    if not recruiter_ids:
+        return 0
+    conn = get_conn()
+    c = conn.cursor()
+    try:
+        c.execute("""
+            UPDATE recruiters SET verified_at = CURRENT_TIMESTAMP
+            WHERE id = ANY(?)
+        """, (list(recruiter_ids),))
+        conn.commit()
+        return c.rowcount
+    finally:
+        conn.close()
+
+
 def get_recruiters_by_tier(days_tier1=30, days_tier2=60, found_by_user_id=None):
     """
     Return all active recruiters grouped by verification tier.
@@ -113,7 +196,7 @@ def get_recruiters_by_tier(days_tier1=30, days_tier2=60, found_by_user_id=None):
             WHERE recruiter_status = 'active'
             ORDER BY verified_at ASC
         """)
-    rows = [dict(r) for r in c.fetchall()]
+    rows = c.fetchall()
     conn.close()
 
     tier1, tier2, tier3 = [], [], []
@@ -38,6 +38,9 @@ from config import (
     DIAGNOSTICS_AUTO_RESOLVED_DAYS,
 )
 
+# Set once init_db() has completed in this process — see ensure_db()
+_initialized: bool = False
+
 
 # ─────────────────────────────────────────
 # CLEANUP HELPERS
@@ -348,6 +351,12 @@ def init_db():
             created_at        TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
+    # get_recruiters_by_company / get_recruiters_for_companies only read active rows
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_recruiters_company_active
+          ON recruiters(company)
+          WHERE recruiter_status = 'active'
+    """)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS application_recruiters (
@@ -372,6 +381,17 @@ def init_db():
             created_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
     """)
+    # get_pending_outreach: due, unreplied pending rows in scheduled_for order
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_pending
+          ON outreach(scheduled_for)
+          WHERE status = 'pending' AND replied = 0
+    """)
+    # has_pending_or_sent_outreach and the other per-(recruiter, application) probes
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_outreach_recruiter_application
+          ON outreach(recruiter_id, application_id, status)
+    """)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS careershift_quota (
@@ -399,6 +419,17 @@ def init_db():
             expires_at        TIMESTAMP NOT NULL
         )
     """)
+    # cache_key lookups use the UNIQUE btree; this one serves the per-application
+    # NOT EXISTS probe in get_applications_missing_ai_cache (company + expiry).
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ai_cache_company_expires
+          ON ai_cache(company, expires_at)
+    """)
+    # Expiry-only range delete in _cleanup_expired_ai_cache
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_ai_cache_expires
+          ON ai_cache(expires_at)
+    """)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS jobs (
@@ -408,6 +439,17 @@ def init_db():
             created_at BIGINT
         )
     """)
+    # 'ok' rows hold a description; 'failed' / 'too_short' rows (content NULL)
+    # remember a recent unsuccessful scrape so it is not retried right away
+    c.execute("""
+        ALTER TABLE jobs
+        ADD COLUMN IF NOT EXISTS status TEXT NOT NULL DEFAULT 'ok'
+    """)
+    # Range delete in _cleanup_expired_jobs
+    c.execute("""
+        CREATE INDEX IF NOT EXISTS idx_jobs_created_at
+          ON jobs(created_at)
+    """)
 
     c.execute("""
         CREATE TABLE IF NOT EXISTS model_usage (
@@ -1584,4 +1626,18 @@ def init_db():
 
     conn.commit()
     conn.close()
+    global _initialized
+    _initialized = True
     print("[OK] Database initialized: PostgreSQL recruiter_pipeline")
+
+
+def ensure_db():
+    """
+    Run init_db() unless it already completed in this process.
+
+    For import-time and per-call setup (job cache, form sync) that only needs
+    the schema to exist; entry points that want the cleanup pass on every run
+    keep calling init_db() directly.
+    """
+    if not _initialized:
+        init_db()
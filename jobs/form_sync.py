@@ -3,25 +3,29 @@ jobs/form_sync.py — Syncs Google Form responses to SQLite applications table.
 
 Flow:
     1. Read all rows from Google Sheet (Form_Responses tab)
-    2. For each unprocessed row:
-       a. Parse fields (company, job_url, job_title, applied_date)
-       b. Insert into applications table
-       c. Scrape job description → store in jobs table
-       d. Delete row from sheet (keeps Drive clean)
-    3. Skip rows with missing required fields
+    2. Parse and validate each row (company, job_url, job_title, applied_date)
+    3. Insert all valid rows into applications table in one statement
+    4. Scrape job descriptions of new rows in parallel → store in jobs table
+    5. Delete processed rows from sheet (keeps Drive clean)
+    6. Skip rows with missing required fields
 """
 
 import os
 import re
-from datetime import datetime
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import date, datetime
 
 import gspread
 from google.oauth2.service_account import Credentials
 from dotenv import load_dotenv
 
 from logger import get_logger
-from db.db import init_db, add_application
+from db.db import ensure_db, add_applications
 from jobs.job_fetcher import fetch_job_description
+from jobs.job_scraper import close_browser
 
 logger = get_logger(__name__)
 
@@ -31,6 +35,17 @@ SHEET_ID         = os.getenv("GOOGLE_SHEET_ID")
 CREDENTIALS_FILE = os.path.join(os.path.dirname(__file__), "..", "credentials.json")
 SHEET_NAME       = "Responses"
 
+# Job descriptions for newly imported rows are scraped this many at a time.
+# Each scrape is network/browser-bound, so threads overlap the waits.
+SCRAPE_MAX_WORKERS = int(os.getenv("FORM_SYNC_SCRAPE_WORKERS", "4"))
+
+# Sheets API errors worth retrying (quota + transient server errors)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+RETRY_MAX_ATTEMPTS = 6
+RETRY_MAX_DELAY    = 64  # seconds
+# Errors that suggest the cached client/worksheet handle is no longer valid
+REAUTH_STATUS_CODES = {401, 403, 404}
+
 # Google API scopes needed
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -45,6 +60,7 @@ COL_JOB_URL      = 2
 COL_JOB_TITLE    = 3
 COL_APPLIED_DATE = 4
 COL_USER_NAME    = 5
+DATA_RANGE       = "A2:F"
 
 # Maps Google Form user name values → pipeline user_id.
 # Loaded from USER_NAME_MAP env var (JSON string) so real names are never
@@ -54,39 +70,83 @@ import json as _json
 _USER_NAME_MAP: dict[str, int] = _json.loads(os.environ.get('USER_NAME_MAP', '{}'))
 
 
+def _retry(fn, *args, **kwargs):
+    """
+    Call a gspread function, retrying quota (429) and 5xx APIErrors with
+    truncated exponential backoff plus jitter. Other errors propagate.
+    """
+    for attempt in range(RETRY_MAX_ATTEMPTS):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            status = getattr(e.response, "status_code", None)
+            if status in REAUTH_STATUS_CODES:
+                _cached_worksheet.cache_clear()
+            if status not in RETRY_STATUS_CODES or attempt == RETRY_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(2 ** attempt + random.random(), RETRY_MAX_DELAY)
+            logger.warning("Sheets API %s on %s — retrying in %.1fs (attempt %d/%d)",
+                           status, getattr(fn, "__name__", fn), delay,
+                           attempt + 1, RETRY_MAX_ATTEMPTS)
+            time.sleep(delay)
+
+
 def _get_sheet():
-    """Authenticate and return the Google Sheet worksheet."""
+    """Return the Google Sheet worksheet, authenticating on first use."""
+    return _cached_worksheet(SHEET_ID)
+
+
+@lru_cache(maxsize=1)
+def _cached_worksheet(sheet_id):
+    """
+    Authenticate and open the worksheet once per process. google-auth refreshes
+    the access token itself; _retry drops the handle on 401/403/404.
+    """
     logger.debug("Loading credentials from: %s", CREDENTIALS_FILE)
     creds  = Credentials.from_service_account_file(CREDENTIALS_FILE, scopes=SCOPES)
     client = gspread.authorize(creds)
-    logger.debug("Opening sheet ID: %s  worksheet: %s", SHEET_ID, SHEET_NAME)
-    sheet  = client.open_by_key(SHEET_ID)
+    logger.debug("Opening sheet ID: %s  worksheet: %s", sheet_id, SHEET_NAME)
+    sheet  = client.open_by_key(sheet_id)
     return sheet.worksheet(SHEET_NAME)
 
 
-def _parse_date(date_str):
+def _parse_date(date_str, today=None):
     """
     Convert Google Form date (M/D/YYYY) to SQLite format (YYYY-MM-DD).
-    Falls back to today if empty or unrecognized.
+    Falls back to today (or the given today string) if empty or unrecognized.
     """
+    today = today or datetime.now().strftime("%Y-%m-%d")
     if not date_str or not date_str.strip():
-        return datetime.now().strftime("%Y-%m-%d")
-    try:
-        parsed = datetime.strptime(date_str.strip(), "%m/%d/%Y")
-        return parsed.strftime("%Y-%m-%d")
-    except ValueError:
+        return today
+    date_str = date_str.strip()
+
+    # M/D/YYYY — split and let date() validate instead of strptime
+    parts = date_str.split("/")
+    if (len(parts) == 3 and len(parts[2]) == 4 and len(parts[0]) <= 2
+            and len(parts[1]) <= 2 and all(p.isascii() and p.isdigit() for p in parts)):
         try:
-            # Already in YYYY-MM-DD format
-            datetime.strptime(date_str.strip(), "%Y-%m-%d")
-            return date_str.strip()
+            return date(int(parts[2]), int(parts[0]), int(parts[1])).isoformat()
         except ValueError:
-            logger.debug("Unrecognised date format %r — defaulting to today", date_str)
-            return datetime.now().strftime("%Y-%m-%d")
+            pass
+
+    try:
+        # Already in YYYY-MM-DD format
+        if len(date_str) == 10 and date_str[4] == date_str[7] == "-":
+            date.fromisoformat(date_str)
+        else:
+            datetime.strptime(date_str, "%Y-%m-%d")  # unpadded, e.g. 2026-3-5
+        return date_str
+    except ValueError:
+        logger.debug("Unrecognised date format %r — defaulting to today", date_str)
+        return today
+
+
+_URL_RE = re.compile(r"https?://", re.ASCII)
 
 
 def _is_valid_url(url):
     """Basic URL validation."""
-    return bool(re.match(r"https?://", url.strip()))
+    return bool(_URL_RE.match(url.strip()))
 
 
 def _sync_to_pipeline(company, job_url):
@@ -145,6 +205,77 @@ def _sync_to_pipeline(company, job_url):
         print(f"       [WARNING] ats_discovery.db write failed: {e}")
 
 
+def _scrape_description(sheet_row_index, company, job_url):
+    """Scrape and cache one JD. Failures are logged; a later --find-only retries them."""
+    logger.debug("Row %d: scraping JD from %s", sheet_row_index, job_url)
+    try:
+        result = fetch_job_description(job_url)
+        if result:
+            logger.info("Row %d: JD cached for %r", sheet_row_index, company)
+            print(f"       [OK] JD cached — {company}")
+        else:
+            logger.warning("Row %d: could not scrape JD for %r — --find-only retries it "
+                           "once the failure marker expires", sheet_row_index, company)
+            print(f"       [WARNING]  Could not scrape JD for {company} — "
+                  f"--find-only retries it once the failure marker expires")
+    except Exception as e:
+        logger.error("Row %d: JD scraping failed for %r: %s",
+                     sheet_row_index, company, e, exc_info=True)
+        print(f"       [WARNING]  JD scraping failed for {company}: {e}")
+
+
+def _scrape_worker(items):
+    """Scrape a share of the rows on one thread, reusing its Playwright browser."""
+    try:
+        for args in items:
+            _scrape_description(*args)
+    finally:
+        close_browser()
+
+
+def _row_ranges(rows):
+    """
+    Collapse 1-based sheet row numbers into inclusive (start, end) runs,
+    highest first — deleting bottom-up keeps the remaining indices valid.
+    """
+    ranges = []
+    for row in sorted(set(rows)):
+        if ranges and row == ranges[-1][1] + 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return [tuple(r) for r in reversed(ranges)]
+
+
+def _delete_rows(worksheet, rows):
+    """
+    Delete rows from worksheet with a single batchUpdate call — one
+    deleteDimension request per contiguous run instead of one API call
+    (and one unit of write quota) per row.
+    """
+    requests = [
+        {"deleteDimension": {"range": {
+            "sheetId":    worksheet.id,
+            "dimension":  "ROWS",
+            "startIndex": start - 1,  # 0-based, end-exclusive
+            "endIndex":   end,
+        }}}
+        for start, end in _row_ranges(rows)
+    ]
+    _retry(worksheet.spreadsheet.batch_update, {"requests": requests})
+
+
+def _rows_unchanged(worksheet, data_rows):
+    """
+    True if the Timestamp column still matches the snapshot read at the start
+    of the run. New form submissions only append below it, but a manual edit
+    that inserts or removes rows above would shift the indices being deleted.
+    """
+    current = _retry(worksheet.col_values, COL_TIMESTAMP + 1)[1:len(data_rows) + 1]
+    current += [""] * (len(data_rows) - len(current))
+    return current == [row[COL_TIMESTAMP] for row in data_rows]
+
+
 def run():
     """Main sync function — reads sheet, imports to DB, deletes processed rows."""
     from pipeline import extract_expected_domain  # local import avoids circular dependency
@@ -162,29 +293,26 @@ def run():
         print(f"[ERROR] credentials.json not found at {CREDENTIALS_FILE}")
         return
 
-    init_db()
+    ensure_db()
 
     print("[INFO] Connecting to Google Sheets...")
     try:
-        worksheet = _get_sheet()
+        worksheet = _retry(_get_sheet)
         logger.debug("Connected to Google Sheets OK")
     except Exception as e:
         logger.error("Could not connect to Google Sheets: %s", e, exc_info=True)
         print(f"[ERROR] Could not connect to Google Sheets: {e}")
         return
 
-    # Get all rows including header
-    all_rows = worksheet.get_all_values()
-    logger.debug("Total rows in sheet (including header): %d", len(all_rows))
+    # Data rows only: the header row and columns past User Name are not fetched
+    data_rows = _retry(worksheet.get, DATA_RANGE) or []
+    logger.debug("Data rows in sheet: %d", len(data_rows))
 
-    if len(all_rows) <= 1:
+    if not data_rows:
         logger.info("No data rows found — sheet is empty or header-only")
         print("[INFO] No new form responses to process.")
         return
 
-    header    = all_rows[0]
-    data_rows = all_rows[1:]  # skip header row
-
     logger.info("Found %d form response(s) to process", len(data_rows))
     print(f"[INFO] Found {len(data_rows)} form response(s) to process.\n")
 
@@ -193,18 +321,22 @@ def run():
     failed         = 0
     # Track which sheet rows to delete (1-based, accounting for header)
     rows_to_delete = []
+    accepted       = []  # (sheet_row_index, company, job_url, add_applications row)
+    results        = []  # (application_id, created) per accepted row
+    to_scrape      = []  # (sheet_row_index, company, job_url) of new applications
+    seen_urls      = {}  # (user_id, job URL) -> first sheet row
+    today          = datetime.now().strftime("%Y-%m-%d")
 
     for i, row in enumerate(data_rows):
         sheet_row_index = i + 2  # +2 because sheet is 1-based and row 1 is header
 
-        # Pad row if shorter than expected
-        while len(row) < 6:
-            row.append("")
+        # Pad row if shorter than expected (the API trims trailing blanks)
+        row.extend([""] * (6 - len(row)))
 
         company      = row[COL_COMPANY].strip()
         job_url      = row[COL_JOB_URL].strip()
         job_title    = row[COL_JOB_TITLE].strip() or None
-        applied_date = _parse_date(row[COL_APPLIED_DATE])
+        applied_date = _parse_date(row[COL_APPLIED_DATE], today)
         user_name = row[COL_USER_NAME].strip().lower()
         user_id   = _USER_NAME_MAP.get(user_name)
 
@@ -241,24 +373,48 @@ def run():
             rows_to_delete.append(sheet_row_index)
             continue
 
+        # Same URL submitted twice by the same user in this batch. Exact
+        # match, as the (user_id, job_url) unique constraint: many ATS job
+        # ids live only in the query string (?gh_jid=, ?jobId=)
+        url_key = (user_id, job_url)
+        if url_key in seen_urls:
+            logger.info("Row %d: duplicate in batch of row %d — skipping",
+                        sheet_row_index, seen_urls[url_key])
+            print(f"       [SKIP] Duplicate in batch (row {seen_urls[url_key]}) — skipping")
+            skipped += 1
+            rows_to_delete.append(sheet_row_index)
+            continue
+        seen_urls[url_key] = sheet_row_index
+
         # Extract ATS from job URL and store in ats_discovery.db
         _sync_to_pipeline(company, job_url)
 
-        # Insert into applications table
         expected_domain = extract_expected_domain(job_url)
         logger.debug("Row %d: expected_domain=%s", sheet_row_index, expected_domain)
-        app_id, created = add_application(
-            company=company,
-            job_url=job_url,
-            job_title=job_title,
-            applied_date=applied_date,
-            expected_domain=expected_domain,
-            user_id=user_id,
-        )
+        accepted.append((sheet_row_index, company, job_url, {
+            "company":         company,
+            "job_url":         job_url,
+            "job_title":       job_title,
+            "applied_date":    applied_date,
+            "expected_domain": expected_domain,
+            "user_id":         user_id,
+        }))
+
+    # Insert every accepted row into applications in one statement
+    if accepted:
+        try:
+            results = add_applications([fields for *_, fields in accepted])
+        except Exception as e:
+            logger.error("Failed to insert %d application(s): %s",
+                         len(accepted), e, exc_info=True)
+            print(f"\n[ERROR] Failed to insert applications: {e}")
+            results = [(None, False)] * len(accepted)
+        print()
 
+    for (sheet_row_index, company, job_url, _), (app_id, created) in zip(accepted, results):
         if not app_id:
             logger.error("Row %d: failed to insert application for %r", sheet_row_index, company)
-            print("       [ERROR] Failed to insert application — skipping")
+            print(f"  [ERROR] {company}: failed to insert application — skipping")
             failed += 1
             # Do NOT append to rows_to_delete — leave row in sheet for retry
             continue
@@ -266,48 +422,47 @@ def run():
         if not created:
             logger.info("Row %d: %r already exists in DB (id=%s) — skipping",
                         sheet_row_index, company, app_id)
-            print(f"       [SKIP] Already exists in DB — skipping")
+            print(f"  [SKIP] {company}: already exists in DB — skipping")
             skipped += 1
             rows_to_delete.append(sheet_row_index)
             continue
 
         logger.info("Row %d: inserted application for %r (id=%s)", sheet_row_index, company, app_id)
-        print(f"       [OK] Added to DB (id={app_id})")
-
-        # Scrape job description
-        print(f"       [INFO] Scraping job description...")
-        logger.debug("Row %d: scraping JD from %s", sheet_row_index, job_url)
-        try:
-            result = fetch_job_description(job_url)
-            if result:
-                logger.info("Row %d: JD cached for %r", sheet_row_index, company)
-                print(f"       [OK] JD cached")
-            else:
-                logger.warning("Row %d: could not scrape JD for %r — will retry during --find-only",
-                               sheet_row_index, company)
-                print(f"       [WARNING]  Could not scrape JD — will retry during --find-only")
-        except Exception as e:
-            logger.error("Row %d: JD scraping failed for %r: %s",
-                         sheet_row_index, company, e, exc_info=True)
-            print(f"       [WARNING]  JD scraping failed: {e}")
+        print(f"  [OK] {company}: added to DB (id={app_id})")
 
+        # JD scraping runs after the inserts, in parallel across imported rows
+        to_scrape.append((sheet_row_index, company, job_url))
         imported += 1
         rows_to_delete.append(sheet_row_index)
 
-    # Delete processed rows from sheet in reverse order
-    # (reverse so row indices stay correct as we delete)
+    if to_scrape:
+        print(f"\n[INFO] Scraping {len(to_scrape)} job description(s)...")
+        # One share per worker so each thread launches at most one browser
+        workers = min(SCRAPE_MAX_WORKERS, len(to_scrape))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for n in range(workers):
+                executor.submit(_scrape_worker, to_scrape[n::workers])
+
+    # Delete processed rows from sheet in one batched request. When every row
+    # was consumed this is a single deleteDimension over the whole data range.
     if rows_to_delete:
         logger.info("Deleting %d processed row(s) from sheet: %s",
                     len(rows_to_delete), rows_to_delete)
         print(f"\n[INFO]️  Deleting {len(rows_to_delete)} processed row(s) from sheet...")
-        for row_index in sorted(rows_to_delete, reverse=True):
-            try:
-                worksheet.delete_rows(row_index)
-                logger.debug("Deleted sheet row %d", row_index)
-            except Exception as e:
-                logger.error("Could not delete sheet row %d: %s", row_index, e)
-                print(f"   [WARNING]  Could not delete row {row_index}: {e}")
-        print(f"[OK] Sheet cleaned up")
+        try:
+            if _rows_unchanged(worksheet, data_rows):
+                _delete_rows(worksheet, rows_to_delete)
+                logger.debug("Deleted sheet rows %s", rows_to_delete)
+                print(f"[OK] Sheet cleaned up")
+            else:
+                # Left in place — the next run re-reads them and skips the
+                # ones already in the DB
+                logger.warning("Sheet rows shifted during sync — not deleting %s",
+                               rows_to_delete)
+                print("   [WARNING]  Sheet changed during sync — rows left for next run")
+        except Exception as e:
+            logger.error("Could not delete sheet rows %s: %s", rows_to_delete, e)
+            print(f"   [WARNING]  Could not delete processed rows: {e}")
 
     logger.info("Sync complete — imported=%d  skipped=%d  failed=%d",
                 imported, skipped, failed)
@@ -1,4 +1,4 @@
-from db.job_cache import init_cache, get_job, save_job
+from db.job_cache import init_cache, get_job, save_job, get_job_failure, save_job_failure
 from jobs.job_scraper import JobScraper, detect_portal
 import logging
 
@@ -19,6 +19,12 @@ def fetch_job_description(url):
         print("Using cached job description")
         return cached
 
+    # A recent failed scrape is not retried until JOB_SCRAPE_FAILURE_TTL_HOURS pass
+    failure = get_job_failure(url)
+    if failure:
+        print(f"Skipping job description: recent scrape {failure}")
+        return None
+
     try:
         portal = detect_portal(url)
         use_playwright = portal in ("workday", "icims", "taleo", "ashby")
@@ -27,6 +33,12 @@ def fetch_job_description(url):
 
         if not job:
             print("Scraper returned None.")
+            save_job_failure(url, "failed")
+            return None
+
+        if not job.description or len(job.description.strip()) < 200:
+            print("Job description too short. Skipping cache save.")
+            save_job_failure(url, "too_short")
             return None
 
         job_text = f"""
@@ -46,10 +58,6 @@ Description:
 {job.description}
 """
 
-        if not job.description or len(job.description.strip()) < 200:
-            print("Job description too short. Skipping cache save.")
-            return None
-
         save_job(url, job_text)
 
         return {
@@ -59,4 +67,8 @@ Description:
 
     except Exception as e:
         logger.exception("Scraper integration failed for url=%s", url)
+        try:
+            save_job_failure(url, "failed")
+        except Exception:
+            logger.exception("Could not record scrape failure for url=%s", url)
         return None
\ No newline at end of file
@@ -13,7 +13,10 @@ For Playwright (handles JS-heavy sites like Workday):
 import re
 import json
 import time
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 from urllib.parse import urlparse , urlunparse
@@ -21,6 +24,13 @@ from urllib.parse import urlparse , urlunparse
 import requests
 from bs4 import BeautifulSoup
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    _USE_SELECTOLAX = True
+except ImportError:
+    LexborHTMLParser = None
+    _USE_SELECTOLAX  = False
+
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -125,9 +135,7 @@ class GreenhouseScraper:
                     job.title = data.get("title", "")
                     job.company = data.get("company", {}).get("name", company_slug)
                     job.location = data.get("location", {}).get("name", "")
-                    job.description = BeautifulSoup(
-                        data.get("content", ""), "html.parser"
-                    ).get_text(separator="\n", strip=True)
+                    job.description = _html_to_text(data.get("content", ""))
                     job.department = ", ".join(
                         d.get("name", "") for d in data.get("departments", [])
                     )
@@ -170,12 +178,12 @@ class LeverScraper:
                 # Description from lists
                 lists = data.get("lists", [])
                 parts = [f"{lst['text']}:\n" + "\n".join(
-                    BeautifulSoup(item, "html.parser").get_text()
+                    _html_to_text(item, separator="", strip=False)
                     for item in lst.get("content", "").split("</li>") if item.strip()
                 ) for lst in lists]
-                job.description = "\n\n".join(parts) if parts else BeautifulSoup(
-                    data.get("descriptionBody", data.get("description", "")), "html.parser"
-                ).get_text(separator="\n", strip=True)
+                job.description = "\n\n".join(parts) if parts else _html_to_text(
+                    data.get("descriptionBody", data.get("description", ""))
+                )
                 return job
         except Exception as e:
             logger.warning("Lever JSON API failed: %s", e)
@@ -225,9 +233,7 @@ class SmartRecruitersScraper:
             job.title = ld_data.get("title", "")
             job.company = _get_nested(ld_data, "hiringOrganization.name") or ""
             job.location = _get_nested(ld_data, "jobLocation.address.addressLocality") or ""
-            job.description = BeautifulSoup(
-                ld_data.get("description", ""), "html.parser"
-            ).get_text(separator="\n", strip=True)
+            job.description = _html_to_text(ld_data.get("description", ""))
             job.salary = _extract_salary_from_ld(ld_data)
             return job
 
@@ -260,9 +266,7 @@ class WorkdayScraper:
                         job.title = title
                     desc = _deep_find(data, "jobDescription") or _deep_find(data, "description")
                     if desc:
-                        job.description = BeautifulSoup(desc, "html.parser").get_text(
-                            separator="\n", strip=True
-                        )
+                        job.description = _html_to_text(desc)
             except Exception:
                 continue
 
@@ -344,9 +348,7 @@ class GenericScraper:
             job.location = _get_nested(loc, "address.addressLocality") or \
                            _get_nested(loc, "address.addressRegion") or ""
             raw_desc = ld_data.get("description", "")
-            job.description = BeautifulSoup(raw_desc, "html.parser").get_text(
-                separator="\n", strip=True
-            )
+            job.description = _html_to_text(raw_desc)
             job.job_type = ld_data.get("employmentType", "")
             job.salary = _extract_salary_from_ld(ld_data)
             if job.title and job.description:
@@ -377,32 +379,72 @@ class GenericScraper:
 # Playwright Scraper (JS-heavy sites like Workday)
 # ─────────────────────────────────────────────
 
+# Sync Playwright objects are bound to the thread that created them, so each
+# thread keeps its own warm browser; every fetch gets a fresh context.
+_pw_local = threading.local()
+
+
+def _launch_browser():
+    """Return this thread's Chromium, launching it on first use."""
+    browser = getattr(_pw_local, "browser", None)
+    if browser is not None and browser.is_connected():
+        return browser
+    close_browser()
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
+        raise ImportError(
+            "Playwright not installed. Run: pip install playwright && playwright install chromium"
+        )
+    playwright = sync_playwright().start()
+    try:
+        browser = playwright.chromium.launch(headless=True)
+    except Exception:
+        playwright.stop()
+        raise
+    _pw_local.playwright, _pw_local.browser = playwright, browser
+    return browser
+
+
+def close_browser():
+    """
+    Close the calling thread's browser, if any. Worker threads that scrape
+    with use_playwright=True must call this before they exit.
+    """
+    browser    = getattr(_pw_local, "browser", None)
+    playwright = getattr(_pw_local, "playwright", None)
+    _pw_local.browser = _pw_local.playwright = None
+    for close in (browser and browser.close, playwright and playwright.stop):
+        if close:
+            try:
+                close()
+            except Exception as e:
+                logger.debug("Playwright shutdown failed: %s", e)
+
+
+# atexit runs on the main thread, so this covers the main thread's browser
+atexit.register(close_browser)
+
+
 class PlaywrightScraper:
     """
     Uses Playwright for JavaScript-rendered pages.
     Activate by passing use_playwright=True to JobScraper.scrape().
+    The browser stays up between calls (see close_browser).
 
     Install: pip install playwright && playwright install chromium
     """
 
     @staticmethod
     def fetch_html(url: str, wait_selector: str = "body", timeout: int = 30000) -> str:
-        try:
-            from playwright.sync_api import sync_playwright
-        except ImportError:
-            raise ImportError(
-                "Playwright not installed. Run: pip install playwright && playwright install chromium"
-            )
-
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                )
+        context = _launch_browser().new_context(
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
             )
+        )
+        try:
             page = context.new_page()
             page.goto(url, wait_until="networkidle", timeout=timeout)
 
@@ -432,9 +474,9 @@ class PlaywrightScraper:
             else:
                 page.wait_for_selector(wait_selector, timeout=timeout)
 
-            html = page.content()
-            browser.close()
-            return html
+            return page.content()
+        finally:
+            context.close()
 
 
 # ─────────────────────────────────────────────
@@ -460,6 +502,15 @@ DEFAULT_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Static fetches stream the body and stop reading at PAGE_READ_CAP bytes;
+# pages that declare more than PAGE_SKIP_BYTES are not downloaded at all.
+PAGE_READ_CAP   = 512 * 1024
+PAGE_SKIP_BYTES = 8 * 1024 * 1024
+_READ_CHUNK     = 64 * 1024
+
+# scrape_many() runs this many hosts at once; URLs on one host stay serial
+SCRAPE_MANY_WORKERS = 8
+
 
 class JobScraper:
     def __init__(self, delay: float = 1.5, timeout: int = 15):
@@ -482,10 +533,10 @@ class JobScraper:
             if use_playwright:
                 html = PlaywrightScraper.fetch_html(url)
             else:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                html = response.text
+                html = self._fetch_static(url)
                 time.sleep(self.delay)
+                if html is None:
+                    return None
 
             soup = BeautifulSoup(html, "lxml")
             portal = detect_portal(url, html)
@@ -510,19 +561,63 @@ class JobScraper:
 
         return None
 
+    def _fetch_static(self, url: str) -> Optional[str]:
+        """
+        GET url and return at most PAGE_READ_CAP bytes of it, decoded.
+        Returns None when Content-Length exceeds PAGE_SKIP_BYTES.
+        """
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > PAGE_SKIP_BYTES:
+                logger.warning("Skipping %s: %s bytes exceeds page limit", url, declared)
+                return None
+
+            chunks, size = [], 0
+            for chunk in response.iter_content(chunk_size=_READ_CHUNK):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= PAGE_READ_CAP:
+                    break
+            body = b"".join(chunks)[:PAGE_READ_CAP]
+            encoding = response.encoding or "utf-8"
+        try:
+            return body.decode(encoding, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
     def scrape_many(
         self,
         urls: list[str],
-        use_playwright: bool = False
+        use_playwright: bool = False,
+        max_workers: int = SCRAPE_MANY_WORKERS,
     ) -> list[JobPosting]:
-        """Scrape multiple job URLs with rate limiting."""
-        results = []
-        for url in urls:
-            job = self.scrape(url, use_playwright=use_playwright)
-            if job:
-                results.append(job)
-            time.sleep(self.delay)
-        return results
+        """
+        Scrape multiple job URLs, in parallel across hosts. URLs on the same
+        host are scraped one after another so self.delay still spaces the
+        requests each site sees. Results keep input order; failures are dropped.
+        """
+        by_host: dict[str, list[tuple[int, str]]] = {}
+        for i, url in enumerate(urls):
+            by_host.setdefault(urlparse(url).netloc.lower(), []).append((i, url))
+        results: list[Optional[JobPosting]] = [None] * len(urls)
+
+        def scrape_host(items):
+            try:
+                for n, (i, url) in enumerate(items):
+                    # Static fetches already sleep inside scrape()
+                    if n and use_playwright:
+                        time.sleep(self.delay)
+                    results[i] = self.scrape(url, use_playwright=use_playwright)
+            finally:
+                if use_playwright:
+                    close_browser()
+
+        if by_host:
+            workers = min(max_workers, len(by_host))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(scrape_host, by_host.values()))
+        return [job for job in results if job]
 
 
 # ─────────────────────────────────────────────
@@ -543,6 +638,32 @@ def _text(soup: BeautifulSoup, selectors: list[str]) -> str:
     return ""
 
 
+_NON_TEXT_TAGS = ("script", "style", "noscript")
+
+
+def _html_to_text(html: str, separator: str = "\n", strip: bool = True) -> str:
+    """
+    Flatten an HTML fragment (API/JSON-LD description) to text.
+    Uses selectolax (lexbor) when installed, BeautifulSoup otherwise.
+    """
+    if not html:
+        return ""
+    if _USE_SELECTOLAX:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(list(_NON_TEXT_TAGS))
+        if tree.body is None:
+            return ""
+        text = tree.body.text(separator=separator, strip=strip)
+        # lexbor keeps whitespace-only nodes as empty pieces; bs4 drops them
+        if strip and separator:
+            text = separator.join(p for p in text.split(separator) if p)
+        return text
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(_NON_TEXT_TAGS):
+        tag.decompose()
+    return soup.get_text(separator=separator, strip=strip)
+
+
 def _extract_json_ld(soup: BeautifulSoup, schema_type: str) -> dict:
     """Extract first JSON-LD block matching a schema type."""
     for script in soup.find_all("script", type="application/ld+json"):
@@ -600,21 +721,13 @@ def _extract_salary_from_ld(ld_data: dict) -> str:
     return str(salary)
 
 
+# Any whitespace run containing a line boundary (the str.splitlines set)
+_LINE_BREAK_RUN = re.compile(r"\s*[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]\s*")
+
+
 def _clean_text(text: str) -> str:
-    """Remove excessive whitespace from scraped text."""
-    lines = [line.strip() for line in text.splitlines()]
-    lines = [line for line in lines if line]
-    # Collapse more than 2 consecutive blank lines
-    result, blanks = [], 0
-    for line in lines:
-        if not line:
-            blanks += 1
-            if blanks <= 2:
-                result.append(line)
-        else:
-            blanks = 0
-            result.append(line)
-    return "\n".join(result)
+    """Strip every line and drop blank ones, in a single regex pass."""
+    return _LINE_BREAK_RUN.sub("\n", text).strip()
 
 
 # ─────────────────────────────────────────────
@@ -2,16 +2,29 @@
 
 import os
 import json
+import re
 import logging
 import hashlib
-import re
-from google import genai
+import threading
+from string import Template
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from google.genai import errors as genai_errors
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 from dotenv import load_dotenv
 from db.quota_manager import (
-    can_call, increment_usage, all_models_exhausted,
+    can_call, daily_limit_reached, increment_usage, all_models_exhausted,
     within_rpm, within_tpm, tpm_wait_seconds, record_tpm,
 )
 from db.db import get_ai_cache, save_ai_cache
+from outreach.gemini_client import extract_json_array, extract_json_object, make_client
+
+try:
+    import orjson as _orjson
+    _USE_ORJSON = True
+except ImportError:
+    _orjson     = None
+    _USE_ORJSON = False
 import time
 
 load_dotenv()
@@ -33,7 +46,7 @@ def _get_client(user_id: int = 1):
     if not api_key:
         print(f"[WARNING] GEMINI_API_KEY_USER_{user_id} not set. AI generation will be skipped.")
         return None
-    _clients[user_id] = genai.Client(api_key=api_key)
+    _clients[user_id] = make_client(api_key)
     return _clients[user_id]
 
 
@@ -46,7 +59,7 @@ def _get_ats_client():
     if not api_key:
         print("[WARNING] GEMINI_ATS_KEY_PRIMARY not set. ATS field-map AI will be skipped.")
         return None
-    _ats_client = genai.Client(api_key=api_key)
+    _ats_client = make_client(api_key)
     return _ats_client
 
 # -----------------------
@@ -57,84 +70,149 @@ PRIMARY_MODEL = "gemini-2.5-flash-lite"
 FALLBACK_MODEL = "gemini-2.5-flash"
 FIELD_MAP_MODEL = "gemma-4-31b-it"
 CACHE_TTL_DAYS = 21
+BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "8"))   # jobs marshaled per prompt
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "4"))  # in-flight calls per process
+
+# Bounds concurrent generate_content calls across worker threads.
+_call_slots = threading.BoundedSemaphore(GEMINI_CONCURRENCY)
+# Held while a worker checks the RPM/TPM/daily limits and reserves its call,
+# so parallel workers don't all pass the same sliding-window check.
+_quota_lock = threading.Lock()
+# {(user_id, model, "YYYY-MM-DD")} — models that hit their daily limit today.
+# Lets later calls in the same run skip them without another DB round-trip.
+_exhausted_today: set = set()
 
 
 # -----------------------
 # CACHE KEYS
 # -----------------------
 
+def _digest(*parts):
+    """blake2b over \x1f-separated parts — fast non-cryptographic lookup key."""
+    raw = "\x1f".join(str(p) for p in parts)
+    return hashlib.blake2b(raw.encode(), digest_size=32).hexdigest()
+
+
 def _cache_key(company, job_title, job_text):
     """Cache key for full JD-based generation."""
-    raw = f"{company}-{job_title}-{job_text}"
-    return hashlib.sha256(raw.encode()).hexdigest()
+    return _digest(company, job_title, job_text)
 
 
 def _fallback_cache_key(company, job_title):
     """Separate cache key for fallback generation (no JD)."""
+    return _digest("fallback", company, job_title)
+
+
+def _legacy_cache_key(company, job_title, job_text):
+    """Pre-blake2b sha256 key — read-only, until old rows age out (CACHE_TTL_DAYS)."""
+    raw = f"{company}-{job_title}-{job_text}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _legacy_fallback_cache_key(company, job_title):
+    """Pre-blake2b sha256 fallback key — read-only, until old rows age out."""
     raw = f"fallback-{company}-{job_title}"
     return hashlib.sha256(raw.encode()).hexdigest()
 
 
+def _get_cached(key, legacy_key):
+    """
+    Look up key in ai_cache, then the legacy sha256 key for entries written
+    before the blake2b switch.
+    """
+    return get_ai_cache(key) or get_ai_cache(legacy_key)
+
+
 # -----------------------
 # SHARED AI CALL
 # -----------------------
 
-def _call_model(prompt, cache_key, company, job_title, user_id: int = 1):
+def _reserve_call(model, user_id, estimated_tokens):
     """
-    Call Gemini with the given prompt using user_id's API key and quota.
-    Saves result to ai_cache and returns the parsed data dict.
-    Returns {} if all models exhausted or both fail.
+    Check the RPM, TPM and daily limits for one model and, if they pass,
+    record the call (RPM + daily count) and its estimated tokens before
+    releasing _quota_lock, so parallel workers can't all pass the same
+    sliding-window check. Short RPM/TPM waits happen outside the lock.
+    Returns True if a call was reserved.
+    """
+    for attempt in range(2):
+        with _quota_lock:
+            if _is_exhausted(model, user_id):
+                return False
+            if daily_limit_reached(model, user_id=user_id):
+                print(f"{model} daily limit reached (user_id={user_id}) — trying next model.")
+                _exhausted_today.add((user_id, model, _today()))
+                return False
+
+            # TPM estimate: prompt tokens (chars/4) + generous output buffer
+            if not within_rpm(model):
+                limit, wait_s = "RPM", 60.0
+            else:
+                limit, wait_s = "TPM", tpm_wait_seconds(model, estimated_tokens=estimated_tokens)
+                if wait_s <= 0:
+                    increment_usage(model, user_id=user_id)
+                    record_tpm(model, estimated_tokens)
+                    return True
+
+        if attempt:
+            print(f"{model} still over {limit} after wait — trying next model.")
+            return False
+        print(f"{model} {limit} limit hit — waiting {wait_s:.1f}s...")
+        time.sleep(wait_s)
+    return False
+
+
+def _today():
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _is_exhausted(model, user_id):
+    return (user_id, model, _today()) in _exhausted_today
+
+
+def _is_rate_limited(exc):
+    return isinstance(exc, genai_errors.APIError) and getattr(exc, "code", None) == 429
+
+
+@retry(retry=retry_if_exception(_is_rate_limited),
+       wait=wait_exponential_jitter(initial=2, max=30),
+       stop=stop_after_attempt(3), reraise=True)
+def _generate_content(client, model, prompt):
+    """Single generate_content call, retried with backoff on HTTP 429."""
+    return client.models.generate_content(model=model, contents=prompt)
+
+
+def _generate(prompt, parse, user_id: int = 1, output_tokens: int = 500):
     """
-    if all_models_exhausted(user_id=user_id):
+    Run prompt through PRIMARY_MODEL then FALLBACK_MODEL using user_id's
+    API key and quota. parse(text) turns the raw response into data and
+    raises on malformed output, which moves on to the next model.
+    Returns the parsed data, or None if all models exhausted or both fail.
+    """
+    models = [m for m in (PRIMARY_MODEL, FALLBACK_MODEL) if not _is_exhausted(m, user_id)]
+    if not models or all_models_exhausted(user_id=user_id):
         print(f"All model quotas exhausted for today (user_id={user_id}).")
-        return {}
+        return None
 
     client = _get_client(user_id)
     if client is None:
-        return {}
+        return None
 
-    for model in [PRIMARY_MODEL, FALLBACK_MODEL]:
-        # RPM check
-        if not within_rpm(model):
-            print(f"{model} RPM limit hit — waiting 60s...")
-            time.sleep(60)
-            if not within_rpm(model):
-                print(f"{model} still unavailable after wait — trying next model.")
-                continue
-
-        # TPM check — estimate prompt tokens (chars/4) + generous output buffer
-        estimated_tokens = len(prompt) // 4 + 500
-        wait_s = tpm_wait_seconds(model, estimated_tokens=estimated_tokens)
-        if wait_s > 0:
-            print(f"{model} TPM limit hit — waiting {wait_s:.1f}s...")
-            time.sleep(wait_s)
-            if not within_tpm(model, estimated_tokens=estimated_tokens):
-                print(f"{model} still over TPM after wait — trying next model.")
-                continue
-
-        if not can_call(model, user_id=user_id):
-            print(f"{model} daily limit reached (user_id={user_id}) — trying next model.")
+    for model in models:
+        estimated_tokens = len(prompt) // 4 + output_tokens
+        if not _reserve_call(model, user_id, estimated_tokens):
             continue
 
         try:
-            response = client.models.generate_content(
-                model=model,
-                contents=prompt
-            )
+            with _call_slots:
+                response = _generate_content(client, model, prompt)
 
+            # The reservation booked the estimate; top up if the call used more
             tokens = getattr(response.usage_metadata, "total_token_count", 0) or 0
-            record_tpm(model, tokens)
-            increment_usage(model, user_id=user_id)
-
-            text = response.text.strip()
-
-            match = re.search(r"\{.*\}", text, re.DOTALL)
-            if not match:
-                raise ValueError("No JSON found in response")
+            if tokens > estimated_tokens:
+                record_tpm(model, tokens - estimated_tokens)
 
-            data = json.loads(match.group(0))
-
-            save_ai_cache(cache_key, company, job_title, data, ttl_days=CACHE_TTL_DAYS)
+            data = parse(response.text.strip())
 
             print(f"Generated using model: {model}")
             return data
@@ -144,40 +222,138 @@ def _call_model(prompt, cache_key, company, job_title, user_id: int = 1):
             continue
 
     print("Both models failed.")
-    return {}
+    return None
+
+
+def _loads(raw):
+    """Parse JSON with orjson when installed, falling back to json."""
+    if _USE_ORJSON:
+        try:
+            return _orjson.loads(raw)
+        except _orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def _dumps_indented(obj):
+    """Pretty-print obj as JSON for prompts; orjson when installed."""
+    if _USE_ORJSON:
+        try:
+            return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2, default=str).decode()
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _parse_object(text):
+    """Extract the single JSON object from a model response."""
+    raw = extract_json_object(text)
+    if raw is None:
+        raise ValueError("No JSON found in response")
+    return _loads(raw)
+
+
+def _parse_array(text):
+    """Extract the JSON array from a batched model response."""
+    raw = extract_json_array(text)
+    if raw is None:
+        raise ValueError("No JSON array found in response")
+    data = _loads(raw)
+    if not isinstance(data, list):
+        raise ValueError("Batched response is not a JSON array")
+    return data
+
+
+def _call_model(prompt, cache_key, company, job_title, user_id: int = 1):
+    """
+    Call Gemini with the given prompt using user_id's API key and quota.
+    Saves result to ai_cache and returns the parsed data dict.
+    Returns {} if all models exhausted or both fail.
+    """
+    data = _generate(prompt, _parse_object, user_id=user_id)
+    if not data:
+        return {}
+
+    save_ai_cache(cache_key, company, job_title, data, ttl_days=CACHE_TTL_DAYS)
+    return data
 
 
 # -----------------------
-# MAIN GENERATION FUNCTION (with JD)
+# PROMPTS
 # -----------------------
 
-def generate_all_content(company, job_title, job_text, user_id: int = 1):
+MAX_JD_CHARS = 1500   # JD budget after _condense (was a raw 4000-char slice)
+
+# Terms that mark the parts of a JD worth sending: what the role does,
+# what it asks for, and overlap with the candidate background.
+_JD_QUERY_TERMS = frozenset("""
+    responsibilities responsible requirements required qualifications
+    experience skills build design develop own scale backend distributed
+    systems services microservices api python go golang kubernetes
+    postgresql sql database cloud aws gcp ci cd pipelines infrastructure
+""".split())
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+|\n+")
+_WORD           = re.compile(r"[a-z]+")
+
+
+def _condense(text, max_chars=MAX_JD_CHARS):
     """
-    Generate personalized email content using the full job description.
-    Falls back to generate_all_content_without_jd() if job_text is empty.
-    Uses user_id's Gemini API key and quota.
+    Shrink a job description to max_chars by keeping the sentences that
+    mention the most _JD_QUERY_TERMS (per word, so long boilerplate
+    doesn't win), in their original order. Short texts pass through.
     """
-    if not job_text:
-        print(f"[WARNING] No job description available for {company}. Using role-based fallback.")
-        return generate_all_content_without_jd(company, job_title, user_id=user_id)
+    if len(text) <= max_chars:
+        return text
+
+    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+    scored = []
+    for pos, sentence in enumerate(sentences):
+        words = _WORD.findall(sentence.lower())
+        if not words:
+            continue
+        hits = sum(1 for w in words if w in _JD_QUERY_TERMS)
+        scored.append((hits / len(words) ** 0.5, pos, sentence))
 
-    key = _cache_key(company, job_title, job_text)
+    keep, used = [], 0
+    for score, pos, sentence in sorted(scored, key=lambda t: (-t[0], t[1])):
+        if used + len(sentence) + 1 > max_chars:
+            continue
+        keep.append((pos, sentence))
+        used += len(sentence) + 1
+
+    return " ".join(sentence for _, sentence in sorted(keep)) or text[:max_chars]
 
-    cached = get_ai_cache(key)
-    if cached:
-        print("Using cached AI content")
-        return cached
 
-    prompt = f"""
-You are helping me as a software engineer write a short outreach email based on job description of a particular role at particular company.
-Kindly generate 3 different subjects lines for initial mail , followup email 1 and followup email 2 based on job title and store them into subject_initial , subject_followup1 , subject_followup2 respectively. 
-Kindly generate 3 different bodies for initial mail , followup email 1 and followup email 2 based on job description of a particular role at particular company and store them into intro , followup1 and followup2 respecively.
+_CANDIDATE = "Backend Software Engineer — Python, Go, microservices, Kubernetes, PostgreSQL optimization, CI/CD, distributed systems."
 
-Company: {company}
-Job Title: {job_title}
+_OUTPUT_SCHEMA = '{"subject_initial": "", "subject_followup1": "", "subject_followup2": "", "intro": "", "followup1": "", "followup2": ""}'
 
-Job Description:
-{job_text[:4000]}
+# Static prompt text is built once at import; only the job fields are
+# interpolated per call.
+_JD_PROMPT = Template("""Write a cold outreach email sequence from me (candidate below) for this job.
+
+Company: $company
+Job Title: $job_title
+Job Description: $job_text
+
+Candidate: """ + _CANDIDATE + """
+
+Output:
+1. subject_initial, 2. subject_followup1, 3. subject_followup2 — subject lines under 10 words, no greeting
+4. intro, 5. followup1, 6. followup2 — bodies of 3 professional sentences (under 120 words) on why I fit this JD
+
+Professional tone, no emojis. Return ONLY this JSON:
+""" + _OUTPUT_SCHEMA)
+
+_NO_JD_PROMPT = Template("""
+You are helping a software engineer write a short cold outreach email.
+No job description is available, but generate professional and specific outreach
+based on the typical requirements and responsibilities for this role at this company.
+Research what this company is known for technically and tailor the email accordingly.
+
+Company: $company
+Job Title: $job_title
 
 Candidate Background:
 - Backend Software Engineer
@@ -188,27 +364,54 @@ Candidate Background:
 - CI/CD pipelines
 - Distributed systems
 
+Generate 3 subject lines and 3 email bodies for:
+- Initial outreach email
+- First follow-up email
+- Second follow-up email
+
 Return STRICT JSON in this format:
 
-{{
+{
   "subject_initial": "...",
   "subject_followup1": "...",
   "subject_followup2": "...",
   "intro": "...",
   "followup1": "...",
   "followup2": "..."
-}}
+}
 
 Rules:
 - Professional tone
 - No emojis
+- Mention the company name and role specifically
 - Each body under 120 words
 - Subject lines under 10 words
 - Return ONLY valid JSON
 - Do not include greeting in subject.
-- Write 3 concise professional sentences explaining why I am a strong fit in a body.
-"""
+- Write 3 concise professional sentences explaining why I am a strong fit based on typical requirements for this role.
+""")
+
+
+# -----------------------
+# MAIN GENERATION FUNCTION (with JD)
+# -----------------------
+
+def generate_all_content(company, job_title, job_text, user_id: int = 1):
+    """
+    Generate personalized email content using the full job description.
+    Falls back to generate_all_content_without_jd() if job_text is empty.
+    Uses user_id's Gemini API key and quota.
+
+    Single-job form of generate_all_content_batch(), kept for existing callers.
+    """
+    return generate_all_content_batch([(company, job_title, job_text)], user_id=user_id)[0]
+
 
+def _generate_with_jd(key, company, job_title, job_text, user_id: int = 1):
+    """One uncached job through the single-job JD prompt."""
+    prompt = _JD_PROMPT.substitute(
+        company=company, job_title=job_title, job_text=_condense(job_text),
+    )
     return _call_model(prompt, key, company, job_title, user_id=user_id)
 
 
@@ -225,58 +428,120 @@ def generate_all_content_without_jd(company, job_title, user_id: int = 1):
     """
     key = _fallback_cache_key(company, job_title)
 
-    cached = get_ai_cache(key)
+    cached = _get_cached(key, _legacy_fallback_cache_key(company, job_title))
     if cached:
         print("Using cached fallback AI content")
         return cached
 
-    prompt = f"""
-You are helping a software engineer write a short cold outreach email.
-No job description is available, but generate professional and specific outreach
-based on the typical requirements and responsibilities for this role at this company.
-Research what this company is known for technically and tailor the email accordingly.
+    prompt = _NO_JD_PROMPT.substitute(company=company, job_title=job_title)
 
-Company: {company}
-Job Title: {job_title}
+    print(f"[INFO] Generating fallback AI content for {company} | {job_title} (no JD available)")
+    return _call_model(prompt, key, company, job_title, user_id=user_id)
 
-Candidate Background:
-- Backend Software Engineer
-- Python & Go
-- Microservices
-- Kubernetes
-- PostgreSQL optimization
-- CI/CD pipelines
-- Distributed systems
 
-Generate 3 subject lines and 3 email bodies for:
-- Initial outreach email
-- First follow-up email
-- Second follow-up email
+# -----------------------
+# BATCH GENERATION (many JDs, one prompt)
+# -----------------------
 
-Return STRICT JSON in this format:
+_BATCH_HEADER = """Write a cold outreach email sequence from me (candidate below) for EACH <job> below.
 
-{{
-  "subject_initial": "...",
-  "subject_followup1": "...",
-  "subject_followup2": "...",
-  "intro": "...",
-  "followup1": "...",
-  "followup2": "..."
-}}
+Candidate: """ + _CANDIDATE + """
 
-Rules:
-- Professional tone
-- No emojis
-- Mention the company name and role specifically
-- Each body under 120 words
-- Subject lines under 10 words
-- Return ONLY valid JSON
-- Do not include greeting in subject.
-- Write 3 concise professional sentences explaining why I am a strong fit based on typical requirements for this role.
+Output per job:
+1. subject_initial, 2. subject_followup1, 3. subject_followup2 — subject lines under 10 words, no greeting
+4. intro, 5. followup1, 6. followup2 — bodies of 3 professional sentences (under 120 words) on why I fit that JD
+
+Professional tone, no emojis. Return ONLY a JSON array with one object per job, "i" matching the <job i=...> it answers:
+[{{"i": 0, """ + _OUTPUT_SCHEMA[1:].replace("{", "{{").replace("}", "}}") + """]
+
+Jobs ({count}):
 """
 
-    print(f"[INFO] Generating fallback AI content for {company} | {job_title} (no JD available)")
-    return _call_model(prompt, key, company, job_title, user_id=user_id)
+
+def generate_all_content_batch(jobs, user_id: int = 1, batch_size: int = BATCH_SIZE):
+    """
+    Generate email content for many (company, job_title, job_text) tuples,
+    marshaling up to batch_size uncached jobs into a single Gemini prompt so
+    the shared instructions and candidate background are sent once per batch.
+    Batches run on up to GEMINI_CONCURRENCY threads.
+
+    Returns a list of content dicts aligned with jobs ({} on failure).
+    Jobs without a JD go through generate_all_content_without_jd(); a lone
+    job, or one missing from a batched response, uses the single-job prompt.
+    """
+    results = [{} for _ in jobs]
+    pending = []   # (index, cache_key, company, job_title, job_text)
+    dupes   = {}   # cache_key → indexes of later jobs with the same key
+
+    for idx, (company, job_title, job_text) in enumerate(jobs):
+        if not job_text:
+            print(f"[WARNING] No job description available for {company}. Using role-based fallback.")
+            results[idx] = generate_all_content_without_jd(company, job_title, user_id=user_id)
+            continue
+        key = _cache_key(company, job_title, job_text)
+        if key in dupes:
+            dupes[key].append(idx)
+            continue
+        cached = _get_cached(key, _legacy_cache_key(company, job_title, job_text))
+        if cached:
+            print(f"Using cached AI content for {company}")
+            results[idx] = cached
+            continue
+        dupes[key] = []
+        pending.append((idx, key, company, job_title, job_text))
+
+    chunks = [pending[start:start + batch_size] for start in range(0, len(pending), batch_size)]
+
+    def _run_chunk(chunk):
+        if len(chunk) == 1:
+            idx, key, company, job_title, job_text = chunk[0]
+            results[idx] = _generate_with_jd(key, company, job_title, job_text, user_id=user_id)
+            return
+
+        sections = [
+            f'<job i="{i}">\nCompany: {company}\nJob Title: {job_title}\n\n'
+            f"Job Description:\n{_condense(job_text)}\n</job>"
+            for i, (_, _, company, job_title, job_text) in enumerate(chunk)
+        ]
+        prompt = _BATCH_HEADER.format(count=len(chunk)) + "\n\n".join(sections)
+
+        items = _generate(prompt, _parse_array, user_id=user_id,
+                          output_tokens=500 * len(chunk)) or []
+
+        by_index = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("i"), int):
+                by_index[item.pop("i")] = item
+
+        for i, (idx, key, company, job_title, job_text) in enumerate(chunk):
+            data = by_index.get(i)
+            if data:
+                save_ai_cache(key, company, job_title, data, ttl_days=CACHE_TTL_DAYS)
+                results[idx] = data
+            elif not all_models_exhausted(user_id=user_id):
+                logger.warning("Batch response missing job %r — retrying singly", company)
+                results[idx] = _generate_with_jd(key, company, job_title, job_text, user_id=user_id)
+
+    if len(chunks) == 1:
+        _run_chunk(chunks[0])
+    elif chunks:
+        print(f"[INFO] Batch-generating AI content for {len(pending)} job(s) "
+              f"in {len(chunks)} batch(es) (user_id={user_id})")
+        # Create the client up front so workers don't race on lazy init
+        _get_client(user_id)
+        with ThreadPoolExecutor(max_workers=min(GEMINI_CONCURRENCY, len(chunks))) as executor:
+            for future in [executor.submit(_run_chunk, chunk) for chunk in chunks]:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error("AI batch generation failed: %s", e, exc_info=True)
+
+    # Duplicates share the first job's result, now in ai_cache if it succeeded
+    for key, extra in dupes.items():
+        for idx in extra:
+            results[idx] = _get_cached(key, key) or {}
+
+    return results
 
 
 # -----------------------
@@ -340,7 +605,7 @@ def detect_field_map_with_ai(company, first_job_raw, base_url,
                 truncated[k] = v[:500] + "...[truncated]"
             else:
                 truncated[k] = v
-        raw_preview = json.dumps(truncated, indent=2)
+        raw_preview = _dumps_indented(truncated)
 
         sample_url_section = ""
         if sample_job_url and sample_job_url.strip():
@@ -375,7 +640,7 @@ def detect_field_map_with_ai(company, first_job_raw, base_url,
                 return result
 
             flat         = dict(list(_flatten_top(full_response).items())[:40])
-            flat_preview = json.dumps(flat, indent=2, default=str)
+            flat_preview = _dumps_indented(flat)
 
             total_section = f"""
     ---
@@ -447,12 +712,7 @@ def detect_field_map_with_ai(company, first_job_raw, base_url,
             )
             increment_usage(FIELD_MAP_MODEL, use_case="ats_detection")
 
-            text  = response.text.strip()
-            match = re.search(r"\{.*\}", text, re.DOTALL)
-            if not match:
-                raise ValueError("No JSON found in response")
-
-            data = json.loads(match.group(0))
+            data = _parse_object(response.text.strip())
 
             # ── Validate field map ───────────────────────────────────
             # title must exist in the actual job dict — if not, the AI
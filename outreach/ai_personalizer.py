@@ -1,10 +1,13 @@
 # ai_personalizer.py
 
+import json
 import logging
 import os
-from google import genai
+from functools import lru_cache
 from dotenv import load_dotenv
 
+from outreach.gemini_client import extract_json_object, make_client
+
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
@@ -12,19 +15,33 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 if not GEMINI_API_KEY:
     raise ValueError("GEMINI_API_KEY not found in .env file")
 
-client = genai.Client(api_key=GEMINI_API_KEY)
+client = make_client(GEMINI_API_KEY)
 logger = logging.getLogger(__name__)
 
 
-def generate_job_based_intro(company, job_text):
-
-    if not job_text:
-        return ""
-
+def _fallback_subject(company, job_title, stage):
+    """Smart fallback per stage."""
+    if stage == "followup1":
+        return f"Following Up – {job_title} at {company}"
+    elif stage == "followup2":
+        return f"Final Follow-Up – {job_title} at {company}"
+    else:
+        return f"{job_title} – {company}"
+
+
+@lru_cache(maxsize=256)
+def _generate_intro_and_subjects(company, job_title, job_text):
+    """
+    One Gemini call returning the intro body plus all three stage subjects,
+    so generate_job_based_intro() and generate_subject() share a round-trip.
+    Cached per (company, job_title, job_text) for the life of the process;
+    raises on failure so errors are retried rather than cached.
+    """
     prompt = f"""
 You are helping me as a software engineer write a short outreach email based on job description of a particular role at particular company.
 
 Company: {company}
+Job Title: {job_title}
 
 Job Description:
 {job_text}
@@ -39,29 +56,47 @@ Candidate Background:
 - CI/CD pipelines
 - Distributed systems
 
-Write 3 concise professional sentences explaining why I am a strong fit.
-Do not include email subject.
-Directly include 3 statements in the body of the email.
-Do not include greetings to the recruiter/hiring manager.
-Be confident and specific.
-Limit to under 120 words.
-Do not include any placeholder like [Dear Hiring manager].
+"intro": 3 concise professional sentences explaining why I am a strong fit.
+Be confident and specific. Under 120 words. No greeting, no subject,
+no placeholder like [Dear Hiring manager].
+
+"subject_initial", "subject_followup1", "subject_followup2": subject lines for
+the first outreach, a polite first follow-up and a final follow-up.
+Under 10 words, include company name and job title, no emojis, no placeholder
+like [Your Name]. Only use Software Engineer if the job title is empty or
+Software Engineer.
+
+Return ONLY this JSON:
+{{"intro": "...", "subject_initial": "...", "subject_followup1": "...", "subject_followup2": "..."}}
 """
 
-    try:
-        response = client.models.generate_content(
-            model="gemini-2.5-flash-lite",   # Gemini 2.5 Flash Lite
-            contents=prompt
-        )
+    response = client.models.generate_content(
+        model="gemini-2.5-flash-lite",   # Gemini 2.5 Flash Lite
+        contents=prompt
+    )
+    raw = extract_json_object(str(response.text or ""))
+    if raw is None:
+        raise ValueError("No JSON found in response")
+    return json.loads(raw)
 
-        if hasattr(response, "text") and response.text:
-            return str(response.text).strip()
-        return ""
 
+def _intro_and_subjects(company, job_title, job_text):
+    """Fused call result, or {} on error (errors are not cached)."""
+    try:
+        return _generate_intro_and_subjects(company, job_title, job_text)
     except Exception as e:
         print("Gemini error:", e)
+        return {}
+
+
+def generate_job_based_intro(company, job_text, job_title="Software Engineer"):
+
+    if not job_text:
         return ""
 
+    intro = _intro_and_subjects(company, job_title, job_text).get("intro")
+    return str(intro).strip() if intro else ""
+
 
 def generate_followup_content(company, job_title, job_text, stage):
 
@@ -88,54 +123,17 @@ Do not include any placeholder like [Dear Hiring manager].
         return ""
 
 
-def generate_subject(company, job_title, stage="initial"):
-
-    stage_instruction = {
-        "initial": "This is the first outreach email.",
-        "followup1": "This is a polite first follow-up email.",
-        "followup2": "This is a final follow-up email."
-    }.get(stage, "This is a job outreach email.")
-
-    prompt = f"""
-Generate a professional email subject line.
-
-Context:
-{stage_instruction}
-
-Requirements:
-- Under 10 words
-- Include company name
-- Include job title
-- Professional tone
-- No emojis
-- Do not use Software Engineer in subject if job title is different.
-- Only use Software Engineer if job title is empty or Software Engineer.
-- Do not include any placeholder like [Your Name].
-
-Company: {company}
-Job Title: {job_title}
-
-Return ONLY the subject line.
-"""
-
-    try:
-        response = client.models.generate_content(
-            model="gemini-2.5-flash-lite",
-            contents=prompt
-        )
-
-        subject = response.text.strip()
-
-        if not subject or len(subject) > 100:
-            raise ValueError("Invalid subject")
+def generate_subject(company, job_title, stage="initial", job_text=""):
+    """
+    Subject line for stage. When job_text is given this reuses the fused
+    intro/subject call (free if generate_job_based_intro already ran);
+    otherwise returns the stage fallback without a Gemini call.
+    """
+    subject = None
+    if job_text:
+        subject = _intro_and_subjects(company, job_title, job_text).get(f"subject_{stage}")
 
-        return subject
+    if not subject or len(subject) > 100:
+        return _fallback_subject(company, job_title, stage)
 
-    except:
-        # Smart fallback per stage
-        if stage == "followup1":
-            return f"Following Up – {job_title} at {company}"
-        elif stage == "followup2":
-            return f"Final Follow-Up – {job_title} at {company}"
-        else:
-            return f"{job_title} – {company}"
\ No newline at end of file
+    return subject.strip()
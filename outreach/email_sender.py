@@ -1,5 +1,7 @@
 import os
+import atexit
 import smtplib
+import threading
 from email.message import EmailMessage
 
 from logger import get_logger
@@ -7,6 +9,81 @@ from config import EMAIL, APP_PASSWORD, RESUME_PATH
 
 logger = get_logger(__name__)
 
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+
+# Logged-in SMTP connections keyed by sender address. An outreach run sends
+# many messages per sender, so TCP + STARTTLS + AUTH is paid once per sender
+# rather than once per email. smtplib objects are not thread-safe — all use
+# goes through _smtp_lock.
+_smtp_sessions: dict = {}
+_smtp_lock = threading.Lock()
+
+
+def _smtp_connect(from_email, app_password):
+    server = smtplib.SMTP(SMTP_HOST, SMTP_PORT, timeout=30)
+    try:
+        server.starttls()
+        server.login(from_email, app_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _drop_smtp_session(from_email):
+    server = _smtp_sessions.pop(from_email, None)
+    if server is None:
+        return
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
+def _smtp_session(from_email, app_password):
+    """Return a live SMTP connection for from_email, reconnecting if it was dropped."""
+    server = _smtp_sessions.get(from_email)
+    if server is not None:
+        try:
+            # Gmail drops idle connections; NOOP is far cheaper than a new handshake
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        _drop_smtp_session(from_email)
+    server = _smtp_connect(from_email, app_password)
+    _smtp_sessions[from_email] = server
+    return server
+
+
+def close_smtp_sessions():
+    """QUIT every cached SMTP connection. Also runs at interpreter exit."""
+    with _smtp_lock:
+        for from_email in list(_smtp_sessions):
+            _drop_smtp_session(from_email)
+
+
+atexit.register(close_smtp_sessions)
+
+# Resume PDF bytes keyed by path, with the (mtime, size) they were read at.
+# Each outreach send attaches the same file; a stat replaces re-reading it,
+# and a replaced resume is picked up on the next send.
+_resume_cache: dict = {}
+
+
+def _read_resume(resume_path):
+    """Return resume_path's bytes, re-reading only when the file changed."""
+    st  = os.stat(resume_path)
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _resume_cache.get(resume_path)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    with open(resume_path, "rb") as f:
+        data = f.read()
+    _resume_cache[resume_path] = (sig, data)
+    return data
+
 
 def send_email(to_email, body, company, subject=None, user_id=None, attach_resume=True):
     """
@@ -43,22 +120,24 @@ def send_email(to_email, body, company, subject=None, user_id=None, attach_resum
         resume_path = _resume_path_for(user_id)
         if resume_path:
             try:
-                with open(resume_path, "rb") as f:
-                    msg.add_attachment(
-                        f.read(),
-                        maintype="application",
-                        subtype="pdf",
-                        filename=os.path.basename(resume_path),
-                    )
+                msg.add_attachment(
+                    _read_resume(resume_path),
+                    maintype="application",
+                    subtype="pdf",
+                    filename=os.path.basename(resume_path),
+                )
             except FileNotFoundError:
                 logger.warning("Resume not found at %r for user_id=%s — sending without attachment",
                                resume_path, user_id)
 
     try:
-        with smtplib.SMTP("smtp.gmail.com", 587, timeout=30) as server:
-            server.starttls()
-            server.login(from_email, app_password)
-            server.send_message(msg)
+        with _smtp_lock:
+            try:
+                _smtp_session(from_email, app_password).send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionResetError):
+                # Dropped between the NOOP and the send — one retry on a fresh connection
+                _drop_smtp_session(from_email)
+                _smtp_session(from_email, app_password).send_message(msg)
 
         logger.info("Email sent user_id=%s to=%s subject=%r", user_id, to_email, msg["Subject"])
         print(f"Sent email to {to_email} | Subject: {msg['Subject']}")
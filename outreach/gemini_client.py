@@ -0,0 +1,91 @@
+# gemini_client.py
+
+import importlib.util
+
+import httpx
+from google import genai
+from google.genai import types
+
+# -----------------------
+# CONFIG
+# -----------------------
+
+# HTTP/2 needs the optional h2 package; fall back to keep-alive HTTP/1.1.
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=120,
+)
+TIMEOUT = httpx.Timeout(60, connect=10)
+
+# One pooled HTTP client shared by every genai.Client in the process, so
+# TLS connections to the Gemini endpoint are reused across calls and users.
+_http_client = None
+
+
+def get_http_client():
+    """Lazy-initialize the shared pooled httpx.Client."""
+    global _http_client
+    if _http_client is None:
+        transport = httpx.HTTPTransport(
+            retries=2, http2=HTTP2_ENABLED, limits=POOL_LIMITS,
+        )
+        _http_client = httpx.Client(transport=transport, timeout=TIMEOUT)
+    return _http_client
+
+
+def make_client(api_key):
+    """Build a genai.Client for api_key on top of the shared connection pool."""
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(httpx_client=get_http_client()),
+    )
+
+
+# -----------------------
+# RESPONSE PARSING
+# -----------------------
+
+def _extract_balanced(text, open_ch, close_ch):
+    """
+    Return the first balanced open_ch…close_ch span in text, or None.
+    Single linear pass tracking string/escape state, so braces inside JSON
+    strings don't count and nested objects close at the right brace.
+    """
+    start = text.find(open_ch)
+    if start == -1:
+        return None
+
+    depth     = 0
+    in_string = False
+    escape    = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def extract_json_object(text):
+    """Return the first complete {...} JSON object in text, or None."""
+    return _extract_balanced(text, "{", "}")
+
+
+def extract_json_array(text):
+    """Return the first complete [...] JSON array in text, or None."""
+    return _extract_balanced(text, "[", "]")
@@ -21,7 +21,7 @@ except ImportError:
 from logger import get_logger
 from config import SEND_WINDOW_START, SEND_WINDOW_END, GRACE_PERIOD_HOURS, SEND_TIMEZONE
 from outreach.template_engine import get_template
-from outreach.email_sender import send_email
+from outreach.email_sender import send_email, close_smtp_sessions
 from db.quota_manager import all_models_exhausted
 from db.db import (
     init_db,
@@ -283,6 +283,7 @@ def process_outreach():
         # Human-like delay between emails
         time.sleep(random.randint(30, 90))
 
+    close_smtp_sessions()
     print(f"\n[OK] Sent: {sent_count} | Failed: {failed_count}")
     return {
         "sent":    sent_count,
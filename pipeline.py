@@ -49,7 +49,7 @@ from datetime import datetime
 from playwright.sync_api import sync_playwright
 from dotenv import load_dotenv
 from careershift.constants import SESSION_FILE
-from careershift.utils import human_delay
+from careershift.utils import block_static_assets, human_delay
 from careershift.verification import run_tiered_verification
 from config import MIN_RECRUITERS_PER_COMPANY
 
@@ -61,7 +61,7 @@ from db.db import (
     add_prospective_company, get_prospective_status_summary,
     get_prospective_companies,
     get_all_active_applications, get_unique_companies_needing_scraping,
-    get_recruiters_by_company,
+    get_recruiters_for_companies,
 )
 
 logger = get_logger(__name__)
@@ -298,17 +298,26 @@ def run_find_emails():
 def _generate_ai_content_for_all():
     """
     Generate and cache AI email content for every active application, per user.
-    Each user's apps are generated with their own Gemini API key and quota.
+    Each user's apps are generated with their own Gemini API key and quota,
+    several JDs per prompt via generate_all_content_batch().
     """
     from db.db import get_all_active_applications, get_applications_missing_ai_cache
     from db.users import get_all_active_users
     from jobs.job_fetcher import fetch_job_description
     from outreach.ai_full_personalizer import (
-        generate_all_content,
-        generate_all_content_without_jd,
+        generate_all_content_batch,
         all_models_exhausted,
     )
 
+    def _job_for(app):
+        """(company, job_title, job_text) for app; job_text is None without a JD."""
+        company   = app["company"]
+        job_title = app["job_title"] or "Software Engineer"
+        job_data  = fetch_job_description(app["job_url"])
+        if isinstance(job_data, dict):
+            return company, job_data.get("job_title") or job_title, job_data.get("job_text", "")
+        return company, job_title, job_data or None
+
     users = get_all_active_users()
     if not users:
         logger.info("No active users found for AI content generation")
@@ -331,32 +340,11 @@ def _generate_ai_content_for_all():
             print(f"  [INFO] No active applications for {user_name}.")
             continue
 
-        for app in apps:
-            company   = app["company"]
-            job_url   = app["job_url"]
-            job_title = app["job_title"] or "Software Engineer"
-
-            print(f"\n  [INFO] {company} | {job_title}")
-            logger.debug("Generating AI content for %r | %s (user_id=%d)", company, job_title, user_id)
-
-            job_data = fetch_job_description(job_url)
-
-            if not job_data:
-                print(f"  [WARNING] No job description for {company}. Using role-based fallback.")
-                result = generate_all_content_without_jd(company, job_title, user_id=user_id)
-            else:
-                if isinstance(job_data, dict):
-                    job_text  = job_data.get("job_text", "")
-                    job_title = job_data.get("job_title") or job_title
-                else:
-                    job_text = job_data
-
-                if not job_text:
-                    print(f"  [WARNING] Empty job description for {company}. Using role-based fallback.")
-                    result = generate_all_content_without_jd(company, job_title, user_id=user_id)
-                else:
-                    result = generate_all_content(company, job_title, job_text, user_id=user_id)
+        # Scrape/cache every JD first, then generate in batched prompts
+        jobs = [_job_for(app) for app in apps]
+        results = generate_all_content_batch(jobs, user_id=user_id)
 
+        for (company, _, _), result in zip(jobs, results):
             if result:
                 logger.info("AI content generated for %r (user_id=%d)", company, user_id)
                 print(f"  [OK] AI content ready for {company}")
@@ -373,26 +361,8 @@ def _generate_ai_content_for_all():
                 logger.info("Using leftover Gemini quota for %d application(s) missing cache (user_id=%d)",
                             len(missing), user_id)
                 print(f"\n[INFO] Using leftover Gemini quota for {len(missing)} application(s) missing cache ({user_name})...")
-                for app in missing:
-                    if all_models_exhausted(user_id=user_id):
-                        break
-                    company   = app["company"]
-                    job_title = app["job_title"] or "Software Engineer"
-                    job_url   = app["job_url"]
-                    job_data  = fetch_job_description(job_url)
-
-                    if isinstance(job_data, dict):
-                        job_text = job_data.get("job_text", "")
-                    elif isinstance(job_data, str):
-                        job_text = job_data
-                    else:
-                        job_text = None
-
-                    result = (
-                        generate_all_content(company, job_title, job_text, user_id=user_id)
-                        if job_text
-                        else generate_all_content_without_jd(company, job_title, user_id=user_id)
-                    )
+                jobs = [_job_for(app) for app in missing]
+                for (company, _, _), result in zip(jobs, generate_all_content_batch(jobs, user_id=user_id)):
                     if result:
                         logger.info("Leftover quota used for: %r (user_id=%d)", company, user_id)
                         print(f"  [OK] Leftover quota used for: {company}")
@@ -536,6 +506,7 @@ def run_verify_only():
             user_agent=random.choice(USER_AGENTS),
             viewport={"width": random.randint(1280, 1920), "height": random.randint(768, 1080)},
         )
+        block_static_assets(context)
         page = context.new_page()
 
         # Verify session
@@ -563,6 +534,10 @@ def run_verify_only():
     print("=" * 55)
 
     under_stocked = get_unique_companies_needing_scraping(MIN_RECRUITERS_PER_COMPANY)
+    active_counts = {
+        company: len(recruiters)
+        for company, recruiters in get_recruiters_for_companies(under_stocked).items()
+    }
 
     if not under_stocked:
         logger.info("All companies have enough active recruiters")
@@ -572,8 +547,7 @@ def run_verify_only():
                        len(under_stocked), under_stocked)
         print(f"\n[WARNING] {len(under_stocked)} company/companies under-stocked after verification:")
         for company in under_stocked:
-            recruiters   = get_recruiters_by_company(company)
-            active_count = len(recruiters)
+            active_count = active_counts[company]
             print(f"  - {company}: {active_count} active recruiter(s) "
                   f"(needs {MIN_RECRUITERS_PER_COMPANY - active_count} more)")
         print("\n[INFO] Run --find-only to top up under-stocked companies.")
@@ -592,8 +566,7 @@ def run_verify_only():
 
     under_stocked_detail = []
     for company in under_stocked:
-        recruiters   = get_recruiters_by_company(company)
-        active_count = len(recruiters)
+        active_count = active_counts[company]
         under_stocked_detail.append({
             "company":      company,
             "active_count": active_count,
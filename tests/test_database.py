@@ -117,6 +117,52 @@ class TestSchema(unittest.TestCase):
         self.assertEqual(c.fetchone()["cnt"], 0)
         conn.close()
 
+    def test_ensure_db_skips_after_init(self):
+        from unittest.mock import patch
+        import db.schema as schema
+        with patch.object(schema, "init_db") as mock_init:
+            db_module.ensure_db()
+        mock_init.assert_not_called()
+        with patch.object(schema, "_initialized", False), \
+             patch.object(schema, "init_db") as mock_init:
+            db_module.ensure_db()
+        mock_init.assert_called_once()
+
+
+class TestConnectionProbe(unittest.TestCase):
+    """get_conn skips the ROLLBACK probe for recently returned connections."""
+
+    def test_probe_only_after_idle(self):
+        from unittest.mock import MagicMock, patch
+        raw  = MagicMock(closed=0)
+        pool = MagicMock()
+        pool.getconn.return_value = raw
+        with patch.object(db_connection, "_get_pool", return_value=pool):
+            db_connection.get_conn().close()
+            self.assertEqual(raw.reset.call_count, 1)   # never seen → probed
+
+            db_connection.get_conn().close()
+            self.assertEqual(raw.reset.call_count, 1)   # just returned → reused as is
+
+            db_connection._last_returned[raw] -= db_connection._PROBE_AFTER_IDLE_SECS + 1
+            db_connection.get_conn().close()
+            self.assertEqual(raw.reset.call_count, 2)   # idle too long → probed
+        db_connection._last_returned.pop(raw, None)
+
+    def test_discarded_connection_drops_its_timestamp(self):
+        import gc
+        from unittest.mock import MagicMock, patch
+        raw  = MagicMock(closed=0)
+        pool = MagicMock()
+        pool.getconn.return_value = raw
+        with patch.object(db_connection, "_get_pool", return_value=pool):
+            db_connection.get_conn().close()
+        self.assertIn(raw, db_connection._last_returned)
+        size = len(db_connection._last_returned)
+        del raw, pool
+        gc.collect()
+        self.assertEqual(len(db_connection._last_returned), size - 1)
+
 
 class TestApplications(unittest.TestCase):
 
@@ -165,6 +211,19 @@ class TestApplications(unittest.TestCase):
         self.assertEqual(c.fetchone()["cnt"], 1)
         conn.close()
 
+    def test_duplicate_url_backfills_missing_expected_domain_only(self):
+        app_id, _ = db_module.add_application("Google", "https://g.com/1", "SWE")
+        db_module.add_application("Google", "https://g.com/1", "SWE",
+                                  expected_domain="google.com")
+        db_module.add_application("Google", "https://g.com/1", "SWE",
+                                  expected_domain="other.com")
+        db_module.add_application("Google", "https://g.com/1", "SWE")
+        conn = db_module.get_conn()
+        c = conn.cursor()
+        c.execute("SELECT expected_domain FROM applications WHERE id = ?", (app_id,))
+        self.assertEqual(c.fetchone()["expected_domain"], "google.com")
+        conn.close()
+
     def test_application_without_job_title(self):
         app_id, _ = db_module.add_application("Meta", "https://m.com/1")
         conn = db_module.get_conn()
@@ -215,6 +274,23 @@ class TestApplications(unittest.TestCase):
         self.assertFalse(created)
         self.assertEqual(id1, id2)
 
+    def test_add_applications_bulk_matches_single_inserts(self):
+        existing, _ = db_module.add_application("Google", "https://g.com/1")
+        results = db_module.add_applications([
+            {"company": "Google", "job_url": "https://g.com/1", "expected_domain": "google"},
+            {"company": "Meta",   "job_url": "https://m.com/1", "job_title": "SWE"},
+            {"company": "Meta",   "job_url": "https://m.com/1"},
+        ])
+        self.assertEqual(results[0], (existing, False))
+        self.assertTrue(results[1][1])
+        self.assertEqual(results[2], (results[1][0], False))
+        self.assertEqual(db_module.add_applications([]), [])
+        conn = db_module.get_conn()
+        c = conn.cursor()
+        c.execute("SELECT expected_domain FROM applications WHERE id = ?", (existing,))
+        self.assertEqual(c.fetchone()["expected_domain"], "google")  # backfilled
+        conn.close()
+
 
 class TestRecruiters(unittest.TestCase):
 
@@ -271,6 +347,31 @@ class TestRecruiters(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0]["email"], "john@g.com")
 
+    def test_get_recruiters_for_companies_buckets_by_company(self):
+        db_module.add_recruiter("Google", "John", "Recruiter", "john@g.com", "auto")
+        rid = db_module.add_recruiter("Google", "Jane", "HR", "jane@g.com", "auto")
+        db_module.add_recruiter("Meta", "Max", "Recruiter", "max@m.com", "auto")
+        db_module.mark_recruiter_inactive(rid, "left company")
+        result = db_module.get_recruiters_for_companies(["Google", "Meta", "Stripe"])
+        self.assertEqual([r["email"] for r in result["Google"]], ["john@g.com"])
+        self.assertEqual(len(result["Meta"]), 1)
+        self.assertEqual(result["Stripe"], [])
+
+    def test_touch_recruiters_stamps_all_in_one_call(self):
+        rid1 = db_module.add_recruiter("Google", "John", "Recruiter", "john@g.com", "auto")
+        rid2 = db_module.add_recruiter("Google", "Jane", "HR", "jane@g.com", "auto")
+        conn = db_module.get_conn()
+        conn.execute("UPDATE recruiters SET verified_at = '2020-01-01'")
+        conn.commit()
+        conn.close()
+        self.assertEqual(db_module.touch_recruiters([rid1, rid2]), 2)
+        self.assertEqual(db_module.touch_recruiters([]), 0)
+        conn = db_module.get_conn()
+        c = conn.cursor()
+        c.execute("SELECT COUNT(*) AS n FROM recruiters WHERE verified_at > '2020-01-02'")
+        self.assertEqual(c.fetchone()["n"], 2)
+        conn.close()
+
     def test_mark_recruiter_inactive(self):
         rid = db_module.add_recruiter("Google", "John", "Recruiter", "john@g.com", "auto")
         db_module.mark_recruiter_inactive(rid, "bounced")
@@ -602,6 +703,21 @@ class TestJobCache(unittest.TestCase):
         result = db_module.get_job(url)
         self.assertIn("new content", result)
 
+    def test_legacy_zlib_job_still_readable(self):
+        import time
+        import zlib
+        from db.cache import _hash_url
+        url = "https://g.com/jobs/4"
+        content = "Legacy zlib row " + "C" * 300
+        conn = db_module.get_conn()
+        conn.execute(
+            "INSERT INTO jobs (url_hash, job_url, content, created_at) VALUES (?, ?, ?, ?)",
+            (_hash_url(url), url, zlib.compress(content.encode()), int(time.time())),
+        )
+        conn.commit()
+        conn.close()
+        self.assertEqual(db_module.get_job(url), content)
+
 
 class TestAICache(unittest.TestCase):
 
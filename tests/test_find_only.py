@@ -111,6 +111,23 @@ class TestFindOnly(unittest.TestCase):
         self.assertEqual(rid1, rid2)
         print("[OK] TEST 4 PASSED: Existing recruiter reused correctly")
 
+    def test_bulk_add_recruiters_reports_new_and_existing(self):
+        """add_recruiters inserts new emails in one go and reuses existing ids."""
+        rid = db_module.add_recruiter("Google", "John Smith", "Recruiter", "john@google.com", "auto")
+        contacts = [
+            {"name": "John Smith", "position": "Recruiter",
+             "email": "john@google.com", "confidence": "auto"},
+            {"name": "Jane Doe", "position": "Talent Partner",
+             "email": "jane@google.com", "confidence": "auto"},
+        ]
+        saved = db_module.add_recruiters("Google", contacts, found_by_user_id=1)
+
+        self.assertEqual(saved["john@google.com"], (rid, False))
+        jane_id, created = saved["jane@google.com"]
+        self.assertTrue(created)
+        self.assertEqual(db_module.recruiter_email_exists("jane@google.com"), jane_id)
+        self.assertEqual(db_module.add_recruiters("Google", []), {})
+
     # ─────────────────────────────────────────
     # TEST 5: Companies needing scraping
     # ─────────────────────────────────────────
@@ -137,6 +154,15 @@ class TestFindOnly(unittest.TestCase):
         self.assertIn("Meta", companies)
         print("[OK] TEST 5 PASSED: Companies needing scraping identified correctly")
 
+    def test_single_company_checks_match_list_queries(self):
+        self.assertTrue(db_module.company_needs_scraping("Google", min_recruiters=2))
+        self.assertTrue(db_module.company_needs_scraping("Google", 2, user_id=1))
+        self.assertFalse(db_module.company_needs_scraping("Stripe", min_recruiters=2))
+        row = db_module.get_company_recruiter_shortage("Meta")
+        listed = {r["company"]: r for r in db_module.get_companies_needing_more_recruiters()}
+        self.assertEqual(row["shortage"], listed["Meta"]["shortage"])
+        self.assertIsNone(db_module.get_company_recruiter_shortage("Stripe"))
+
     # ─────────────────────────────────────────
     # TEST 6: Quota distribution
     # ─────────────────────────────────────────
@@ -192,5 +218,188 @@ class TestFindOnly(unittest.TestCase):
         print("[OK] TEST 7 PASSED: AI cache roundtrip works correctly")
 
 
+class TestCompanyClaims(unittest.TestCase):
+    """Parallel user sessions must not scrape the same company at once."""
+
+    def setUp(self):
+        from careershift import find_emails
+        self.fe = find_emails
+        find_emails._company_claims.clear()
+
+    def tearDown(self):
+        self.fe._company_claims.clear()
+
+    def test_second_user_blocked_until_release(self):
+        self.assertTrue(self.fe._claim_company("Google", 1))
+        self.assertTrue(self.fe._claim_company("Google", 1))
+        self.assertFalse(self.fe._claim_company("Google", 2))
+        self.fe._release_company("Google")
+        self.assertTrue(self.fe._claim_company("Google", 2))
+
+    def test_release_by_user_drops_only_that_users_claims(self):
+        self.fe._claim_company("Google", 1)
+        self.fe._claim_company("Meta", 1)
+        self.fe._claim_company("Stripe", 2)
+        self.fe._release_company(user_id=1)
+        self.assertEqual(self.fe._company_claims, {"Stripe": 2})
+
+    def test_company_covered_since_list_fetch_is_skipped(self):
+        with patch("careershift.find_emails.company_needs_scraping",
+                   return_value=False), \
+             patch("careershift.find_emails.scrape_company") as mock_scrape, \
+             patch("sys.stdout"):
+            stat = self.fe._scrape_step2_company(MagicMock(), "Google", 2, 1, {}, False)
+        mock_scrape.assert_not_called()
+        self.assertEqual(stat["status"], "skipped")
+        self.assertEqual(self.fe._company_claims, {})
+
+    def test_claim_released_when_scrape_raises(self):
+        with patch("careershift.find_emails.company_needs_scraping",
+                   return_value=True), \
+             patch("careershift.find_emails.scrape_company", side_effect=RuntimeError), \
+             patch("sys.stdout"):
+            with self.assertRaises(RuntimeError):
+                self.fe._scrape_step2_company(MagicMock(), "Google", 2, 1, {}, False)
+        self.assertEqual(self.fe._company_claims, {})
+
+    def test_session_open_failure_stays_within_user(self):
+        with patch("careershift.find_emails.sync_playwright"), \
+             patch("careershift.find_emails._open_user_session", side_effect=RuntimeError), \
+             patch("sys.stdout"):
+            result = self.fe._run_user({"id": 1, "name": "Test"}, False)
+        self.assertEqual(result, ([], {"scraped": 0, "exhausted": 0}))
+
+
+class TestStep2Batch(unittest.TestCase):
+    """Step 2 company batches can run on their own browser session."""
+
+    def test_batch_without_page_opens_and_closes_own_session(self):
+        from careershift import find_emails
+        browser, page = MagicMock(), MagicMock()
+        user  = {"id": 1, "name": "Test"}
+        batch = [(0, "Google", 2), (2, "Meta", 1)]
+        with patch("careershift.find_emails.sync_playwright"), \
+             patch("careershift.find_emails._open_user_session",
+                   return_value=(browser, page)) as mock_open, \
+             patch("careershift.find_emails._scrape_step2_company",
+                   side_effect=lambda pg, company, *a: {"name": company, "page": pg}), \
+             patch("careershift.find_emails.human_delay"), \
+             patch("sys.stdout"):
+            results = find_emails._scrape_step2_batch(user, batch, 3, {}, False)
+
+        mock_open.assert_called_once()
+        browser.close.assert_called_once()
+        self.assertEqual([i for i, _ in results], [0, 2])
+        self.assertTrue(all(stat["page"] is page for _, stat in results))
+
+    def test_apps_grouped_by_company(self):
+        from careershift import find_emails
+        apps = [
+            {"id": 1, "company": "Google", "expected_domain": ""},
+            {"id": 2, "company": "Meta",   "expected_domain": "meta"},
+            {"id": 3, "company": "Google", "expected_domain": "google"},
+        ]
+        by_company = find_emails._group_by_company(apps)
+        matching, domain = find_emails._get_apps_and_domain(by_company, "Google")
+        self.assertEqual([a["id"] for a in matching], [1, 3])
+        self.assertEqual(domain, "google")
+        self.assertEqual(find_emails._get_apps_and_domain(by_company, "Stripe"), ([], ""))
+
+
+class TestParallelVerification(unittest.TestCase):
+    """Tier 2/3 verification can be split over extra pages on the same session."""
+
+    def _run(self, extra_page):
+        from contextlib import contextmanager
+        from collections import defaultdict
+        from careershift import verification
+
+        recruiters = [{"id": i, "name": f"R{i}", "company": "Google"} for i in range(4)]
+        tiers = {"tier1": [], "tier2": recruiters[:3], "tier3": recruiters[3:]}
+        pages_used = []
+
+        def tier2(page, recruiter, verified=None):
+            pages_used.append(page)
+            return recruiter["id"] != 1   # R1 escalates to Tier 3
+
+        @contextmanager
+        def open_page():
+            yield extra_page
+
+        main_page = MagicMock()
+        with patch.object(verification, "get_recruiters_by_tier", return_value=tiers), \
+             patch.object(verification, "verify_tier2_recruiter", side_effect=tier2), \
+             patch.object(verification, "verify_tier3_recruiter", return_value=False), \
+             patch.object(verification, "touch_recruiters"), \
+             patch.object(verification, "get_recruiters_for_companies",
+                          return_value=defaultdict(list)), \
+             patch.object(verification, "get_conn"), \
+             patch.object(verification, "human_delay"), \
+             patch("sys.stdout"):
+            stats = verification.run_tiered_verification(
+                main_page, [], open_page=open_page, sessions=2,
+            )
+        return stats, main_page, pages_used
+
+    def test_work_split_between_pages(self):
+        extra_page = MagicMock()
+        stats, main_page, pages_used = self._run(extra_page)
+        self.assertEqual(stats["tier2_verified"], 2)
+        self.assertEqual(stats["tier3_verified"], 2)
+        self.assertEqual(stats["tier3_inactive"], 0)
+        self.assertIn(main_page, pages_used)
+        self.assertIn(extra_page, pages_used)
+
+    def test_unopened_page_share_runs_on_main_page(self):
+        stats, main_page, pages_used = self._run(None)
+        self.assertEqual(stats["tier2_verified"], 2)
+        self.assertEqual(stats["tier3_verified"], 2)
+        self.assertTrue(all(p is main_page for p in pages_used))
+
+
+class TestQuotaPageFetch(unittest.TestCase):
+    """Quota page is read over HTTP with the session cookies when possible."""
+
+    TABLE = "<table><tr><th>Used</th><th>Remaining</th></tr><tr><td>8</td><td>42</td></tr></table>"
+
+    def _page(self, browser_html="<html>browser</html>"):
+        page = MagicMock()
+        page.context.cookies.return_value = [
+            {"name": "auth", "value": "x", "domain": "www.careershift.com", "path": "/"},
+        ]
+        page.evaluate.return_value = "UA"
+        page.content.return_value = browser_html
+        return page
+
+    def test_http_200_skips_browser_navigation(self):
+        from careershift import quota_manager
+        page = self._page()
+        with patch("careershift.quota_manager.httpx.get",
+                   return_value=MagicMock(status_code=200, text=self.TABLE)), \
+             patch("careershift.quota_manager.get_conn"), \
+             patch("sys.stdout"):
+            remaining = quota_manager.fetch_real_quota(page, user_id=1)
+        self.assertEqual(remaining, 42)
+        page.goto.assert_not_called()
+
+    def test_redirect_falls_back_to_browser(self):
+        from careershift import quota_manager
+        page = self._page()
+        with patch("careershift.quota_manager.httpx.get",
+                   return_value=MagicMock(status_code=302, text="")):
+            self.assertIsNone(quota_manager._http_quota_html(page))
+
+    def test_200_without_quota_table_falls_back_to_browser(self):
+        from careershift import quota_manager
+        page = self._page(browser_html=self.TABLE)
+        with patch("careershift.quota_manager.httpx.get",
+                   return_value=MagicMock(status_code=200, text="<html>login</html>")), \
+             patch("careershift.quota_manager.wait_until_idle"), \
+             patch("careershift.quota_manager.get_conn"), \
+             patch("sys.stdout"):
+            remaining = quota_manager.fetch_real_quota(page, user_id=1)
+        self.assertEqual(remaining, 42)
+        page.goto.assert_called_once()
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
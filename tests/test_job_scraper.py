@@ -33,6 +33,7 @@ TEST_DB = "data/test_pipeline.db"
 
 import db.db as db_module
 import db.connection as db_connection
+from tests.conftest import cleanup_db
 
 # Override DB_FILE at module level — before any test runs
 db_connection.DB_FILE = TEST_DB
@@ -62,6 +63,18 @@ def long_text(n=300):
     return "A" * n
 
 
+def page_response(html, headers=None):
+    """Mock a streamed requests response usable as a context manager."""
+    resp = MagicMock()
+    resp.ok = True
+    resp.status_code = 200
+    resp.headers = headers or {}
+    resp.encoding = "utf-8"
+    resp.iter_content.return_value = [html.encode("utf-8")]
+    resp.__enter__.return_value = resp
+    return resp
+
+
 # ─────────────────────────────────────────────────────────────
 # TEST CLASS 1: Portal Detection
 # ─────────────────────────────────────────────────────────────
@@ -159,6 +172,12 @@ class TestHelperFunctions(unittest.TestCase):
         result = _text(soup, ["h1", "h2", ".title"])
         self.assertEqual(result, "")
 
+    def test_html_to_text_matches_bs4_and_drops_scripts(self):
+        from jobs.job_scraper import _html_to_text
+        html = '<p>Hello <b>world</b></p>\n<ul><li> a </li></ul><script>var x=1</script>'
+        self.assertEqual(_html_to_text(html), "Hello\nworld\na")
+        self.assertEqual(_html_to_text(""), "")
+
     def test_extract_json_ld_finds_job_posting(self):
         from jobs.job_scraper import _extract_json_ld
         html = '''<html><head>
@@ -731,17 +750,39 @@ class TestGenericScraper(unittest.TestCase):
 # TEST CLASS 10: JobScraper Orchestrator
 # ─────────────────────────────────────────────────────────────
 
+class TestPlaywrightBrowserReuse(unittest.TestCase):
+
+    def tearDown(self):
+        from jobs.job_scraper import close_browser
+        close_browser()
+
+    @patch("playwright.sync_api.sync_playwright")
+    def test_browser_launched_once_and_contexts_closed(self, mock_sync_pw):
+        from jobs.job_scraper import PlaywrightScraper, close_browser
+        playwright = mock_sync_pw.return_value.start.return_value
+        browser = playwright.chromium.launch.return_value
+        browser.is_connected.return_value = True
+        context = browser.new_context.return_value
+        context.new_page.return_value.content.return_value = "<html></html>"
+
+        PlaywrightScraper.fetch_html("https://example.com/a")
+        PlaywrightScraper.fetch_html("https://example.com/b")
+        playwright.chromium.launch.assert_called_once()
+        self.assertEqual(context.close.call_count, 2)
+
+        close_browser()
+        browser.close.assert_called_once()
+        playwright.stop.assert_called_once()
+
+
 class TestJobScraperOrchestrator(unittest.TestCase):
 
     @patch("requests.Session.get")
     def test_routes_to_correct_scraper(self, mock_get):
         from jobs.job_scraper import JobScraper
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.text = f'<html><h1>Engineer</h1><div id="content">{long_text()}</div></html>'
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = page_response(
+            f'<html><h1>Engineer</h1><div id="content">{long_text()}</div></html>'
+        )
 
         scraper = JobScraper()
         job = scraper.scrape("https://boards.greenhouse.io/test/jobs/123")
@@ -768,13 +809,10 @@ class TestJobScraperOrchestrator(unittest.TestCase):
     @patch("requests.Session.get")
     def test_cleans_whitespace_in_description(self, mock_get):
         from jobs.job_scraper import JobScraper
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
         _long_text = "Line\n\n\n\nLine " * 50
-        mock_response.text = f'<html><h1>SWE</h1><div id="content">  {_long_text}  </div></html>'
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = page_response(
+            f'<html><h1>SWE</h1><div id="content">  {_long_text}  </div></html>'
+        )
 
         scraper = JobScraper()
         job = scraper.scrape("https://boards.greenhouse.io/test/jobs/123")
@@ -784,12 +822,9 @@ class TestJobScraperOrchestrator(unittest.TestCase):
     @patch("requests.Session.get")
     def test_scrape_many_returns_multiple(self, mock_get):
         from jobs.job_scraper import JobScraper
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.text = f'<html><h1>SWE</h1><div id="content">{long_text()}</div></html>'
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = page_response(
+            f'<html><h1>SWE</h1><div id="content">{long_text()}</div></html>'
+        )
 
         scraper = JobScraper(delay=0)
         urls = [
@@ -799,15 +834,38 @@ class TestJobScraperOrchestrator(unittest.TestCase):
         jobs = scraper.scrape_many(urls)
         self.assertEqual(len(jobs), 2)
 
+    def test_scrape_many_parallel_across_hosts_serial_within_host(self):
+        import threading
+        import time
+        from jobs.job_scraper import JobScraper, JobPosting
+        lock, active, peak = threading.Lock(), {}, {}
+
+        def fake_scrape(url, use_playwright=False):
+            host = url.split("/")[2]
+            with lock:
+                active[host] = active.get(host, 0) + 1
+                peak[host] = max(peak.get(host, 0), active[host])
+            time.sleep(0.01)
+            with lock:
+                active[host] -= 1
+            return None if url.endswith("/bad") else JobPosting(url=url)
+
+        urls = ["https://a.com/1", "https://b.com/1", "https://a.com/bad",
+                "https://c.com/1", "https://a.com/2"]
+        scraper = JobScraper(delay=0)
+        with patch.object(scraper, "scrape", side_effect=fake_scrape):
+            jobs = scraper.scrape_many(urls)
+        self.assertEqual([j.url for j in jobs],
+                         ["https://a.com/1", "https://b.com/1",
+                          "https://c.com/1", "https://a.com/2"])
+        self.assertEqual(peak["a.com"], 1)
+
     @patch("requests.Session.get")
     def test_uses_generic_scraper_for_unknown_portal(self, mock_get):
         from jobs.job_scraper import JobScraper
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.text = f'<html><h1>Engineer</h1><div class="job-description">{long_text()}</div></html>'
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = page_response(
+            f'<html><h1>Engineer</h1><div class="job-description">{long_text()}</div></html>'
+        )
 
         scraper = JobScraper()
         job = scraper.scrape("https://www.unknowncompany.com/careers/swe")
@@ -817,18 +875,37 @@ class TestJobScraperOrchestrator(unittest.TestCase):
     @patch("requests.Session.get")
     def test_job_posting_has_url(self, mock_get):
         from jobs.job_scraper import JobScraper
-        mock_response = MagicMock()
-        mock_response.ok = True
-        mock_response.status_code = 200
-        mock_response.text = f'<html><h1>SWE</h1><div id="content">{long_text()}</div></html>'
-        mock_response.raise_for_status = MagicMock()
-        mock_get.return_value = mock_response
+        mock_get.return_value = page_response(
+            f'<html><h1>SWE</h1><div id="content">{long_text()}</div></html>'
+        )
 
         scraper = JobScraper()
         url = "https://boards.greenhouse.io/test/jobs/123"
         job = scraper.scrape(url)
         self.assertEqual(job.url, url)
 
+    @patch("requests.Session.get")
+    def test_stops_reading_at_page_cap(self, mock_get):
+        from jobs.job_scraper import JobScraper, PAGE_READ_CAP
+        resp = page_response("")
+        resp.iter_content.return_value = iter([b"a" * PAGE_READ_CAP, b"b" * 1024])
+        mock_get.return_value = resp
+
+        html = JobScraper(delay=0)._fetch_static("https://example.com/jobs/1")
+        self.assertEqual(len(html), PAGE_READ_CAP)
+        self.assertNotIn("b", html)
+
+    @patch("requests.Session.get")
+    def test_skips_page_over_declared_size(self, mock_get):
+        from jobs.job_scraper import JobScraper, PAGE_SKIP_BYTES
+        resp = page_response("<html></html>",
+                             headers={"Content-Length": str(PAGE_SKIP_BYTES + 1)})
+        mock_get.return_value = resp
+
+        job = JobScraper(delay=0).scrape("https://example.com/jobs/1")
+        self.assertIsNone(job)
+        resp.iter_content.assert_not_called()
+
     def test_job_posting_to_dict(self):
         from jobs.job_scraper import JobPosting
         job = JobPosting(
@@ -850,6 +927,7 @@ class TestJobScraperOrchestrator(unittest.TestCase):
 class TestJobFetcherIntegration(unittest.TestCase):
 
     def setUp(self):
+        cleanup_db()  # jobs rows persist in PostgreSQL between runs
         db_connection.DB_FILE = TEST_DB
         # Force close any lingering WAL connections before deleting
         try:
@@ -961,6 +1039,35 @@ class TestJobFetcherIntegration(unittest.TestCase):
                 use_playwright=True
             )
 
+    def test_recent_failure_not_rescraped(self):
+        from jobs.job_fetcher import fetch_job_description
+        with patch("jobs.job_fetcher.scraper") as mock_scraper:
+            mock_scraper.scrape.return_value = None
+            fetch_job_description("https://test.com/jobs/broken")
+            result = fetch_job_description("https://test.com/jobs/broken")
+
+        self.assertIsNone(result)
+        mock_scraper.scrape.assert_called_once()
+        self.assertEqual(db_module.get_job_failure("https://test.com/jobs/broken"), "failed")
+
+    def test_fetch_errors_expire_sooner_than_short_descriptions(self):
+        from config import JOB_SCRAPE_ERROR_TTL_HOURS
+        db_module.save_job_failure("https://test.com/jobs/timeout", "failed")
+        db_module.save_job_failure("https://test.com/jobs/stub", "too_short")
+        conn = db_module.get_conn()
+        conn.execute("UPDATE jobs SET created_at = created_at - ? WHERE status <> 'ok'",
+                     ((JOB_SCRAPE_ERROR_TTL_HOURS + 1) * 3600,))
+        conn.commit()
+        conn.close()
+        self.assertIsNone(db_module.get_job_failure("https://test.com/jobs/timeout"))
+        self.assertEqual(db_module.get_job_failure("https://test.com/jobs/stub"), "too_short")
+
+    def test_success_replaces_failure_marker(self):
+        db_module.save_job_failure("https://test.com/jobs/flaky", "failed")
+        db_module.save_job("https://test.com/jobs/flaky", "Job text " + long_text())
+        self.assertIsNone(db_module.get_job_failure("https://test.com/jobs/flaky"))
+        self.assertIsNotNone(db_module.get_job("https://test.com/jobs/flaky"))
+
     def test_returns_none_when_scraper_returns_none(self):
         from jobs.job_fetcher import fetch_job_description
         with patch("jobs.job_fetcher.scraper") as mock_scraper:
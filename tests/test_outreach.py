@@ -328,6 +328,63 @@ class TestProcessOutreach(unittest.TestCase):
         process_outreach()
 
 
+class TestSmtpSessionReuse(unittest.TestCase):
+    """send_email keeps one logged-in SMTP connection per sender."""
+
+    def setUp(self):
+        from outreach import email_sender
+        self.es = email_sender
+        email_sender._smtp_sessions.clear()
+
+    def tearDown(self):
+        self.es._smtp_sessions.clear()
+
+    def _send(self):
+        self.es.send_email("r@acme.com", "Hi", "Acme", subject="S", attach_resume=False)
+
+    @patch("outreach.email_sender.smtplib.SMTP")
+    def test_second_send_reuses_connection(self, mock_smtp):
+        server = mock_smtp.return_value
+        server.noop.return_value = (250, b"OK")
+        self._send()
+        self._send()
+        mock_smtp.assert_called_once()
+        server.login.assert_called_once()
+        self.assertEqual(server.send_message.call_count, 2)
+
+    @patch("outreach.email_sender.smtplib.SMTP")
+    def test_dropped_connection_reconnects_and_retries(self, mock_smtp):
+        dead, fresh = MagicMock(), MagicMock()
+        dead.noop.return_value = (250, b"OK")
+        dead.send_message.side_effect = [None, smtplib.SMTPServerDisconnected("gone")]
+        mock_smtp.side_effect = [dead, fresh]
+        self._send()
+        self._send()
+        self.assertEqual(mock_smtp.call_count, 2)
+        fresh.send_message.assert_called_once()
+
+    @patch("outreach.email_sender.smtplib.SMTP")
+    def test_close_quits_sessions(self, mock_smtp):
+        self._send()
+        self.es.close_smtp_sessions()
+        mock_smtp.return_value.quit.assert_called_once()
+        self.assertEqual(self.es._smtp_sessions, {})
+
+    def test_resume_bytes_reread_only_when_file_changes(self):
+        import tempfile
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "resume.pdf")
+            with open(path, "wb") as f:
+                f.write(b"v1")
+            self.assertEqual(self.es._read_resume(path), b"v1")
+            with patch("builtins.open") as mock_open:
+                self.assertEqual(self.es._read_resume(path), b"v1")
+                mock_open.assert_not_called()
+            with open(path, "wb") as f:
+                f.write(b"v2-longer")
+            self.assertEqual(self.es._read_resume(path), b"v2-longer")
+
+
 class TestAIPersonalizer(unittest.TestCase):
 
     def setUp(self):
@@ -337,11 +394,13 @@ class TestAIPersonalizer(unittest.TestCase):
         # Reset module-level _client
         import outreach.ai_full_personalizer as mod
         mod._client = None
+        mod._exhausted_today.clear()
 
     def tearDown(self):
         cleanup_db(TEST_DB)
         import outreach.ai_full_personalizer as mod
         mod._client = None
+        mod._exhausted_today.clear()
 
     def _sample_response(self):
         return {
@@ -418,7 +477,7 @@ class TestAIPersonalizer(unittest.TestCase):
     def test_model_at_daily_limit_skipped(self):
         from outreach.ai_full_personalizer import _call_model
         import json
-        mock_response = MagicMock()
+        mock_response = MagicMock(usage_metadata=None)
         mock_response.text = json.dumps(self._sample_response())
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
@@ -426,8 +485,8 @@ class TestAIPersonalizer(unittest.TestCase):
         with patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=False):
             with patch("outreach.ai_full_personalizer._get_client", return_value=mock_client):
                 # Primary model at limit, fallback available
-                with patch("outreach.ai_full_personalizer.can_call",
-                           side_effect=lambda m, **kw: m == "gemini-2.5-flash"):
+                with patch("outreach.ai_full_personalizer.daily_limit_reached",
+                           side_effect=lambda m, **kw: m != "gemini-2.5-flash"):
                     with patch("outreach.ai_full_personalizer.increment_usage"):
                         with patch("outreach.ai_full_personalizer.tpm_wait_seconds", return_value=0.0):
                             with patch("outreach.ai_full_personalizer.record_tpm"):
@@ -438,7 +497,7 @@ class TestAIPersonalizer(unittest.TestCase):
     def test_successful_generation_saves_to_cache(self):
         from outreach.ai_full_personalizer import _call_model
         import json
-        mock_response = MagicMock()
+        mock_response = MagicMock(usage_metadata=None)
         mock_response.text = json.dumps(self._sample_response())
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
@@ -457,7 +516,7 @@ class TestAIPersonalizer(unittest.TestCase):
 
     def test_invalid_json_response_tries_next_model(self):
         from outreach.ai_full_personalizer import _call_model
-        mock_response = MagicMock()
+        mock_response = MagicMock(usage_metadata=None)
         mock_response.text = "NOT JSON AT ALL"
         mock_client = MagicMock()
         mock_client.models.generate_content.return_value = mock_response
@@ -472,6 +531,131 @@ class TestAIPersonalizer(unittest.TestCase):
                                 # Both models failed → empty dict
                                 self.assertEqual(result, {})
 
+    def test_batch_marshals_jobs_into_one_call(self):
+        from outreach.ai_full_personalizer import generate_all_content_batch, _cache_key
+        import json
+        items = []
+        for i in range(2):
+            item = dict(self._sample_response(), i=i)
+            item["subject_initial"] = f"Subject {i}"
+            items.append(item)
+        mock_response = MagicMock(usage_metadata=None)
+        mock_response.text = json.dumps(items)
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        jobs = [("Google", "SWE", "google jd " + "A" * 300),
+                ("Meta", "SWE", "meta jd " + "B" * 300)]
+
+        with patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=False), \
+             patch("outreach.ai_full_personalizer._get_client", return_value=mock_client), \
+             patch("outreach.ai_full_personalizer.can_call", return_value=True), \
+             patch("outreach.ai_full_personalizer.increment_usage"), \
+             patch("outreach.ai_full_personalizer.tpm_wait_seconds", return_value=0.0), \
+             patch("outreach.ai_full_personalizer.record_tpm"):
+            results = generate_all_content_batch(jobs)
+
+        mock_client.models.generate_content.assert_called_once()
+        self.assertEqual([r["subject_initial"] for r in results], ["Subject 0", "Subject 1"])
+        cached = db_module.get_ai_cache(_cache_key(*jobs[1]))
+        self.assertEqual(cached["subject_initial"], "Subject 1")
+
+    def test_batch_skips_cached_jobs(self):
+        from outreach.ai_full_personalizer import generate_all_content_batch, _cache_key
+        job = ("Google", "SWE", "job text " + "A" * 300)
+        db_module.save_ai_cache(_cache_key(*job), "Google", "SWE", self._sample_response())
+        with patch("outreach.ai_full_personalizer._get_client") as mock_client:
+            results = generate_all_content_batch([job])
+            mock_client.assert_not_called()
+        self.assertEqual(results[0]["subject_initial"], "SWE at Google")
+
+    def test_batch_runs_single_job_chunks_in_parallel_aligned(self):
+        from outreach.ai_full_personalizer import generate_all_content_batch
+        jobs = [("Google", "SWE", "google jd"), ("Meta", "SWE", ""), ("Stripe", "SWE", "stripe jd")]
+        with patch("outreach.ai_full_personalizer._get_client"), \
+             patch("outreach.ai_full_personalizer._generate_with_jd",
+                   side_effect=lambda key, c, t, jd, user_id=1: {"intro": c}) as mock_single, \
+             patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
+                   side_effect=lambda c, t, user_id=1: {"intro": f"fallback {c}"}):
+            results = generate_all_content_batch(jobs, batch_size=1)
+        self.assertEqual(mock_single.call_count, 2)
+        self.assertEqual([r["intro"] for r in results],
+                         ["Google", "fallback Meta", "Stripe"])
+
+    def test_extract_json_object_handles_nested_and_trailing_braces(self):
+        from outreach.gemini_client import extract_json_object
+        text = 'Here you go: {"intro": "use {braces} and \\"quotes\\"", "meta": {"n": 1}} -- done }'
+        self.assertEqual(extract_json_object(text),
+                         '{"intro": "use {braces} and \\"quotes\\"", "meta": {"n": 1}}')
+        self.assertIsNone(extract_json_object("no json here"))
+
+    def test_legacy_sha256_cache_entry_still_hits(self):
+        from outreach.ai_full_personalizer import generate_all_content, _legacy_cache_key
+        job_text = "job text " + "A" * 300
+        db_module.save_ai_cache(_legacy_cache_key("Google", "SWE", job_text),
+                                "Google", "SWE", self._sample_response())
+        with patch("outreach.ai_full_personalizer._get_client") as mock_client:
+            result = generate_all_content("Google", "SWE", job_text)
+            mock_client.assert_not_called()
+        self.assertEqual(result["subject_initial"], "SWE at Google")
+
+    def test_daily_limited_model_skipped_on_next_call(self):
+        from outreach.ai_full_personalizer import _call_model
+        import json
+        mock_response = MagicMock(usage_metadata=None)
+        mock_response.text = json.dumps(self._sample_response())
+        mock_client = MagicMock()
+        mock_client.models.generate_content.return_value = mock_response
+        limit_reached = MagicMock(side_effect=lambda m, **kw: m != "gemini-2.5-flash")
+
+        with patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=False), \
+             patch("outreach.ai_full_personalizer._get_client", return_value=mock_client), \
+             patch("outreach.ai_full_personalizer.daily_limit_reached", limit_reached), \
+             patch("outreach.ai_full_personalizer.can_call", return_value=True), \
+             patch("outreach.ai_full_personalizer.increment_usage"), \
+             patch("outreach.ai_full_personalizer.tpm_wait_seconds", return_value=0.0), \
+             patch("outreach.ai_full_personalizer.record_tpm"):
+            _call_model("prompt", "key-a", "Google", "SWE")
+            _call_model("prompt", "key-b", "Meta", "SWE")
+
+        checked = [c.args[0] for c in limit_reached.call_args_list]
+        self.assertEqual(checked.count("gemini-2.5-flash-lite"), 1)
+
+    def test_rpm_miss_does_not_mark_model_exhausted(self):
+        import outreach.ai_full_personalizer as mod
+        with patch.object(mod, "within_rpm", return_value=False), \
+             patch.object(mod, "daily_limit_reached", return_value=False), \
+             patch.object(mod, "increment_usage") as mock_usage, \
+             patch.object(mod.time, "sleep"):
+            self.assertFalse(mod._reserve_call(mod.PRIMARY_MODEL, 1, 100))
+        self.assertFalse(mod._is_exhausted(mod.PRIMARY_MODEL, 1))
+        mock_usage.assert_not_called()
+
+    def test_reservation_recorded_before_lock_released_and_sleep_unlocked(self):
+        import outreach.ai_full_personalizer as mod
+        held = []
+        tpm_waits = iter([5.0, 0.0])
+        with patch.object(mod, "within_rpm", return_value=True), \
+             patch.object(mod, "daily_limit_reached", return_value=False), \
+             patch.object(mod, "tpm_wait_seconds", side_effect=lambda *a, **kw: next(tpm_waits)), \
+             patch.object(mod, "increment_usage",
+                          side_effect=lambda *a, **kw: held.append(mod._quota_lock.locked())), \
+             patch.object(mod, "record_tpm") as mock_tpm, \
+             patch.object(mod.time, "sleep",
+                          side_effect=lambda s: held.append(mod._quota_lock.locked())):
+            self.assertTrue(mod._reserve_call(mod.PRIMARY_MODEL, 1, 100))
+        self.assertEqual(held, [False, True])   # slept unlocked, reserved locked
+        mock_tpm.assert_called_once_with(mod.PRIMARY_MODEL, 100)
+
+    def test_condense_keeps_relevant_sentences_within_budget(self):
+        from outreach.ai_full_personalizer import _condense
+        jd = ("Our office has great snacks. " * 40
+              + "You will build distributed backend services in Python and Go. "
+              + "Enjoy generous vacation. " * 40)
+        condensed = _condense(jd, max_chars=500)
+        self.assertLessEqual(len(condensed), 500)
+        self.assertIn("distributed backend services", condensed)
+        self.assertEqual(_condense("short jd"), "short jd")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -62,102 +62,81 @@ class TestGenerateAIContentForAll(unittest.TestCase):
 
     @patch("jobs.job_fetcher.fetch_job_description",
            return_value="Job text " + "A" * 300)
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "Test"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "Test"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           return_value=[{"subject_initial": "Test"}])
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True)
     @patch("db.db.get_applications_missing_ai_cache", return_value=[])
-    def test_uses_jd_when_available(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_uses_jd_when_available(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         self._add_app()
         import pipeline
         pipeline._generate_ai_content_for_all()
-        mock_gen.assert_called_once()
-        mock_fallback.assert_not_called()
+        mock_batch.assert_called_once()
+        self.assertEqual(mock_batch.call_args[0][0],
+                         [("Google", "SWE", "Job text " + "A" * 300)])
 
     @patch("jobs.job_fetcher.fetch_job_description", return_value=None)
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "Test"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "Test"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           return_value=[{"subject_initial": "Test"}])
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True)
     @patch("db.db.get_applications_missing_ai_cache", return_value=[])
-    def test_uses_fallback_when_no_jd(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_uses_fallback_when_no_jd(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         self._add_app()
         import pipeline
         pipeline._generate_ai_content_for_all()
-        mock_fallback.assert_called_once()
-        mock_gen.assert_not_called()
+        self.assertEqual(mock_batch.call_args[0][0], [("Google", "SWE", None)])
 
     @patch("jobs.job_fetcher.fetch_job_description", return_value="")
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "Test"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "Test"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           return_value=[{"subject_initial": "Test"}])
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True)
     @patch("db.db.get_applications_missing_ai_cache", return_value=[])
-    def test_uses_fallback_when_empty_jd(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_uses_fallback_when_empty_jd(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         self._add_app()
         import pipeline
         pipeline._generate_ai_content_for_all()
-        mock_fallback.assert_called_once()
+        self.assertFalse(mock_batch.call_args[0][0][0][2])
 
     @patch("jobs.job_fetcher.fetch_job_description",
            return_value={"job_text": "Job text " + "A" * 300, "job_title": "Backend Engineer"})
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "Test"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "Test"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           return_value=[{"subject_initial": "Test"}])
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True)
     @patch("db.db.get_applications_missing_ai_cache", return_value=[])
-    def test_normalizes_dict_jd_response(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_normalizes_dict_jd_response(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         # Add app with SWE title — dict response overrides with Backend Engineer
         self._add_app(title="SWE")
         import pipeline
         pipeline._generate_ai_content_for_all()
-        # generate_all_content should be called with the extracted job_text
-        self.assertTrue(mock_gen.called)
-        # The second arg should be the job_title from the dict
-        args = mock_gen.call_args[0]
-        self.assertEqual(args[1], "Backend Engineer")
+        self.assertEqual(mock_batch.call_args[0][0],
+                         [("Google", "Backend Engineer", "Job text " + "A" * 300)])
 
     @patch("jobs.job_fetcher.fetch_job_description", return_value=None)
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "X"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "X"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           return_value=[{"subject_initial": "X"}])
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True)
     @patch("db.db.get_applications_missing_ai_cache")
-    def test_no_leftover_when_quota_exhausted(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_no_leftover_when_quota_exhausted(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         self._add_app()
         import pipeline
-        # Patch at the location pipeline.py actually reads it from
-        with patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=True):
-            pipeline._generate_ai_content_for_all()
+        pipeline._generate_ai_content_for_all()
         mock_missing.assert_not_called()
 
     @patch("jobs.job_fetcher.fetch_job_description", return_value=None)
-    @patch("outreach.ai_full_personalizer.generate_all_content",
-           return_value={"subject_initial": "X"})
-    @patch("outreach.ai_full_personalizer.generate_all_content_without_jd",
-           return_value={"subject_initial": "X"})
+    @patch("outreach.ai_full_personalizer.generate_all_content_batch",
+           side_effect=lambda jobs, user_id=1: [{"subject_initial": "X"}] * len(jobs))
     @patch("outreach.ai_full_personalizer.all_models_exhausted", return_value=False)
     @patch("db.db.get_applications_missing_ai_cache")
-    def test_leftover_quota_fills_missing_cache(
-            self, mock_missing, mock_exhausted, mock_fallback, mock_gen, mock_fetch):
+    def test_leftover_quota_fills_missing_cache(self, mock_missing, mock_exhausted, mock_batch, mock_fetch):
         self._add_app("Google", "https://g.com/1")
         mock_missing.return_value = [
             {"company": "Meta", "job_url": "https://m.com/1",
              "job_title": "SWE", "applied_date": "2026-01-01"}
         ]
         import pipeline
-        pipeline._generate_ai_content_for_all()
+        result = pipeline._generate_ai_content_for_all()
         mock_missing.assert_called()
+        self.assertEqual(mock_batch.call_args[0][0], [("Meta", "SWE", None)])
+        self.assertEqual(result["generated"], 2)
 
 
 class TestQuotaReport(unittest.TestCase):
@@ -312,5 +291,123 @@ class TestCLIFlags(unittest.TestCase):
         mock_find.assert_called_once()
 
 
+
+class TestFormSyncSheetCleanup(unittest.TestCase):
+    """--sync-forms scrapes new rows in parallel and deletes them in one request."""
+
+    def test_run_scrapes_every_new_row_then_batch_deletes(self):
+        import jobs.form_sync as form_sync
+        rows = [["t1", "Acme", "https://acme.com/jobs?gh_jid=1", "SWE", "", "alice"],
+                ["t2", "Beta", "https://beta.com/j/2", "SRE", "", "alice"],
+                ["t3", "Acme", " https://acme.com/jobs?gh_jid=1 ", "SWE", "", "alice"],
+                ["t4", "Acme", "https://acme.com/jobs?gh_jid=2", "SRE", "", "alice"]]
+        worksheet = MagicMock()
+        worksheet.get.return_value = rows
+        worksheet.col_values.return_value = ["Timestamp", "t1", "t2", "t3", "t4"]
+        with patch.object(form_sync, "SHEET_ID", "sheet"), \
+             patch.object(form_sync, "_USER_NAME_MAP", {"alice": 1}), \
+             patch("jobs.form_sync.os.path.exists", return_value=True), \
+             patch("jobs.form_sync.ensure_db"), \
+             patch("jobs.form_sync._get_sheet", return_value=worksheet), \
+             patch("jobs.form_sync._sync_to_pipeline"), \
+             patch("jobs.form_sync.add_applications",
+                   return_value=[(1, True), (2, True), (3, True)]) as mock_add, \
+             patch("jobs.form_sync.fetch_job_description",
+                   side_effect=[{"job_text": "x"}, Exception("boom"), {"job_text": "y"}]) as mock_fetch, \
+             patch("pipeline.extract_expected_domain", return_value=None):
+            form_sync.run()
+        worksheet.get.assert_called_once_with("A2:F")
+        mock_add.assert_called_once()
+        self.assertEqual([r["job_url"] for r in mock_add.call_args[0][0]],
+                         ["https://acme.com/jobs?gh_jid=1", "https://beta.com/j/2",
+                          "https://acme.com/jobs?gh_jid=2"])
+        self.assertEqual(mock_fetch.call_count, 3)
+        worksheet.spreadsheet.batch_update.assert_called_once()
+        # Row 4 (the exact in-batch duplicate) is deleted with the imported rows;
+        # row 3 failed its scrape but stays imported, so 2..5 goes in one request
+        body = worksheet.spreadsheet.batch_update.call_args[0][0]
+        ranges = [r["deleteDimension"]["range"] for r in body["requests"]]
+        self.assertEqual([(r["startIndex"], r["endIndex"]) for r in ranges], [(1, 5)])
+
+    def test_parse_date_formats(self):
+        from jobs.form_sync import _parse_date
+        self.assertEqual(_parse_date("3/5/2026"), "2026-03-05")
+        self.assertEqual(_parse_date(" 2026-03-05 "), "2026-03-05")
+        self.assertEqual(_parse_date("2026-3-5"), "2026-3-5")
+        self.assertEqual(_parse_date("2/30/2026", "2026-01-01"), "2026-01-01")
+        self.assertEqual(_parse_date("", "2026-01-01"), "2026-01-01")
+
+    @staticmethod
+    def _api_error(status):
+        import gspread
+        response = MagicMock(status_code=status)
+        response.json.return_value = {"error": {"code": status, "message": "x", "status": "x"}}
+        return gspread.exceptions.APIError(response)
+
+    @patch("jobs.form_sync.time.sleep")
+    def test_retry_backs_off_on_quota_errors(self, mock_sleep):
+        from jobs.form_sync import _retry
+        fn = MagicMock(side_effect=[self._api_error(429), self._api_error(503), "ok"])
+        self.assertEqual(_retry(fn, "A2:F"), "ok")
+        self.assertEqual(fn.call_count, 3)
+        delays = [c[0][0] for c in mock_sleep.call_args_list]
+        self.assertTrue(1 <= delays[0] < 2 and 2 <= delays[1] < 3)
+
+    @patch("jobs.form_sync.time.sleep")
+    def test_retry_does_not_retry_client_errors(self, mock_sleep):
+        import gspread
+        from jobs.form_sync import _retry
+        fn = MagicMock(side_effect=self._api_error(403))
+        with self.assertRaises(gspread.exceptions.APIError):
+            _retry(fn)
+        fn.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch("jobs.form_sync.gspread.authorize")
+    @patch("jobs.form_sync.Credentials.from_service_account_file")
+    def test_worksheet_handle_reused_until_auth_error(self, mock_creds, mock_authorize):
+        import gspread
+        import jobs.form_sync as form_sync
+        form_sync._cached_worksheet.cache_clear()
+        self.addCleanup(form_sync._cached_worksheet.cache_clear)
+        with patch.object(form_sync, "SHEET_ID", "sheet"):
+            first = form_sync._get_sheet()
+            self.assertIs(form_sync._get_sheet(), first)
+            mock_creds.assert_called_once()
+            with self.assertRaises(gspread.exceptions.APIError):
+                form_sync._retry(MagicMock(side_effect=self._api_error(401)))
+            form_sync._get_sheet()
+        self.assertEqual(mock_creds.call_count, 2)
+
+    def test_row_ranges_coalesce_runs_highest_first(self):
+        from jobs.form_sync import _row_ranges
+        self.assertEqual(_row_ranges([7, 2, 3, 4, 5, 11, 9, 10, 3]),
+                         [(9, 11), (7, 7), (2, 5)])
+        self.assertEqual(_row_ranges([]), [])
+
+    def test_delete_rows_issues_single_batch_update(self):
+        from jobs.form_sync import _delete_rows
+        worksheet = MagicMock()
+        worksheet.id = 42
+        _delete_rows(worksheet, [2, 3, 6])
+        worksheet.delete_rows.assert_not_called()
+        worksheet.spreadsheet.batch_update.assert_called_once()
+        body = worksheet.spreadsheet.batch_update.call_args[0][0]
+        ranges = [r["deleteDimension"]["range"] for r in body["requests"]]
+        self.assertEqual([(r["startIndex"], r["endIndex"]) for r in ranges],
+                         [(5, 6), (1, 3)])
+        self.assertTrue(all(r["sheetId"] == 42 and r["dimension"] == "ROWS"
+                            for r in ranges))
+
+    def test_rows_unchanged_tolerates_appends_but_not_shifts(self):
+        from jobs.form_sync import _rows_unchanged
+        data_rows = [["t1", "A"], ["t2", "B"]]
+        worksheet = MagicMock()
+        worksheet.col_values.return_value = ["Timestamp", "t1", "t2", "t3"]
+        self.assertTrue(_rows_unchanged(worksheet, data_rows))
+        worksheet.col_values.return_value = ["Timestamp", "t2", "t3"]
+        self.assertFalse(_rows_unchanged(worksheet, data_rows))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
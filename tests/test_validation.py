@@ -59,7 +59,7 @@ Covers:
 import sys
 import os
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, call
 from datetime import datetime
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -79,9 +79,97 @@ from careershift.scraper import (
     domain_matches_expected,
     analyze_buffer,
 )
+from careershift.search import classify_title, is_excluded_title, classify_hr_title
 from pipeline import extract_expected_domain
 
 
+# ─────────────────────────────────────────
+# TEST: classify_hr_title()
+# ─────────────────────────────────────────
+
+class TestClassifyHrTitle(unittest.TestCase):
+
+    def test_matches_separate_checks(self):
+        for title in ["Technical Recruiter", "People Partner", "VP of People",
+                      "Vice President, Talent", "Software Engineer", "  HR Generalist "]:
+            expected = None if is_excluded_title(title) else classify_title(title)
+            self.assertEqual(classify_hr_title(title), expected, title)
+
+    def test_excluded_executive_returns_none(self):
+        self.assertEqual(classify_title("Chief People Officer"), "manual_review")
+        self.assertIsNone(classify_hr_title("Chief People Officer"))
+
+
+# ─────────────────────────────────────────
+# TEST: search form helpers
+# ─────────────────────────────────────────
+
+class TestSearchHelpers(unittest.TestCase):
+
+    @patch("careershift.search.wait_until_idle")
+    @patch("careershift.search.human_delay")
+    def test_unconfirmed_reset_falls_back_to_navigation(self, mock_delay, mock_idle):
+        from careershift.search import submit_search
+        from careershift.constants import CAREERSHIFT_SEARCH_URL
+        page = MagicMock(url=CAREERSHIFT_SEARCH_URL)
+        page.evaluate.return_value = False          # fields did not read back empty
+        page.locator.return_value.first.wait_for.side_effect = Exception("stop")
+        self.assertFalse(submit_search(page, "Acme"))
+        page.goto.assert_called_once()
+
+    @patch("careershift.search.human_delay")
+    def test_confirmed_reset_reuses_loaded_form(self, mock_delay):
+        from careershift.search import submit_search
+        from careershift.constants import CAREERSHIFT_SEARCH_URL
+        page = MagicMock(url=CAREERSHIFT_SEARCH_URL)
+        page.evaluate.return_value = True
+        page.locator.return_value.first.wait_for.side_effect = Exception("stop")
+        submit_search(page, "Acme")
+        page.goto.assert_not_called()
+
+    @patch("careershift.search.slow_type")
+    @patch("careershift.search.human_delay")
+    def test_previous_cards_marked_stale_before_search_click(self, mock_delay, mock_type):
+        from careershift.search import submit_search, _MARK_STALE_JS
+        from careershift.constants import CAREERSHIFT_SEARCH_URL
+        page = MagicMock(url=CAREERSHIFT_SEARCH_URL)
+        page.evaluate.return_value = True
+        marked_at_click = []
+        page.locator.return_value.first.click.side_effect = lambda: marked_at_click.append(
+            call(_MARK_STALE_JS) in page.evaluate.call_args_list)
+        self.assertTrue(submit_search(page, "Acme", require_email=False))
+        # form clicks run before marking; the search button click after it
+        self.assertFalse(any(marked_at_click[:-1]))
+        self.assertTrue(marked_at_click[-1])
+
+    def test_read_cards_returns_tuples_of_current_cards(self):
+        from careershift.search import read_cards, _READ_CARDS_JS
+        page = MagicMock()
+        page.evaluate.return_value = [
+            ["Jane Doe", "Acme", "Recruiter",
+             "https://www.careershift.com/App/Contacts/SearchDetails?id=1", True],
+        ]
+        self.assertEqual(read_cards(page), [
+            ("Jane Doe", "Acme", "Recruiter",
+             "https://www.careershift.com/App/Contacts/SearchDetails?id=1", True),
+        ])
+        page.evaluate.assert_called_once_with(_READ_CARDS_JS)
+        self.assertIn(":not([data-stale])", _READ_CARDS_JS)
+
+    def test_read_cards_empty_page(self):
+        from careershift.search import read_cards
+        page = MagicMock()
+        page.evaluate.return_value = []
+        self.assertEqual(read_cards(page), [])
+
+    def test_wait_for_results_ignores_stale_cards(self):
+        from careershift.utils import wait_for_results
+        page = MagicMock()
+        self.assertTrue(wait_for_results(page))
+        selector = page.wait_for_selector.call_args[0][0]
+        self.assertIn(":not([data-stale])", selector)
+
+
 # ─────────────────────────────────────────
 # TEST: normalize()
 # ─────────────────────────────────────────
@@ -611,6 +699,23 @@ class TestDBIntegration(unittest.TestCase):
         result = db_module.get_existing_domain_for_company("Stripe")
         self.assertEqual(result, "stripe")  # root only, not "stripe.com"
 
+    def test_link_recruiters_to_applications_respects_cap(self):
+        from config import MAX_RECRUITERS_PER_APPLICATION
+        app1, _ = db_module.add_application("Stripe", "https://stripe.com/jobs/1", "SWE")
+        app2, _ = db_module.add_application("Stripe", "https://stripe.com/jobs/2", "SWE")
+        rids = [
+            db_module.add_recruiter("Stripe", "R", "Recruiter", f"r{i}@stripe.com", "auto")
+            for i in range(MAX_RECRUITERS_PER_APPLICATION + 1)
+        ]
+        db_module.link_recruiter_to_application(app1, rids[0])
+        linked = db_module.link_recruiters_to_applications([app1, app2], rids)
+        expected = rids[:MAX_RECRUITERS_PER_APPLICATION]
+        self.assertEqual(linked, [(app1, r) for r in expected] + [(app2, r) for r in expected])
+        for app_id in (app1, app2):
+            got = [r["id"] for r in db_module.get_recruiters_for_application(app_id)]
+            self.assertCountEqual(got, expected)
+        self.assertEqual(db_module.link_recruiters_to_applications([], rids), [])
+
 
 # ─────────────────────────────────────────
 # TEST: scrape_company() — mocked
@@ -641,7 +746,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         return page
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -667,7 +772,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result, [])
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -699,7 +804,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertIn("jane@collective.com", emails)
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -729,7 +834,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result[0]["email"], "john@collective.com")
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=0)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -751,7 +856,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         mock_visit.assert_not_called()
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -780,7 +885,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(mock_visit.call_count, 1)
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -810,7 +915,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result[0]["email"], "john@collective.com")
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -838,7 +943,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result, [])
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -874,7 +979,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertIsNone(result)  # None = skip, not exhaust
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company",
@@ -905,7 +1010,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result, [])
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company",
@@ -936,7 +1041,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(result[0]["email"], "john@collective.com")
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)
@@ -970,7 +1075,7 @@ class TestScrapeCompanyValidation(unittest.TestCase):
         self.assertEqual(len(result), 3)
 
     @patch("careershift.scraper.submit_search", return_value=True)
-    @patch("careershift.scraper.parse_cards_from_html")
+    @patch("careershift.scraper.read_cards")
     @patch("careershift.scraper.visit_and_extract")
     @patch("careershift.scraper.get_remaining_quota", return_value=10)
     @patch("careershift.scraper.get_existing_domain_for_company", return_value=None)